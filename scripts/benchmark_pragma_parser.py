@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Microbenchmark for finding pylint pragmas in a large corpus of comments."""
+
+import argparse
+import functools
+import re
+import sys
+import timeit
+from pathlib import Path
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from pylint_ruff_sync.pragma_locator import comment_columns, find_pragma
+
+# Commented lines cycled through to build the corpus
+SAMPLE_LINES = (
+    "x = eval('1')  # pylint: disable=eval-used",
+    "foo(bar)  # pylint: disable=missing-function-docstring,unused-argument",
+    "import os  # noqa: F401  # pylint: disable=unused-import",
+    "# pylint: disable-next=invalid-name",
+    'color = "#fff"  # pylint: disable=invalid-name',
+    "value = compute()  # cache the result",
+    "# pylint: enable=W0613",
+    "# pylint: skip-file",
+    "items = ['#', \"#\"]  # type: ignore[misc]",
+    "# A plain comment without any pragma",
+)
+
+# The per-line patterns the cleaner tried in order before the merged parser
+_LEGACY_PATTERNS = (
+    re.compile(r"^(.*?)\s*#\s*(.*)?\s*pylint:\s*disable=([a-zA-Z0-9_,-]+)\s*(.*?)$"),
+    re.compile(
+        r"^(.*?)\s*#\s*(.*)?\s*pylint:\s*disable=([A-Z]\d+(?:,[A-Z]\d+)*)\s*(.*?)$"
+    ),
+    re.compile(r"^(.*?)\s*#\s*(.*?)\s*pylint:\s*disable=([a-zA-Z0-9_,-]+)\s*(.*?)$"),
+    re.compile(r"^#\s*pylint:\s*skip-file\s*(.*)$"),
+    re.compile(r"^(.*?)\s*#\s*(.*?)\s*pylint:\s*disable=([a-zA-Z0-9_,\s-]+)\s*(.*?)$"),
+)
+
+
+def _corpus(*, count: int) -> list[str]:
+    """Build a corpus of commented source lines.
+
+    Args:
+        count: Number of lines.
+
+    Returns:
+        Lines cycling through the sample lines.
+
+    """
+    return [SAMPLE_LINES[i % len(SAMPLE_LINES)] for i in range(count)]
+
+
+def _parse_legacy(*, lines: list[str]) -> int:
+    """Match each line against the legacy patterns until one matches.
+
+    Args:
+        lines: Lines to parse.
+
+    Returns:
+        Number of lines with a match.
+
+    """
+    found = 0
+    for line in lines:
+        for pattern in _LEGACY_PATTERNS:
+            if pattern.match(line):
+                found += 1
+                break
+    return found
+
+
+def _parse_merged(*, lines: list[str]) -> int:
+    """Find the pragma on each line with the merged, string-aware parser.
+
+    Args:
+        lines: Lines to parse.
+
+    Returns:
+        Number of lines with a pragma.
+
+    """
+    return sum(find_pragma(line=line) is not None for line in lines)
+
+
+def _parse_tokenized(*, lines: list[str]) -> int:
+    """Locate comments with the tokenizer, then parse pragmas in them.
+
+    Args:
+        lines: Lines to parse, tokenized together as one module.
+
+    Returns:
+        Number of lines with a pragma.
+
+    """
+    columns = comment_columns(content="\n".join(lines) + "\n") or {}
+    return sum(
+        find_pragma(comment_start=column, line=lines[line_number - 1]) is not None
+        for line_number, column in columns.items()
+    )
+
+
+def main() -> int:
+    """Run the benchmark and report the best time of each parsing strategy.
+
+    Returns:
+        Exit code (always 0).
+
+    """
+    parser = argparse.ArgumentParser(description="Benchmark pragma parsing")
+    parser.add_argument("--count", default=1000000, help="Number of lines", type=int)
+    parser.add_argument("--repeat", default=3, help="Repetitions", type=int)
+    args = parser.parse_args()
+
+    lines = _corpus(count=args.count)
+    strategies = {
+        "five legacy patterns": _parse_legacy,
+        "merged pattern, line scan": _parse_merged,
+        "merged pattern, tokenizer": _parse_tokenized,
+    }
+
+    sys.stdout.write(f"Parsing {args.count} commented lines\n")
+    for label, strategy in strategies.items():
+        found = strategy(lines=lines)
+        best = min(
+            timeit.repeat(
+                functools.partial(strategy, lines=lines),
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        sys.stdout.write(f"  {label:<30} {best * 1000:10.2f} ms  ({found} pragmas)\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Microbenchmark for loading a large synthetic rule set into Rules."""
+
+import argparse
+import functools
+import sys
+import timeit
+from pathlib import Path
+
+# Add src directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from pylint_ruff_sync.rule import Rule, Rules
+
+
+def _synthetic_rules(*, count: int) -> list[Rule]:
+    """Create rules with unique IDs in a scrambled, reproducible order.
+
+    Args:
+        count: Number of rules to create.
+
+    Returns:
+        List of synthetic Rule objects.
+
+    """
+    # Stepping by a large prime visits every index once in a scattered order
+    order = [(i * 7919) % count for i in range(count)]
+    return [
+        Rule(pylint_id=f"{'CEFIRW'[i % 6]}{i:05d}", pylint_name=f"rule-{i}")
+        for i in order
+    ]
+
+
+def _load_resort_each(*, synthetic: list[Rule]) -> None:
+    """Load rules the way add_rule used to: append, then sort the whole list.
+
+    Args:
+        synthetic: Rules to load.
+
+    """
+    rules = Rules()
+    for rule in synthetic:
+        rules.rules.append(rule)
+        rules.rules.sort(key=lambda r: r.pylint_id)
+    rules.reindex()
+
+
+def _load_add_rule(*, synthetic: list[Rule]) -> None:
+    """Load rules one at a time with add_rule.
+
+    Args:
+        synthetic: Rules to load.
+
+    """
+    rules = Rules()
+    for rule in synthetic:
+        rules.add_rule(rule=rule)
+
+
+def _load_extend(*, synthetic: list[Rule]) -> None:
+    """Load rules in bulk with extend.
+
+    Args:
+        synthetic: Rules to load.
+
+    """
+    rules = Rules()
+    rules.extend(new_rules=synthetic)
+
+
+def main() -> int:
+    """Run the benchmark and report the best time of each loading strategy.
+
+    Returns:
+        Exit code (always 0).
+
+    """
+    parser = argparse.ArgumentParser(description="Benchmark Rules loading")
+    parser.add_argument("--count", default=5000, help="Number of rules", type=int)
+    parser.add_argument("--repeat", default=3, help="Repetitions", type=int)
+    args = parser.parse_args()
+
+    synthetic = _synthetic_rules(count=args.count)
+    strategies = {
+        "append + full sort per rule": _load_resort_each,
+        "add_rule (bisect insert)": _load_add_rule,
+        "extend (single sort)": _load_extend,
+    }
+
+    sys.stdout.write(f"Loading {args.count} synthetic rules\n")
+    for label, strategy in strategies.items():
+        best = min(
+            timeit.repeat(
+                functools.partial(strategy, synthetic=synthetic),
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        sys.stdout.write(f"  {label:<30} {best * 1000:10.2f} ms\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""Atomic, change-aware file writes.
+
+Files are replaced through a temporary file in the same directory and an
+atomic rename, so concurrent readers see either the old or the new content,
+never a partial write. Writes whose bytes match the file on disk are skipped,
+leaving the modification time untouched for watchers and build caches.
+Symlinks are followed, and a file with other hard links is rewritten in place
+so that all of its names keep sharing the new content.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import stat
+import tempfile
+from pathlib import Path
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+def _current_umask() -> int:
+    """Read the process umask.
+
+    The umask can only be read by setting it, so this briefly changes it for
+    the whole process and must not run while other threads create files.
+
+    Returns:
+        The process umask.
+
+    """
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Permission bits open() gives a newly created file, read once at import
+NEW_FILE_MODE = 0o666 & ~_current_umask()
+
+
+def atomic_write_bytes(*, data: bytes, path: Path) -> None:
+    """Replace a file's content atomically.
+
+    The data is written and flushed to a temporary file next to the file a
+    symlink at path points to, which is then renamed over it. An existing
+    file's permission bits are kept, as are its owner and group where the
+    process is allowed to set them; a new file gets the usual permissions for
+    the umask. A file with other hard links is written in place instead,
+    which is not atomic but keeps the links intact.
+
+    Args:
+        data: Bytes to write.
+        path: File to create or replace.
+
+    Raises:
+        OSError: If the temporary file cannot be written or renamed.
+
+    """
+    path = path.resolve()
+    try:
+        status: os.stat_result | None = path.stat()
+    except FileNotFoundError:
+        status = None
+
+    if status is not None and status.st_nlink > 1:
+        logger.debug("Writing %s in place to keep its hard links", path)
+        with path.open("r+b") as file:
+            file.write(data)
+            file.truncate()
+            file.flush()
+            os.fsync(file.fileno())
+        return
+
+    fd, temp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as temp_file:
+            temp_file.write(data)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+            if status is not None:
+                _copy_owner(fd=temp_file.fileno(), status=status)
+        temp_path = Path(temp_name)
+        temp_path.chmod(
+            NEW_FILE_MODE if status is None else stat.S_IMODE(status.st_mode)
+        )
+        temp_path.replace(path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            Path(temp_name).unlink()
+        raise
+
+
+def _copy_owner(*, fd: int, status: os.stat_result) -> None:
+    """Give a replacement file the owner and group of the file it replaces.
+
+    Only privileged processes can change the owner, so the group alone is
+    tried next; whatever cannot be set is left as created.
+
+    Args:
+        fd: Open descriptor of the replacement file.
+        status: Status of the file being replaced.
+
+    """
+    if not hasattr(os, "fchown"):
+        return
+    for uid in (status.st_uid, -1):
+        with contextlib.suppress(OSError):
+            os.fchown(fd, uid, status.st_gid)
+            return
+
+
+def write_text_if_changed(*, content: str, path: Path) -> bool:
+    """Write text atomically unless the file already holds the same bytes.
+
+    The content is encoded as UTF-8 and written without newline translation.
+
+    Args:
+        content: Text to write.
+        path: File to create or replace.
+
+    Returns:
+        True if the file was written, False if it was already up to date.
+
+    """
+    data = content.encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            logger.debug("Content of %s is unchanged, not writing", path)
+            return False
+    except FileNotFoundError:
+        pass
+
+    atomic_write_bytes(data=data, path=path)
+    return True
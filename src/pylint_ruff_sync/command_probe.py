@@ -0,0 +1,42 @@
+"""Memoized availability probes for external command-line tools."""
+
+from __future__ import annotations
+
+import functools
+import logging
+import subprocess
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for a single probe before treating the tool as unavailable
+PROBE_TIMEOUT = 10
+
+
+@functools.cache
+def probe_command(*, command: tuple[str, ...]) -> bool:
+    """Check whether a command runs successfully.
+
+    Results are memoized for the life of the process, so each external tool is
+    probed at most once per command line.
+
+    Args:
+        command: Command and arguments to run.
+
+    Returns:
+        True if the command exits with status 0, False otherwise.
+
+    """
+    try:
+        result = subprocess.run(  # noqa: S603
+            command,
+            capture_output=True,
+            check=False,
+            text=True,
+            timeout=PROBE_TIMEOUT,
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        logger.debug("Probe failed to run: %s", " ".join(command))
+        return False
+    else:
+        return not result.returncode
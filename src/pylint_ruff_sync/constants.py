@@ -11,6 +11,13 @@ RUFF_PYLINT_ISSUE_URL = (
     f"https://github.com/{RUFF_REPO}/issues/{RUFF_PYLINT_ISSUE_NUMBER}"
 )
 
+# Rules.metadata key recording when the ruff issue was last updated
+RUFF_ISSUE_UPDATED_AT_METADATA = "ruff_issue_updated_at"
+
+# Commands used to probe for the external tools needed to collect fresh rules
+GH_AUTH_STATUS_COMMAND: Final[tuple[str, ...]] = ("gh", "auth", "status")
+PYLINT_VERSION_COMMAND: Final[tuple[str, ...]] = ("pylint", "--version")
+
 # Pylint rules that overlap with mypy functionality
 # Based on antonagestam/pylint-mypy-overlap analysis
 # The rule list is based on research from:
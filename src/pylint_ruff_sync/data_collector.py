@@ -4,15 +4,26 @@ from __future__ import annotations
 
 import logging
 import subprocess
-from dataclasses import dataclass
+import tomllib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
+from pylint_ruff_sync.command_probe import probe_command
+from pylint_ruff_sync.constants import GH_AUTH_STATUS_COMMAND, PYLINT_VERSION_COMMAND
 from pylint_ruff_sync.mypy_overlap import MypyOverlapExtractor
 from pylint_ruff_sync.pylint_extractor import PylintExtractor
+from pylint_ruff_sync.pylint_rules_cache import (
+    PylintCacheKey,
+    PylintRulesCache,
+    user_cache_dir,
+)
 from pylint_ruff_sync.ruff_pylint_extractor import RuffPylintExtractor
 from pylint_ruff_sync.rule import Rules
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from pylint_ruff_sync.rules_cache_manager import RulesCacheManager
 
 # Configure logging
@@ -25,68 +36,93 @@ class DataCollector:
 
     Attributes:
         cache_manager: Cache manager for Rules serialization/deserialization.
+        config_file: Optional pylint configuration file used to find plugins.
+        pylint_cache: Persistent cache of extracted pylint rules.
 
     """
 
     cache_manager: RulesCacheManager
+    config_file: Path | None = None
+    pylint_cache: PylintRulesCache = field(
+        default_factory=lambda: PylintRulesCache(cache_dir=user_cache_dir())
+    )
 
     def _is_github_cli_available(self) -> bool:
         """Check if GitHub CLI is available and working.
 
+        The probe result is shared for the life of the process.
+
         Returns:
             True if gh CLI is available and authenticated, False otherwise.
 
         """
-        try:
-            result = subprocess.run(
-                ["gh", "auth", "status"],  # noqa: S607
-                capture_output=True,
-                check=False,
-                text=True,
-                timeout=10,
-            )
-        except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        available = probe_command(command=GH_AUTH_STATUS_COMMAND)
+        if not available:
             logger.debug("GitHub CLI not available or not authenticated")
-            return False
-        else:
-            return not result.returncode
+        return available
 
     def _is_pylint_available(self) -> bool:
         """Check if pylint is available.
 
+        The probe result is shared for the life of the process.
+
         Returns:
             True if pylint is available, False otherwise.
 
         """
-        try:
-            result = subprocess.run(
-                ["pylint", "--version"],  # noqa: S607
-                capture_output=True,
-                check=False,
-                text=True,
-                timeout=10,
-            )
-        except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        available = probe_command(command=PYLINT_VERSION_COMMAND)
+        if not available:
             logger.debug("Pylint not available")
-            return False
-        else:
-            return not result.returncode
+        return available
 
     def _is_online_capable(self) -> bool:
         """Check if we have the capabilities to fetch fresh data online.
 
+        The GitHub CLI and pylint probes run concurrently.
+
         Returns:
             True if both GitHub CLI and pylint are available, False otherwise.
 
         """
-        gh_available = self._is_github_cli_available()
-        pylint_available = self._is_pylint_available()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            gh_future = executor.submit(self._is_github_cli_available)
+            pylint_future = executor.submit(self._is_pylint_available)
+            gh_available = gh_future.result()
+            pylint_available = pylint_future.result()
 
         logger.debug("GitHub CLI available: %s", gh_available)
         logger.debug("Pylint available: %s", pylint_available)
 
         return gh_available and pylint_available
 
+    def _configured_plugins(self) -> tuple[str, ...]:
+        """Read the pylint plugins configured in the config file.
+
+        Returns:
+            Plugin module names from load-plugins, or an empty tuple.
+
+        """
+        if self.config_file is None or not self.config_file.exists():
+            return ()
+
+        try:
+            with self.config_file.open("rb") as f:
+                data = tomllib.load(f)
+        except (OSError, tomllib.TOMLDecodeError) as e:
+            logger.debug("Failed to read plugins from %s: %s", self.config_file, e)
+            return ()
+
+        pylint_config = data.get("tool", {}).get("pylint", {})
+        for section_name in ("main", "MAIN", "master", "MASTER"):
+            load_plugins = pylint_config.get(section_name, {}).get("load-plugins")
+            if load_plugins:
+                if isinstance(load_plugins, str):
+                    load_plugins = load_plugins.split(",")
+                return tuple(
+                    plugin.strip() for plugin in load_plugins if plugin.strip()
+                )
+        return ()
+
     def collect_fresh_rules(self) -> Rules:
         """Collect fresh rules from pylint and ruff extractors.
 
@@ -98,15 +134,17 @@ class DataCollector:
 
         # Step 1: Initialize empty Rules object
         rules = Rules()
+        ruff_extractor = RuffPylintExtractor(rules=rules)
 
-        # Step 2: Extract all pylint rules
-        pylint_extractor = PylintExtractor(rules=rules)
-        pylint_extractor.extract()
-        logger.info("Found %d total pylint rules", len(rules))
+        # Step 2: Fetch the ruff issue in the background while pylint rules are
+        # extracted; the two are independent until they are merged
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            ruff_future = executor.submit(ruff_extractor.get_all_ruff_rules)
+            self._collect_pylint_rules(rules=rules)
+            ruff_rules = ruff_future.result()
 
         # Step 3: Update with ruff implementation data
-        ruff_extractor = RuffPylintExtractor(rules=rules)
-        ruff_extractor.extract()
+        ruff_extractor.extract(ruff_rules=ruff_rules)
 
         ruff_implemented_count = len(rules.filter_implemented_in_ruff())
         logger.info("Found %d rules implemented in ruff", ruff_implemented_count)
@@ -117,6 +155,34 @@ class DataCollector:
 
         return rules
 
+    def _collect_pylint_rules(self, *, rules: Rules) -> None:
+        """Add all pylint rules to a Rules object.
+
+        Reuses a previous extraction for the same pylint version, Python
+        version, plugin set and plugin versions when one is cached. Rules read
+        with 'pylint --list-msgs' after pylint failed to load in-process are
+        not cached, so a transient plugin failure is not remembered.
+
+        Args:
+            rules: Rules object to populate.
+
+        """
+        plugins = self._configured_plugins()
+        cache_key = PylintCacheKey.current(plugins=plugins)
+        cached_rules = (
+            self.pylint_cache.load(key=cache_key) if cache_key is not None else None
+        )
+        if cached_rules is not None:
+            rules.extend(new_rules=cached_rules)
+        else:
+            pylint_extractor = PylintExtractor(plugins=plugins, rules=rules)
+            pylint_extractor.extract()
+            if pylint_extractor.degraded:
+                logger.debug("Not caching pylint rules from a degraded extraction")
+            elif cache_key is not None:
+                self.pylint_cache.save(key=cache_key, rules=rules)
+        logger.info("Found %d total pylint rules", len(rules))
+
     def _load_rules_from_cache(self) -> Rules:
         """Load rules from cache using cache manager.
 
@@ -0,0 +1,66 @@
+"""Resolving which pylint messages a configuration file enables."""
+
+from __future__ import annotations
+
+import logging
+import re
+import subprocess
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Title of the section of 'pylint --list-msgs-enabled' listing enabled messages
+ENABLED_SECTION_TITLE = "Enabled messages:"
+
+# Message entry in 'pylint --list-msgs-enabled', e.g. "  unused-import (W0611)"
+LISTED_MESSAGE_PATTERN = re.compile(r"^\s+(?P<name>[\w-]+) \((?P<code>[A-Z]\d+)\)$")
+
+
+def enabled_messages(*, config_file: Path, cwd: Path) -> set[str] | None:
+    """Ask pylint which messages a configuration file enables.
+
+    Pylint resolves the configuration itself, so categories, checker names,
+    plugins and messages that are disabled by default are handled exactly as
+    in a lint run with the same configuration.
+
+    Args:
+        config_file: Pylint configuration file.
+        cwd: Directory to run pylint in.
+
+    Returns:
+        Names and ids of the enabled messages, or None if pylint failed.
+
+    """
+    try:
+        result = subprocess.run(  # noqa: S603
+            [  # noqa: S607
+                "python",
+                "-m",
+                "pylint",
+                "--rcfile",
+                str(config_file),
+                "--list-msgs-enabled",
+            ],
+            capture_output=True,
+            check=True,
+            cwd=cwd,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError) as e:
+        logger.warning("Failed to list the messages pylint enables: %s", e)
+        return None
+
+    enabled: set[str] = set()
+    in_enabled_section = False
+    for line in result.stdout.splitlines():
+        if not line.startswith(" "):
+            in_enabled_section = line == ENABLED_SECTION_TITLE
+            continue
+        match = LISTED_MESSAGE_PATTERN.match(line)
+        if in_enabled_section and match:
+            enabled.update(match.group("name", "code"))
+    return enabled
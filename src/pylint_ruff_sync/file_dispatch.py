@@ -0,0 +1,142 @@
+"""Listing files with git and dispatching them in command-line-sized batches.
+
+File lists are read from git as NUL-separated output, so every file name is
+handled without quoting or shell expansion. Commands that take many file
+arguments are split into batches that fit the operating system's limit on
+the size of a command line.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import struct
+import subprocess
+import sys
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+    from pathlib import Path
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Argument space assumed when the OS does not report its limit
+DEFAULT_ARG_MAX = 131072
+
+# Maximum length of a command line on Windows, in characters
+WINDOWS_COMMAND_LINE_LIMIT = 32767
+
+# Bytes of argument space kept free for anything the estimate misses
+COMMAND_LINE_HEADROOM = 4096
+
+# Bytes each argument or environment entry takes besides its text: the
+# terminating NUL and its argv/envp pointer (or separator and quotes)
+ARGUMENT_OVERHEAD = 1 + struct.calcsize("P")
+
+_T = TypeVar("_T")
+
+
+def git_python_files(*, args: Sequence[str], cwd: Path) -> list[Path]:
+    """List Python files with a git command that prints NUL-separated paths.
+
+    Args:
+        args: Git subcommand and options, including -z, that print paths
+            relative to cwd.
+        cwd: Directory to run git in.
+
+    Returns:
+        Paths of the listed Python files, or an empty list if git fails.
+
+    """
+    try:
+        result = subprocess.run(  # noqa: S603
+            ["git", *args, "--", "*.py"],  # noqa: S607
+            capture_output=True,
+            check=True,
+            cwd=cwd,
+            # Decode paths the way os.fsdecode does, so none are lost
+            encoding=sys.getfilesystemencoding(),
+            errors=sys.getfilesystemencodeerrors(),
+        )
+    except subprocess.CalledProcessError as e:
+        logger.warning("Failed to list Python files with git: %s", e.stderr.strip())
+        return []
+    except OSError as e:
+        logger.warning("Failed to list Python files with git: %s", e)
+        return []
+
+    return [cwd / name for name in result.stdout.split("\0") if name]
+
+
+def command_line_limit() -> int:
+    """Return the argument space available to a new process.
+
+    On POSIX systems this is ARG_MAX less the space taken by the current
+    environment, which the child inherits. Windows limits the length of the
+    whole command line instead.
+
+    Returns:
+        Bytes available for a command and its arguments.
+
+    """
+    if sys.platform == "win32":
+        return WINDOWS_COMMAND_LINE_LIMIT - COMMAND_LINE_HEADROOM
+
+    try:
+        arg_max = os.sysconf("SC_ARG_MAX")
+    except (OSError, ValueError):
+        arg_max = -1
+    if arg_max <= 0:
+        arg_max = DEFAULT_ARG_MAX
+
+    environment = command_length(
+        args=[f"{name}={value}" for name, value in os.environ.items()]
+    )
+    return max(arg_max - environment - COMMAND_LINE_HEADROOM, 0)
+
+
+def command_length(*, args: Iterable[str]) -> int:
+    """Estimate the argument space a list of arguments takes.
+
+    Args:
+        args: Command and arguments.
+
+    Returns:
+        Encoded length of the arguments plus their per-argument overhead.
+
+    """
+    return sum(len(os.fsencode(arg)) + ARGUMENT_OVERHEAD for arg in args)
+
+
+def split_batches(
+    *, items: Sequence[_T], limit: int, to_argument: Callable[[_T], str]
+) -> list[list[_T]]:
+    """Split items into consecutive batches whose arguments fit a limit.
+
+    An item whose argument alone exceeds the limit gets a batch of its own.
+
+    Args:
+        items: Items to split, in order.
+        limit: Argument space available to each batch.
+        to_argument: Converts an item to its command-line argument.
+
+    Returns:
+        Non-empty batches, keeping the items' original order.
+
+    """
+    batches: list[list[_T]] = []
+    batch: list[_T] = []
+    used = 0
+    for item in items:
+        length = command_length(args=[to_argument(item)])
+        if batch and used + length > limit:
+            batches.append(batch)
+            batch = []
+            used = 0
+        batch.append(item)
+        used += length
+    if batch:
+        batches.append(batch)
+    return batches
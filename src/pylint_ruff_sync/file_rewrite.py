@@ -0,0 +1,109 @@
+"""Rewriting files in a bounded thread pool with per-file timings.
+
+Rewriting a file is dominated by I/O latency: reading it, and writing and
+syncing its replacement before the atomic rename. That latency adds up over
+large change sets and network filesystems, so files are rewritten by a small
+pool of threads. Jobs are submitted as they arrive, which lets rewrites
+overlap with whatever produces them, and at most a few jobs per thread wait
+in the pool at a time.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from pathlib import Path
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Threads rewriting files at once; the work is dominated by file I/O
+REWRITE_MAX_WORKERS = 8
+
+# Jobs allowed to wait in the pool per thread before submission blocks
+REWRITE_QUEUE_FACTOR = 2
+
+_T = TypeVar("_T")
+
+
+@dataclass(frozen=True)
+class RewriteResult:
+    """Outcome of rewriting one file.
+
+    Attributes:
+        file_path: File that was rewritten.
+        modified_lines: Number of lines modified, or None if the file was
+            left unchanged.
+        seconds: Wall-clock time the rewrite took.
+
+    """
+
+    file_path: Path
+    modified_lines: int | None
+    seconds: float
+
+
+def rewrite_files(
+    *,
+    jobs: Iterable[tuple[Path, _T]],
+    rewrite: Callable[[Path, _T], int | None],
+    max_workers: int = REWRITE_MAX_WORKERS,
+) -> Iterator[RewriteResult]:
+    """Rewrite files in a thread pool as their jobs arrive.
+
+    Args:
+        jobs: Files to rewrite, each with the data its rewrite needs.
+        rewrite: Rewrites one file, returning the number of lines modified
+            or None if the file was left unchanged. It is called from pool
+            threads, so it must be safe to run concurrently for different
+            files.
+        max_workers: Maximum number of files rewritten at once.
+
+    Yields:
+        RewriteResult: Outcome of each job, in order of completion.
+
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: set[Future[RewriteResult]] = set()
+        for file_path, data in jobs:
+            if len(pending) >= max_workers * REWRITE_QUEUE_FACTOR:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from (future.result() for future in done)
+            pending.add(
+                executor.submit(
+                    _timed_rewrite, data=data, file_path=file_path, rewrite=rewrite
+                )
+            )
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            yield from (future.result() for future in done)
+
+
+def _timed_rewrite(
+    *, data: _T, file_path: Path, rewrite: Callable[[Path, _T], int | None]
+) -> RewriteResult:
+    """Rewrite one file and time it.
+
+    Args:
+        data: Data the rewrite needs.
+        file_path: File to rewrite.
+        rewrite: Rewrites one file.
+
+    Returns:
+        Outcome of the rewrite.
+
+    """
+    start = time.perf_counter()
+    modified_lines = rewrite(file_path, data)
+    seconds = time.perf_counter() - start
+    logger.debug("Rewrote %s in %.3f s", file_path, seconds)
+    return RewriteResult(
+        file_path=file_path, modified_lines=modified_lines, seconds=seconds
+    )
@@ -13,6 +13,7 @@ from .message_generator import MessageGenerator
 from .pylint_cleaner import PylintCleaner
 from .pyproject_updater import PyprojectUpdater, RuleFormat
 from .rules_cache_manager import RulesCacheManager
+from .toml_file import TOML_SORT_BACKENDS
 
 if TYPE_CHECKING:
     from .rule import Rules
@@ -44,7 +45,10 @@ class Application:
 
         self.cache_path = cache_path
         self._cache_manager = RulesCacheManager(cache_path=self.cache_path)
-        self._data_collector = DataCollector(cache_manager=self._cache_manager)
+        self._data_collector = DataCollector(
+            cache_manager=self._cache_manager,
+            config_file=args.config_file,
+        )
         self._rules: Rules | None = None
         self._message_generator: MessageGenerator | None = None
 
@@ -128,6 +132,7 @@ class Application:
         dry_run: bool = False,
         rule_comment: str = "doc_url",
         rule_format: str = "code",
+        toml_sort_backend: str = "library",
     ) -> PyprojectUpdater:
         """Create a PyprojectUpdater with the application's rules.
 
@@ -136,6 +141,7 @@ class Application:
             dry_run: Whether to run in dry-run mode.
             rule_comment: Type of comment to add next to enabled rules.
             rule_format: Format for rule identifiers in disable/enable lists.
+            toml_sort_backend: How to run toml-sort (library or subprocess).
 
         Returns:
             PyprojectUpdater instance.
@@ -155,6 +161,7 @@ class Application:
             message_generator=message_generator,
             rule_format=rule_format_config,
             rules=rules,
+            toml_sort_backend=toml_sort_backend,
         )
 
     def run(self) -> int:
@@ -181,6 +188,7 @@ class Application:
                 dry_run=self.args.dry_run,
                 rule_comment=self.args.rule_comment,
                 rule_format=self.args.rule_format,
+                toml_sort_backend=self.args.toml_sort_backend,
             )
             updater.update(disable_mypy_overlap=self.args.disable_mypy_overlap)
 
@@ -189,10 +197,15 @@ class Application:
                 project_root = self.args.config_file.parent
                 rules = self.rules
                 cleaner = PylintCleaner(
+                    cache=self.args.cleaner_cache,
                     config_file=self.args.config_file,
                     dry_run=self.args.dry_run,
+                    files=self.args.files or None,
+                    jobs=self.args.cleaner_jobs,
                     project_root=project_root,
                     rules=rules,
+                    since=self.args.cleaner_since,
+                    targeted=self.args.cleaner_targeted,
                 )
                 cleaner.run()
             else:
@@ -254,10 +267,21 @@ Examples:
 
   # Use rule names with no comments
   pylint-ruff-sync --rule-format=name --rule-comment=none
+
+  # Only clean pylint comments in files changed since main
+  pylint-ruff-sync --cleaner-since main
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
 
+    parser.add_argument(
+        "files",
+        help="Only clean these files, e.g. as passed by pre-commit (default: all)",
+        metavar="FILE",
+        nargs="*",
+        type=Path,
+    )
+
     parser.add_argument(
         "--config-file",
         default=Path("pyproject.toml"),
@@ -301,6 +325,39 @@ Examples:
         help="Disable the pylint cleaner functionality",
     )
 
+    parser.add_argument(
+        "--cleaner-jobs",
+        help="Number of pylint processes the cleaner runs at once (default: CPUs)",
+        type=int,
+    )
+
+    parser.add_argument(
+        "--cleaner-cache",
+        action="store_true",
+        help=(
+            "Reuse pylint results for files unchanged since an earlier run; "
+            "changes in imported modules are not detected"
+        ),
+    )
+
+    parser.add_argument(
+        "--cleaner-since",
+        help=(
+            "Only clean Python files changed since the merge base with this git "
+            "ref, including staged and unstaged changes"
+        ),
+        metavar="REF",
+    )
+
+    parser.add_argument(
+        "--cleaner-targeted",
+        action="store_true",
+        help=(
+            "Run the pylint cleaner with only the rules referenced in pylint "
+            "pragmas enabled"
+        ),
+    )
+
     parser.add_argument(
         "--rule-comment",
         choices=["code", "doc_url", "name", "none", "short_description"],
@@ -315,6 +372,13 @@ Examples:
         help="Rule identifier format: code or name (default: %(default)s)",
     )
 
+    parser.add_argument(
+        "--toml-sort-backend",
+        choices=list(TOML_SORT_BACKENDS),
+        default="library",
+        help="Run toml-sort through its Python API or CLI (default: %(default)s)",
+    )
+
     return parser
 
 
@@ -0,0 +1,231 @@
+"""Locating pylint pragmas in the comments of Python source lines.
+
+A single regex recognizes every pragma the cleaner handles (disable,
+disable-next, enable and skip-file), and it is only applied to the comment
+part of a line. Comments are found with a string-aware scan of the line, so a
+"#" inside a string literal is not taken for the start of a comment. Lines
+that start inside a multiline string need the tokenizer, which is slower and
+needs the whole file, so it is used as a fallback.
+"""
+
+from __future__ import annotations
+
+import io
+import re
+import tokenize
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Set as AbstractSet
+
+# One pylint pragma: a skip-file, or a message control with its rule list.
+# A trailing separator, which pylint accepts, belongs to the pragma.
+PRAGMA_PATTERN = re.compile(
+    r"\bpylint:[ \t]*(?:"
+    r"(?P<skip>skip-file)"
+    r"|(?P<kind>disable-next|disable|enable)[ \t]*=[ \t]*"
+    r"(?P<rules>[\w-]+(?:[ \t]*,[ \t]*[\w-]+)*)(?:[ \t]*,)?"
+    r")"
+)
+
+# Code up to the first comment: text outside strings, and string literals
+# (with any prefix consumed as code). Unterminated strings run to the end.
+_CODE = re.compile(
+    r"""
+    (?:
+        [^\x22\x27\#]+
+      | \x22{3} (?:[^\x22\\]|\\.|\x22(?!\x22\x22))* (?:\x22{3}|\Z)
+      | \x27{3} (?:[^\x27\\]|\\.|\x27(?!\x27\x27))* (?:\x27{3}|\Z)
+      | \x22 (?:[^\x22\\\n]|\\.)* (?:\x22|\Z)
+      | \x27 (?:[^\x27\\\n]|\\.)* (?:\x27|\Z)
+    )*
+    """,
+    re.DOTALL | re.VERBOSE,
+)
+
+
+@dataclass(frozen=True)
+class Pragma:
+    """A pylint pragma found in a line of source.
+
+    Attributes:
+        comment_start: Offset of the "#" starting the comment holding it.
+        end: Offset just past the pragma.
+        kind: "disable", "disable-next", "enable" or "skip-file".
+        rules: Rule names or ids the pragma lists, empty for skip-file.
+        start: Offset of the pragma's "pylint:".
+
+    """
+
+    comment_start: int
+    end: int
+    kind: str
+    rules: tuple[str, ...]
+    start: int
+
+
+def comment_columns(*, content: str) -> dict[int, int] | None:
+    """Find the column where the comment on each line starts.
+
+    Args:
+        content: Python source code.
+
+    Returns:
+        Mapping of 1-based line numbers to comment start columns, for lines
+        with a comment, or None if the source cannot be tokenized.
+
+    """
+    columns: dict[int, int] = {}
+    try:
+        for token in tokenize.generate_tokens(io.StringIO(content).readline):
+            if token.type == tokenize.COMMENT:
+                columns[token.start[0]] = token.start[1]
+    except (SyntaxError, tokenize.TokenError):
+        return None
+    return columns
+
+
+def find_comment_start(*, line: str) -> int | None:
+    """Find the start of the comment on a single line of code.
+
+    The line is assumed not to start inside a multiline string.
+
+    Args:
+        line: Line of Python source.
+
+    Returns:
+        Offset of the "#" starting the comment, or None if there is none.
+
+    """
+    match = _CODE.match(line)
+    end = match.end() if match else 0
+    return end if end < len(line) else None
+
+
+def find_pragma(*, line: str, comment_start: int | None = None) -> Pragma | None:
+    """Find the first pylint pragma in the comment of a line.
+
+    Args:
+        line: Line of Python source.
+        comment_start: Offset of the line's comment, if known from the
+            tokenizer; otherwise the line is scanned for it.
+
+    Returns:
+        The pragma, or None if the line's comment holds no pragma.
+
+    """
+    if comment_start is None:
+        comment_start = find_comment_start(line=line)
+        if comment_start is None:
+            return None
+
+    match = PRAGMA_PATTERN.search(line, comment_start)
+    if match is None:
+        return None
+
+    if match.group("skip") is not None:
+        kind = "skip-file"
+        rules: tuple[str, ...] = ()
+    else:
+        kind = match.group("kind")
+        rules = tuple(rule.strip() for rule in match.group("rules").split(","))
+    return Pragma(
+        comment_start=comment_start,
+        end=match.end(),
+        kind=kind,
+        rules=rules,
+        start=match.start(),
+    )
+
+
+class PragmaLocator:
+    """Finds pylint pragmas on the lines of one file.
+
+    Lines are scanned on their own first. The file is tokenized only if a
+    line has no comment by that scan, since the line may start inside a
+    multiline string.
+    """
+
+    def __init__(self, *, content: str) -> None:
+        """Initialize the locator.
+
+        Args:
+            content: Python source code of the file.
+
+        """
+        self.content = content
+        self._columns: dict[int, int] | None = None
+        self._lines: list[str] | None = None
+
+    def find(self, *, line: str, line_number: int) -> Pragma | None:
+        """Find the first pylint pragma in the comment of a line.
+
+        Args:
+            line: Content of the line.
+            line_number: 1-based number of the line in the file.
+
+        Returns:
+            The pragma, or None if the line's comment holds no pragma.
+
+        """
+        pragma = find_pragma(line=line)
+        if pragma is not None:
+            return pragma
+
+        if self._columns is None:
+            self._columns = comment_columns(content=self.content) or {}
+        comment_start = self._columns.get(line_number)
+        if comment_start is None:
+            return None
+        return find_pragma(comment_start=comment_start, line=line)
+
+    def find_line(self, *, line_number: int) -> Pragma | None:
+        """Find the first pylint pragma on a line given only its number.
+
+        Args:
+            line_number: 1-based number of the line in the file.
+
+        Returns:
+            The pragma, or None if the line does not exist or its comment
+            holds no pragma.
+
+        """
+        if self._lines is None:
+            self._lines = self.content.splitlines()
+        if not 1 <= line_number <= len(self._lines):
+            return None
+        return self.find(line=self._lines[line_number - 1], line_number=line_number)
+
+    def suppression_line(self, *, line_number: int, rules: AbstractSet[str]) -> int:
+        """Find the line of the pragma a useless-suppression message is about.
+
+        Pylint reports a useless disable-next pragma on the line it applies
+        to, which is the line below the pragma.
+
+        Args:
+            line_number: 1-based line pylint reported the message on.
+            rules: Names and ids the reported rule may be listed under.
+
+        Returns:
+            The line above if it holds a disable-next pragma listing the rule
+            and the reported line holds no other pragma listing it, otherwise
+            line_number.
+
+        """
+        reported = self.find_line(line_number=line_number)
+        if (
+            reported is not None
+            and reported.kind != "disable-next"
+            and not rules.isdisjoint(reported.rules)
+        ):
+            return line_number
+
+        above = self.find_line(line_number=line_number - 1)
+        if (
+            above is not None
+            and above.kind == "disable-next"
+            and not rules.isdisjoint(above.rules)
+        ):
+            return line_number - 1
+        return line_number
@@ -2,24 +2,73 @@
 
 from __future__ import annotations
 
+import functools
+import heapq
 import logging
+import os
+import queue
 import re
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from .atomic_write import write_text_if_changed
+from .enabled_messages import enabled_messages
+from .file_dispatch import (
+    command_length,
+    command_line_limit,
+    git_python_files,
+    split_batches,
+)
+from .file_rewrite import rewrite_files
+from .pragma_locator import (
+    PRAGMA_PATTERN,
+    PragmaLocator,
+    find_comment_start,
+    find_pragma,
+)
+from .pylint_rules_cache import user_cache_dir
+from .suppression_cache import (
+    SUPPRESSION_CACHE_FILE,
+    SuppressionCache,
+    suppression_cache_context,
+)
+from .suppression_scan import filter_files_with_pragmas
+
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+
     from .rule import Rules
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Constants for regex group indices
-GROUP_BEFORE_PYLINT = 2
-GROUP_RULES_TEXT = 3
-GROUP_AFTER_PYLINT = 4
-MIN_GROUPS_FOR_DISABLE = 3
+# Seconds a single pylint shard may run before it is split and retried
+PYLINT_SHARD_TIMEOUT = 120
+
+# Pylint exit status bits for a fatal message or a usage error, after which
+# the reported messages may be incomplete
+PYLINT_UNRELIABLE_EXIT_BITS = 1 | 32
+
+# Message id of useless-suppression, checked before matching output lines
+USELESS_SUPPRESSION_ID = "I0021"
+
+# Useless-suppression messages in pylint's output formats:
+# Parseable: file.py:302: [I0021(useless-suppression), ] Useless suppression
+# Default: file.py:302:0: I0021: Useless suppression of 'X'
+USELESS_SUPPRESSION_PATTERNS = (
+    re.compile(
+        r"^([^:]+):(\d+):\s*\[I0021\([^)]+\),\s*\]\s*"
+        r"Useless suppression of '([^']+)'"
+    ),
+    re.compile(r"^([^:]+):(\d+):\d+:\s*I0021:\s*Useless suppression of '([^']+)'"),
+)
+
+# Useless suppressions pylint reported for one file, once its module is done
+FileSuppressions = tuple[Path, list[tuple[int, str]]]
 
 
 @dataclass
@@ -33,6 +82,10 @@ class DisableComment:
         pylint_rules: List of pylint rule identifiers in the disable comment.
         other_tools_content: Non-pylint content in the comment (e.g., noqa).
         comment_format: Format of the disable comment (inline, block, etc.).
+        comment_start: Offset of the "#" starting the comment, or None to
+            locate it in original_line when needed.
+        pragma: Pragma holding the rules: "disable", "disable-next",
+            "enable" or "skip-file".
 
     """
 
@@ -42,6 +95,8 @@ class DisableComment:
     pylint_rules: list[str]
     other_tools_content: str
     comment_format: str
+    comment_start: int | None = None
+    pragma: str = "disable"
 
 
 class PylintCleaner:
@@ -52,13 +107,18 @@ class PylintCleaner:
     comments and maintaining code formatting.
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         *,
         config_file: Path,
         dry_run: bool,
         project_root: Path,
         rules: Rules,
+        cache: bool = False,
+        files: Sequence[Path] | None = None,
+        jobs: int | None = None,
+        since: str | None = None,
+        targeted: bool = False,
     ) -> None:
         """Initialize the PylintCleaner.
 
@@ -67,13 +127,31 @@ class PylintCleaner:
             dry_run: Whether to run in dry-run mode.
             project_root: Root directory of the project to clean.
             rules: Rules instance containing all rule information.
+            cache: Whether to reuse and store per-file pylint results in the
+                user cache directory. Off by default, since a cached result
+                is not invalidated when a module the file imports changes.
+            files: Files to inspect instead of every git-tracked Python file.
+                Paths that are not existing Python files are ignored, and if
+                none remain every git-tracked Python file is inspected.
+            jobs: Number of pylint processes to run at once, defaulting to the
+                number of CPUs.
+            since: Git ref; if given, only Python files changed since its
+                merge base with HEAD are inspected, along with any files.
+            targeted: Whether to run pylint with only the rules referenced in
+                pragmas enabled, instead of the user's full rule set.
 
         """
+        self.cache = cache
         self.config_file = config_file
         self.dry_run = dry_run
+        self.files = files
+        self.jobs = max(1, jobs or os.cpu_count() or 1)
         self.project_root = project_root
         self.rules = rules
-        self._disable_patterns = self._compile_disable_patterns()
+        # Seconds spent rewriting each file in the last clean_files() call
+        self.rewrite_timings: dict[Path, float] = {}
+        self.since = since
+        self.targeted = targeted
 
     def run(self) -> dict[Path, int]:
         """Run the PylintCleaner to remove unnecessary disable comments.
@@ -112,129 +190,486 @@ class PylintCleaner:
         else:
             return modifications
 
-    def _compile_disable_patterns(self) -> list[re.Pattern[str]]:
-        """Compile regex patterns for detecting pylint disable comments.
+    def _iter_useless_suppressions(self) -> Iterator[FileSuppressions]:
+        """Detect useless pylint suppressions using pylint's built-in check.
 
-        Returns:
-            List of compiled regex patterns for different disable comment formats.
+        Files with pylint pragmas are split into shards of similar size, and
+        each shard is linted by its own pylint process, up to self.jobs at a
+        time. With the cache enabled, files whose content, configuration and
+        pylint version match an earlier run reuse its results instead.
+
+        Pylint's output is read as it is produced, and each file's results are
+        yielded as soon as pylint has moved on to another file, so callers can
+        start cleaning files while pylint is still running.
+
+        Yields:
+            FileSuppressions: Tuples of (file path, (line_number, rule_name)
+                tuples) for each file with useless suppressions.
 
         """
-        return [
-            # Single line with rule name or code
-            re.compile(
-                r"^(.*?)\s*#\s*(.*)?\s*pylint:\s*disable=([a-zA-Z0-9_,-]+)\s*(.*?)$"
-            ),
-            # Multiple rules by name or code
-            re.compile(
-                r"^(.*?)\s*#\s*(.*)?\s*pylint:\s*disable=([A-Z]\d+(?:,[A-Z]\d+)*)\s*(.*?)$"
-            ),
-            # Mixed with other tools
-            re.compile(
-                r"^(.*?)\s*#\s*(.*?)\s*pylint:\s*disable=([a-zA-Z0-9_,-]+)\s*(.*?)$"
-            ),
-            # File-level disable
-            re.compile(r"^#\s*pylint:\s*skip-file\s*(.*)$"),
-            # General pylint disable pattern (catch-all)
-            re.compile(
-                r"^(.*?)\s*#\s*(.*?)\s*pylint:\s*disable=([a-zA-Z0-9_,\s-]+)\s*(.*?)$"
-            ),
+        logger.info(
+            "Running pylint with useless-suppression to detect unnecessary disables"
+        )
+
+        # Only files containing a pylint pragma can have useless suppressions
+        candidates = filter_files_with_pragmas(files=self._list_python_files())
+        if not candidates:
+            logger.info("No pylint pragmas found, skipping pylint run")
+            return
+
+        # Key files by the paths pylint reports, relative to the project root
+        candidates = [
+            self.project_root / os.path.relpath(path, self.project_root)
+            for path in candidates
         ]
 
-    def _detect_useless_suppressions(self) -> dict[Path, list[tuple[int, str]]]:
-        """Detect useless pylint suppressions using pylint's built-in check.
+        found: dict[Path, list[tuple[int, str]]] = {}
+        cache = self._open_cache()
+        if cache is not None:
+            hits, candidates = cache.lookup(files=candidates, root=self.project_root)
+            for file_path, suppressions in hits.items():
+                if suppressions:
+                    found[file_path] = suppressions
+                    yield file_path, suppressions
+
+        linted: list[Path] = []
+        batches = self._make_batches(shards=self._make_shards(files=candidates))
+        if batches:
+            logger.info(
+                "Running pylint on %d files in %d batches with up to %d processes",
+                len(candidates),
+                len(batches),
+                self.jobs,
+            )
+            for file_path, suppressions in self._stream_shards(
+                linted=linted, shards=batches
+            ):
+                found[file_path] = suppressions
+                yield file_path, suppressions
+
+        if cache is not None:
+            for file_path in linted:
+                cache.store(file_path=file_path, suppressions=found.get(file_path, []))
+            cache.save()
+
+        logger.info("Found useless suppressions in %d files", len(found))
+
+    def _stream_shards(
+        self, *, linted: list[Path], shards: list[list[Path]]
+    ) -> Iterator[FileSuppressions]:
+        """Run pylint on shards concurrently, yielding results as files finish.
+
+        Args:
+            linted: List extended in place with the files pylint linted
+                completely, once every shard has finished.
+            shards: Shards of files, each linted by one pylint process.
+
+        Yields:
+            FileSuppressions: Useless suppressions of each file, in the order
+                files finish.
+
+        """
+        # Finished files from all shards, with None marking a finished shard
+        finished: queue.SimpleQueue[FileSuppressions | None] = queue.SimpleQueue()
+
+        def run_shard(shard: list[Path]) -> list[Path]:
+            try:
+                return self._run_pylint_shard(files=shard, on_complete=finished.put)
+            finally:
+                finished.put(None)
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            futures = [executor.submit(run_shard, shard) for shard in shards]
+            running = len(futures)
+            while running:
+                item = finished.get()
+                if item is None:
+                    running -= 1
+                else:
+                    yield item
+            for future in futures:
+                linted.extend(future.result())
+
+    def _open_cache(self) -> SuppressionCache | None:
+        """Open the per-file result cache for this configuration.
 
         Returns:
-            Dictionary mapping file paths to lists of (line_number, rule_name) tuples
-            for useless suppressions.
+            The cache, or None if caching is disabled.
 
         """
-        logger.info(
-            "Running pylint with useless-suppression to detect unnecessary disables"
+        if not self.cache:
+            return None
+        return SuppressionCache(
+            cache_path=user_cache_dir() / SUPPRESSION_CACHE_FILE,
+            context=suppression_cache_context(
+                config_file=self.config_file, targeted=self.targeted
+            ),
         )
 
-        try:
-            # Run pylint with user's config on git-tracked Python files
-            # Note: useless-suppression is now always enabled via RuffPylintExtractor
-            cmd = (
-                f"python -m pylint --output-format=parseable "
-                f"--rcfile {self.config_file} $(git ls-files '*.py')"
+    def _make_shards(self, *, files: list[Path]) -> list[list[Path]]:
+        """Split files into one shard per job, balanced by total file size.
+
+        Files are assigned largest first to the shard with the fewest bytes so
+        far, since pylint's run time grows with the amount of source.
+
+        Args:
+            files: Files to split.
+
+        Returns:
+            Non-empty shards, each keeping the files' original order.
+
+        """
+        shard_count = min(self.jobs, len(files))
+        if shard_count <= 1:
+            return [files] if files else []
+
+        sizes = {}
+        for file_path in files:
+            try:
+                sizes[file_path] = file_path.stat().st_size
+            except OSError:
+                sizes[file_path] = 0
+
+        # Heap of (total bytes, shard index) so the lightest shard is on top
+        heap = [(0, index) for index in range(shard_count)]
+        assignments: dict[Path, int] = {}
+        for file_path in sorted(files, key=lambda path: sizes[path], reverse=True):
+            total, index = heapq.heappop(heap)
+            assignments[file_path] = index
+            heapq.heappush(heap, (total + sizes[file_path], index))
+
+        shards: list[list[Path]] = [[] for _ in range(shard_count)]
+        for file_path in files:
+            shards[assignments[file_path]].append(file_path)
+        return shards
+
+    def _make_batches(self, *, shards: list[list[Path]]) -> list[list[Path]]:
+        """Split shards into batches whose pylint commands fit the OS limit.
+
+        Args:
+            shards: Shards of files, each in its original order.
+
+        Returns:
+            Batches of files, each small enough to pass to one pylint process.
+
+        """
+        limit = command_line_limit()
+        batches: list[list[Path]] = []
+        for shard in shards:
+            arguments = [os.path.relpath(path, self.project_root) for path in shard]
+            options_length = command_length(
+                args=self._pylint_command(files=shard)
+            ) - command_length(args=arguments)
+            batches.extend(
+                split_batches(
+                    items=shard,
+                    limit=limit - options_length,
+                    to_argument=lambda path: os.path.relpath(path, self.project_root),
+                )
             )
+        return batches
+
+    def _run_pylint_shard(
+        self, *, files: list[Path], on_complete: Callable[[FileSuppressions], None]
+    ) -> list[Path]:
+        """Run pylint on one shard of files, streaming its output.
+
+        Only useless-suppression lines are kept from pylint's output. A shard
+        that times out is killed, and the files pylint had not finished are
+        split in half and retried, so the results of the files that can be
+        linted in time are kept.
+
+        Args:
+            files: Files to lint together in one pylint process.
+            on_complete: Called with each file's useless suppressions as soon
+                as pylint has finished reporting on the file.
+
+        Returns:
+            Files pylint linted completely. Files that timed out, and shards
+            where pylint hit a fatal or usage error, are not included.
 
+        """
+        timed_out = threading.Event()
+        try:
             # Run pylint with the user's configuration
             # Note: Using trusted pylint command from user's environment
-            result = subprocess.run(  # noqa: S602
-                cmd,
-                capture_output=True,
-                check=False,  # Don't raise on non-zero exit (expected)
+            with subprocess.Popen(  # noqa: S603
+                self._pylint_command(files=files),
                 cwd=self.project_root,
-                shell=True,
+                stderr=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
                 text=True,
-                timeout=120,
-            )
+            ) as process:
 
-            return self._parse_pylint_output(output=result.stdout)
+                def expire() -> None:
+                    timed_out.set()
+                    process.kill()
 
-        except subprocess.TimeoutExpired:
-            logger.exception("Pylint command timed out after 120 seconds")
-            return {}
-        except Exception:
+                timer = threading.Timer(PYLINT_SHARD_TIMEOUT, expire)
+                timer.start()
+                try:
+                    completed, pending = self._read_pylint_output(
+                        lines=process.stdout or (), on_complete=on_complete
+                    )
+                    returncode = process.wait()
+                finally:
+                    timer.cancel()
+        except (OSError, ValueError):
             logger.exception("Error running pylint to detect useless suppressions")
-            return {}
+            return []
 
-    def _parse_pylint_output(self, *, output: str) -> dict[Path, list[tuple[int, str]]]:
-        """Parse pylint output to extract useless suppression information.
+        if timed_out.is_set():
+            # The last file's results may be partial, so it is retried as well
+            return self._retry_timed_out_shard(
+                completed=completed, files=files, on_complete=on_complete
+            )
+
+        if pending is not None:
+            on_complete(pending)
+        if returncode & PYLINT_UNRELIABLE_EXIT_BITS:
+            logger.debug("Pylint exited with status %d", returncode)
+            return []
+        return files
+
+    def _retry_timed_out_shard(
+        self,
+        *,
+        completed: set[Path],
+        files: list[Path],
+        on_complete: Callable[[FileSuppressions], None],
+    ) -> list[Path]:
+        """Retry the unfinished files of a timed-out shard in two halves.
 
         Args:
-            output: Pylint output in parseable format.
+            completed: Files whose results pylint reported before the timeout.
+            files: Files of the timed-out shard.
+            on_complete: Called with each file's useless suppressions.
 
         Returns:
-            Dictionary mapping file paths to lists of (line_number, rule_name) tuples.
+            Files linted completely, including the completed ones.
 
         """
-        useless_suppressions: dict[Path, list[tuple[int, str]]] = {}
-
-        # Parse pylint output format (can be different based on config):
-        # Format 1: file.py:302: [I0021(useless-suppression), ] Useless suppression
-        # Format 2: file.py:302:0: I0021: Useless suppression of 'X'
-        patterns = [
-            # Format 1: with brackets and parentheses
-            re.compile(
-                r"^([^:]+):(\d+):\s*\[I0021\([^)]+\),\s*\]\s*"
-                r"Useless suppression of '([^']+)'"
-            ),
-            # Format 2: simple format
-            re.compile(
-                r"^([^:]+):(\d+):\d+:\s*I0021:\s*Useless suppression of '([^']+)'"
-            ),
+        if len(files) == 1:
+            logger.warning(
+                "Pylint timed out after %d seconds on %s, skipping it",
+                PYLINT_SHARD_TIMEOUT,
+                files[0],
+            )
+            return []
+
+        remaining = [path for path in files if path not in completed]
+        logger.warning(
+            "Pylint timed out after %d seconds on %d files, retrying %d in halves",
+            PYLINT_SHARD_TIMEOUT,
+            len(files),
+            len(remaining),
+        )
+        linted = [path for path in files if path in completed]
+        middle = max(len(remaining) // 2, 1)
+        for half in (remaining[:middle], remaining[middle:]):
+            if half:
+                linted.extend(
+                    self._run_pylint_shard(files=half, on_complete=on_complete)
+                )
+        return linted
+
+    def _read_pylint_output(
+        self,
+        *,
+        lines: Iterable[str],
+        on_complete: Callable[[FileSuppressions], None],
+    ) -> tuple[set[Path], FileSuppressions | None]:
+        """Read pylint's output, keeping only useless-suppression messages.
+
+        Pylint reports a module's useless suppressions together once it has
+        finished the module, so a file's results are complete when messages
+        for another file start.
+
+        Args:
+            lines: Lines of pylint output as they are produced.
+            on_complete: Called with each file's useless suppressions once
+                they are complete.
+
+        Returns:
+            Tuple of (files passed to on_complete, results of the last file
+            reported, which are complete only if pylint finished).
+
+        """
+        completed: set[Path] = set()
+        current: FileSuppressions | None = None
+        for line in lines:
+            if USELESS_SUPPRESSION_ID not in line:
+                continue
+            parsed = self._parse_pylint_line(line=line)
+            if parsed is None:
+                continue
+
+            file_path, line_number, rule_name = parsed
+            if current is not None and current[0] != file_path:
+                completed.add(current[0])
+                on_complete(current)
+                current = None
+            if file_path in completed:
+                logger.debug("Ignoring out-of-order pylint message for %s", file_path)
+                continue
+            if current is None:
+                current = (file_path, [])
+            current[1].append((line_number, rule_name))
+        return completed, current
+
+    def _pylint_command(self, *, files: list[Path]) -> list[str]:
+        """Build the pylint command that reports useless suppressions.
+
+        In targeted mode every message is disabled except useless-suppression
+        and the rules the files' pragmas refer to, so pylint skips checkers
+        that cannot change which suppressions are useless. Referenced rules
+        the configuration disables stay disabled, since pylint reports their
+        suppressions as useless. If the enabled rules cannot be resolved, the
+        full configuration is used.
+
+        Args:
+            files: Files to lint.
+
+        Returns:
+            Command and arguments to run pylint with the user's configuration.
+
+        """
+        # Note: useless-suppression is always enabled via RuffPylintExtractor
+        cmd = [
+            "python",
+            "-m",
+            "pylint",
+            "--output-format=parseable",
+            "--rcfile",
+            str(self.config_file),
+            # Shards already run in parallel, so a configured jobs setting
+            # would multiply the number of pylint workers
+            "--jobs=1",
         ]
+        if self.targeted and self._enabled_rules is not None:
+            referenced_rules = (
+                self._collect_referenced_rules(files=files) & self._enabled_rules
+            )
+            logger.debug(
+                "Targeted pylint run with %d referenced rules", len(referenced_rules)
+            )
+            enabled = ",".join(["useless-suppression", *sorted(referenced_rules)])
+            cmd.extend(["--disable=all", f"--enable={enabled}"])
+        cmd.extend(os.path.relpath(path, self.project_root) for path in files)
+        return cmd
+
+    @functools.cached_property
+    def _enabled_rules(self) -> set[str] | None:
+        """Names and ids of the messages the configuration enables.
+
+        Returns:
+            Enabled message names and ids, or None if pylint failed to list
+            them.
+
+        """
+        return enabled_messages(config_file=self.config_file, cwd=self.project_root)
+
+    def _collect_referenced_rules(self, *, files: list[Path]) -> set[str]:
+        """Collect the rules named in the pylint pragmas of some files.
+
+        Args:
+            files: Files whose pragmas to read.
 
-        for line in output.strip().split("\n"):
-            if not line.strip():
+        Returns:
+            Rule names and ids from disable, disable-next and enable pragmas,
+            excluding "all".
+
+        """
+        referenced: set[str] = set()
+        for file_path in files:
+            try:
+                content = file_path.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError) as e:
+                logger.debug("Failed to read pragmas from %s: %s", file_path, e)
                 continue
 
-            # Try both patterns
-            for pattern in patterns:
-                match = pattern.match(line)
-                if match:
-                    file_path = Path(match.group(1))
-                    line_number = int(match.group(2))
-                    rule_name = match.group(3)
+            for match in PRAGMA_PATTERN.finditer(content):
+                if match.group("rules") is not None:
+                    referenced.update(
+                        rule.strip() for rule in match.group("rules").split(",")
+                    )
+
+        referenced.discard("all")
+        return referenced
+
+    def _list_python_files(self) -> list[Path]:
+        """List the Python files the cleaner should inspect.
+
+        By default this is every git-tracked Python file. When files or a
+        base ref were given, only those of the files that are Python files
+        and the Python files changed since the ref (in commits, the index or
+        the working tree) are listed. Files without any Python file among
+        them, such as a lone pyproject.toml passed by pre-commit, fall back
+        to every git-tracked Python file, since a configuration change can
+        affect any of them.
+
+        Returns:
+            Paths of the Python files to inspect.
+
+        """
+        selected: dict[Path, Path] = {}
+        for file_path in self.files or ():
+            if file_path.suffix == ".py" and file_path.is_file():
+                selected.setdefault(file_path.resolve(), file_path)
+
+        if not selected and self.since is None:
+            if self.files:
+                logger.info("No Python files given, inspecting the whole project")
+            return git_python_files(args=["ls-files", "-z"], cwd=self.project_root)
+
+        if self.since is not None:
+            changed = git_python_files(
+                args=[
+                    "diff",
+                    "--name-only",
+                    "-z",
+                    "--relative",
+                    "--diff-filter=d",
+                    "--merge-base",
+                    self.since,
+                ],
+                cwd=self.project_root,
+            )
+            for file_path in changed:
+                selected.setdefault(file_path.resolve(), file_path)
+
+        logger.info("Inspecting %d selected Python files", len(selected))
+        return list(selected.values())
+
+    def _parse_pylint_line(self, *, line: str) -> tuple[Path, int, str] | None:
+        """Parse one line of pylint output as a useless-suppression message.
 
-                    # Make file path absolute relative to project root
-                    # Handles cases where tool runs from different working directory
-                    if not file_path.is_absolute():
-                        file_path = self.project_root / file_path
+        Args:
+            line: Line of pylint output, in parseable or default format.
 
-                    if file_path not in useless_suppressions:
-                        useless_suppressions[file_path] = []
-                    useless_suppressions[file_path].append((line_number, rule_name))
-                    break  # Found a match, no need to try other patterns
+        Returns:
+            Tuple of (file path, line number, rule name), or None if the line
+            is not a useless-suppression message.
 
-        logger.info("Found useless suppressions in %d files", len(useless_suppressions))
-        return useless_suppressions
+        """
+        for pattern in USELESS_SUPPRESSION_PATTERNS:
+            match = pattern.match(line)
+            if match:
+                file_path = Path(match.group(1))
+                # Make file path absolute relative to project root
+                # Handles cases where tool runs from different working directory
+                if not file_path.is_absolute():
+                    file_path = self.project_root / file_path
+                return file_path, int(match.group(2)), match.group(3)
+        return None
 
     def _parse_disable_comment(
-        self, *, file_path: Path, line_content: str, line_number: int
+        self,
+        *,
+        file_path: Path,
+        line_content: str,
+        line_number: int,
+        locator: PragmaLocator | None = None,
     ) -> DisableComment | None:
         """Parse a line to extract pylint disable comment information.
 
@@ -242,84 +677,78 @@ class PylintCleaner:
             file_path: Path to the file containing the line.
             line_content: Content of the line to parse.
             line_number: Line number in the file.
+            locator: Locator for the whole file, which can also find comments
+                on lines that start inside a multiline string.
 
         Returns:
-            DisableComment object if a pylint disable is found, None otherwise.
+            DisableComment object if a pylint pragma is found, None otherwise.
 
         """
-        for pattern in self._disable_patterns:
-            match = pattern.match(line_content)
-            if match:
-                # Extract components based on pattern groups
-                if "skip-file" in line_content:
-                    return DisableComment(
-                        file_path=file_path,
-                        line_number=line_number,
-                        original_line=line_content,
-                        pylint_rules=["skip-file"],
-                        other_tools_content=match.group(1)
-                        if match.lastindex and match.lastindex >= 1
-                        else "",
-                        comment_format="skip-file",
-                    )
+        if locator is None:
+            pragma = find_pragma(line=line_content)
+        else:
+            pragma = locator.find(line=line_content, line_number=line_number)
+        if pragma is None:
+            return None
+
+        # Keep the rest of the comment, e.g. "noqa: E501", minus separators
+        other_parts = (
+            line_content[pragma.comment_start + 1 : pragma.start],
+            line_content[pragma.end :],
+        )
+        other_tools_content = "  # ".join(
+            text for part in other_parts if (text := part.strip().strip("#").strip())
+        )
 
-                # For regular disable patterns
-                if match.lastindex and match.lastindex >= MIN_GROUPS_FOR_DISABLE:
-                    before_pylint = (
-                        match.group(GROUP_BEFORE_PYLINT)
-                        if match.lastindex >= GROUP_BEFORE_PYLINT
-                        else ""
-                    )
-                    rules_text = match.group(GROUP_RULES_TEXT)
-                    after_pylint = (
-                        match.group(GROUP_AFTER_PYLINT)
-                        if match.lastindex >= GROUP_AFTER_PYLINT
-                        else ""
-                    )
+        is_skip_file = pragma.kind == "skip-file"
+        return DisableComment(
+            comment_format="skip-file" if is_skip_file else "inline",
+            comment_start=pragma.comment_start,
+            file_path=file_path,
+            line_number=line_number,
+            original_line=line_content,
+            other_tools_content=other_tools_content,
+            pragma=pragma.kind,
+            pylint_rules=["skip-file"] if is_skip_file else list(pragma.rules),
+        )
 
-                    # Parse comma-separated rules
-                    pylint_rules = [
-                        rule.strip() for rule in rules_text.split(",") if rule.strip()
-                    ]
-
-                    return DisableComment(
-                        file_path=file_path,
-                        line_number=line_number,
-                        original_line=line_content,
-                        pylint_rules=pylint_rules,
-                        other_tools_content=f"{before_pylint}{after_pylint}".strip(),
-                        comment_format="inline",
-                    )
+    def _useless_rule_ids(self, *, useless_rules: list[str]) -> set[str]:
+        """Resolve the useless rules reported for a line to a lookup set.
 
-        return None
+        Args:
+            useless_rules: List of useless rule identifiers.
+
+        Returns:
+            The identifiers as given plus the pylint ID and name of each known
+            rule.
+
+        """
+        useless_ids = set(useless_rules)
+        for useless_rule in useless_rules:
+            rule_obj = self.rules.get_by_identifier(identifier=useless_rule)
+            if rule_obj:
+                useless_ids.update((rule_obj.pylint_id, rule_obj.pylint_name))
+        return useless_ids
 
-    def _is_rule_useless(self, *, rule: str, useless_rules: list[str]) -> bool:
+    def _is_rule_useless(self, *, rule: str, useless_ids: set[str]) -> bool:
         """Check if a rule should be considered useless.
 
         Handles matching between rule codes (E0401) and rule names (import-error).
 
         Args:
             rule: Rule identifier to check.
-            useless_rules: List of useless rule identifiers.
+            useless_ids: Useless rule identifiers from _useless_rule_ids.
 
         Returns:
             True if the rule is useless and should be removed.
 
         """
-        for useless_rule in useless_rules:
-            # Check direct match first
-            if rule == useless_rule:
-                return True
-            # Check if they're the same rule (by ID or name)
-            rule_obj = self.rules.get_by_identifier(identifier=rule)
-            useless_rule_obj = self.rules.get_by_identifier(identifier=useless_rule)
-            if (
-                rule_obj
-                and useless_rule_obj
-                and rule_obj.pylint_id == useless_rule_obj.pylint_id
-            ):
-                return True
-        return False
+        # Check direct match first
+        if rule in useless_ids:
+            return True
+        # Check if they're the same rule (by ID or name)
+        rule_obj = self.rules.get_by_identifier(identifier=rule)
+        return rule_obj is not None and rule_obj.pylint_id in useless_ids
 
     def _remove_useless_rules_from_comment(  # noqa: PLR0911
         self, *, disable_comment: DisableComment, useless_rules: list[str]
@@ -341,36 +770,41 @@ class PylintCleaner:
                 return None
             return disable_comment.original_line
 
+        if disable_comment.pragma == "enable":
+            # Enable pragmas suppress nothing, so there is nothing to remove
+            return disable_comment.original_line
+
+        line = disable_comment.original_line
+        comment_start = disable_comment.comment_start
+        if comment_start is None:
+            comment_start = find_comment_start(line=line)
+        code_part = line if comment_start is None else line[:comment_start]
+
         # Filter out useless rules, keeping necessary ones
+        useless_ids = self._useless_rule_ids(useless_rules=useless_rules)
         remaining_rules = [
             rule
             for rule in disable_comment.pylint_rules
-            if not self._is_rule_useless(rule=rule, useless_rules=useless_rules)
+            if not self._is_rule_useless(rule=rule, useless_ids=useless_ids)
         ]
 
         if not remaining_rules:
             # All pylint rules are useless
             if disable_comment.other_tools_content.strip():
                 # Preserve other tool comments
-                code_part = disable_comment.original_line.split("#")[0]
                 return f"{code_part}# {disable_comment.other_tools_content}".rstrip()
             # Remove entire comment line if no code before it
-            code_part = disable_comment.original_line.split("#")[0]
             if not code_part.strip():
                 return None
             return code_part.rstrip()
 
         # Reconstruct the comment with remaining rules
-        code_part = disable_comment.original_line.split("#")[0]
-        remaining_rules_text = ",".join(remaining_rules)
+        pragma = f"# pylint: {disable_comment.pragma}={','.join(remaining_rules)}"
 
         if disable_comment.other_tools_content.strip():
             # Preserve other tool comments
-            return (
-                f"{code_part}# {disable_comment.other_tools_content}  "
-                f"# pylint: disable={remaining_rules_text}"
-            )
-        return f"{code_part}# pylint: disable={remaining_rules_text}"
+            return f"{code_part}# {disable_comment.other_tools_content}  {pragma}"
+        return f"{code_part}{pragma}"
 
     def _remove_useless_disables(
         self,
@@ -390,12 +824,15 @@ class PylintCleaner:
             A tuple of (modified_content, lines_modified_count).
 
         """
-        # Group useless suppressions by line number
+        # Group useless suppressions by the line of the pragma they refer to
+        locator = PragmaLocator(content=content)
         useless_by_line: dict[int, list[str]] = {}
         for line_num, rule_name in useless_suppressions:
-            if line_num not in useless_by_line:
-                useless_by_line[line_num] = []
-            useless_by_line[line_num].append(rule_name)
+            pragma_line = locator.suppression_line(
+                line_number=line_num,
+                rules=self._useless_rule_ids(useless_rules=[rule_name]),
+            )
+            useless_by_line.setdefault(pragma_line, []).append(rule_name)
 
         # Read file content and preserve trailing newline behavior
         try:
@@ -417,6 +854,7 @@ class PylintCleaner:
                     file_path=file_path,
                     line_content=line_content,
                     line_number=line_num,
+                    locator=locator,
                 )
 
                 if disable_comment:
@@ -460,45 +898,33 @@ class PylintCleaner:
         """
         logger.info("Starting pylint disable comment cleanup")
 
-        # Step 1: Detect useless suppressions
-        useless_suppressions = self._detect_useless_suppressions()
-
-        if not useless_suppressions:
-            logger.info("No useless suppressions found")
-            return {}
-
         modifications: dict[Path, int] = {}
+        self.rewrite_timings = {}
 
-        # Step 2: Process each file with useless suppressions
-        for file_path, useless_list in useless_suppressions.items():
-            if not file_path.exists():
-                logger.warning("File not found: %s", file_path)
-                continue
-
-            # Read file content
-            try:
-                content = file_path.read_text(encoding="utf-8")
-            except (OSError, UnicodeDecodeError) as e:
-                logger.warning("Failed to read file %s: %s", file_path, e)
-                continue
-
-            # Remove useless suppressions from the content
-            new_content, modified_lines = self._remove_useless_disables(
-                content=content,
-                file_path=file_path,
-                useless_suppressions=useless_list,
-            )
+        # Files are cleaned as soon as pylint has finished reporting on them
+        for result in rewrite_files(
+            jobs=self._iter_useless_suppressions(),
+            rewrite=lambda file_path, useless_list: self._clean_file(
+                dry_run=dry_run, file_path=file_path, useless_list=useless_list
+            ),
+        ):
+            self.rewrite_timings[result.file_path] = result.seconds
+            if result.modified_lines is not None:
+                modifications[result.file_path] = result.modified_lines
 
-            if new_content != content:
-                modifications[file_path] = modified_lines
+        files_with_findings = len(self.rewrite_timings)
+        if not files_with_findings:
+            logger.info("No useless suppressions found")
+            return {}
 
-                if not dry_run:
-                    # Write modified content back to file
-                    try:
-                        file_path.write_text(new_content, encoding="utf-8")
-                        logger.info("Cleaned %d lines in %s", modified_lines, file_path)
-                    except OSError:
-                        logger.exception("Failed to write file %s", file_path)
+        slowest = max(self.rewrite_timings, key=self.rewrite_timings.__getitem__)
+        logger.info(
+            "Processed %d files in %.3f s of rewrite time (slowest: %s, %.3f s)",
+            files_with_findings,
+            sum(self.rewrite_timings.values()),
+            slowest,
+            self.rewrite_timings[slowest],
+        )
 
         total_modified = sum(modifications.values())
         if dry_run:
@@ -515,3 +941,48 @@ class PylintCleaner:
             )
 
         return modifications
+
+    def _clean_file(
+        self, *, dry_run: bool, file_path: Path, useless_list: list[tuple[int, str]]
+    ) -> int | None:
+        """Remove useless suppressions from one file.
+
+        Args:
+            dry_run: If True, only report what would be changed.
+            file_path: File to clean.
+            useless_list: Useless suppressions in the file, as (line, rule) tuples.
+
+        Returns:
+            Number of lines modified, or None if the file is unchanged or
+            cannot be read.
+
+        """
+        if not file_path.exists():
+            logger.warning("File not found: %s", file_path)
+            return None
+
+        # Read file content
+        try:
+            content = file_path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning("Failed to read file %s: %s", file_path, e)
+            return None
+
+        # Remove useless suppressions from the content
+        new_content, modified_lines = self._remove_useless_disables(
+            content=content,
+            file_path=file_path,
+            useless_suppressions=useless_list,
+        )
+
+        if new_content == content:
+            return None
+
+        if not dry_run:
+            # Replace the file atomically so it is never left half-written
+            try:
+                write_text_if_changed(content=new_content, path=file_path)
+                logger.info("Cleaned %d lines in %s", modified_lines, file_path)
+            except OSError:
+                logger.exception("Failed to write file %s", file_path)
+        return modified_lines
@@ -11,22 +11,118 @@ from pylint_ruff_sync.rule import Rule, Rules, RuleSource
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Header line of a message entry in 'pylint --list-msgs'. Messages whose text
+# is a bare "%s" are listed without the "*title*" part.
+LIST_MSGS_HEADER_PATTERN = re.compile(
+    r"^:(?P<name>[\w-]+)\s+\((?P<code>[A-Z]\d+)\):(?:\s*\*(?P<title>.*)\*)?\s*$"
+)
+
+# Message text pylint uses for messages that only pass through a detail
+UNTITLED_MESSAGE = "%s"
+
 
 class PylintExtractor:
     """Extract pylint rules and information."""
 
-    def __init__(self, *, rules: Rules) -> None:
+    def __init__(self, *, plugins: tuple[str, ...] = (), rules: Rules) -> None:
         """Initialize the PylintExtractor with a Rules object.
 
         Args:
+            plugins: Pylint plugin modules to load in addition to the defaults.
             rules: Rules object to populate with extracted data.
 
         """
+        # Set when pylint imported but its message store failed to load, so
+        # the rules came from the 'pylint --list-msgs' fallback instead
+        self.degraded = False
+        self.plugins = plugins
         self.rules = rules
 
     def extract(self) -> None:
         """Extract all available pylint rules and populate the Rules object.
 
+        Reads pylint's message definition store in-process when pylint can be
+        imported, and falls back to parsing 'pylint --list-msgs' otherwise.
+        """
+        if self._extract_in_process():
+            return
+        self._extract_from_subprocess()
+
+    def _extract_in_process(self) -> bool:
+        """Extract rules from pylint's message definition store in-process.
+
+        This avoids starting a separate interpreter and also captures fields the
+        text output does not carry, such as old names, scope and the supported
+        Python version range.
+
+        Returns:
+            True if the rules were extracted, False if pylint is not importable
+            or its message store could not be loaded.
+
+        """
+        try:
+            from pylint.lint import PyLinter  # noqa: PLC0415
+        except ImportError:
+            logger.debug("Pylint is not importable, falling back to subprocess")
+            return False
+
+        logger.info("Extracting pylint rules from pylint's message store")
+
+        try:
+            linter = PyLinter()
+            linter.load_default_plugins()
+            linter.load_plugin_modules(list(self.plugins))
+            message_definitions = list(linter.msgs_store.messages)
+        except Exception:
+            logger.debug("Failed to load pylint's message store", exc_info=True)
+            self.degraded = True
+            return False
+
+        extracted_rules = []
+        for message in message_definitions:
+            # Keep the first line only, matching the --list-msgs text output;
+            # untitled messages are described by their help text instead
+            lines = message.msg.splitlines()
+            if message.msg == UNTITLED_MESSAGE:
+                description = " ".join(message.description.split())
+            else:
+                description = lines[0].rstrip(" ") if lines else ""
+            rule = Rule(
+                description=description,
+                max_python_version=self._format_version(version=message.maxversion),
+                min_python_version=self._format_version(version=message.minversion),
+                old_pylint_ids=[old_id for old_id, _ in message.old_names],
+                old_pylint_names=[old_name for _, old_name in message.old_names],
+                pylint_id=message.msgid,
+                pylint_name=message.symbol,
+                scope=message.scope,
+                source=RuleSource.PYLINT_LIST,
+            )
+            extracted_rules.append(rule)
+            logger.debug("Found pylint rule: %s (%s)", rule.pylint_id, rule.pylint_name)
+
+        self.rules.extend(new_rules=extracted_rules)
+        logger.info("Found %d total pylint rules", len(self.rules))
+        return True
+
+    @staticmethod
+    def _format_version(*, version: tuple[int, ...] | None) -> str:
+        """Format a pylint message version tuple as a dotted string.
+
+        Args:
+            version: Version tuple such as (3, 8), or None.
+
+        Returns:
+            Dotted version string, or an empty string if no version is set.
+
+        """
+        if not version:
+            return ""
+        return ".".join(str(part) for part in version)
+
+    def _extract_from_subprocess(self) -> None:
+        """Extract rules by parsing the output of 'pylint --list-msgs'.
+
         Raises:
             subprocess.CalledProcessError: If pylint command fails.
             Exception: If parsing fails.
@@ -34,37 +130,20 @@ class PylintExtractor:
         """
         logger.info("Extracting pylint rules from 'pylint --list-msgs'")
 
+        cmd = ["pylint", "--list-msgs"]
+        if self.plugins:
+            cmd.append(f"--load-plugins={','.join(self.plugins)}")
+
         try:
-            result = subprocess.run(
-                ["pylint", "--list-msgs"],  # noqa: S607
+            result = subprocess.run(  # noqa: S603
+                cmd,
                 capture_output=True,
                 check=True,
                 text=True,
             )
 
-            output_text = result.stdout
-
-            for line in output_text.split("\n"):
-                stripped_line = line.strip()
-                if not stripped_line:
-                    continue
-
-                # Match rule header like ":invalid-name (C0103): *%s name "%s"...*"
-                rule_match = re.match(
-                    pattern=r"^:([a-z-]+)\s+\(([A-Z]\d+)\):\s*\*(.+)\*$",
-                    string=stripped_line,
-                )
-                if rule_match:
-                    name, code, description = rule_match.groups()
-                    rule = Rule(
-                        description=description,
-                        pylint_id=code,
-                        pylint_name=name,
-                        source=RuleSource.PYLINT_LIST,
-                    )
-                    self.rules.add_rule(rule=rule)
-                    logger.debug("Found pylint rule: %s (%s)", code, name)
-
+            extracted_rules = self._parse_list_msgs(output=result.stdout)
+            self.rules.extend(new_rules=extracted_rules)
             logger.info("Found %d total pylint rules", len(self.rules))
 
         except subprocess.CalledProcessError:
@@ -75,6 +154,48 @@ class PylintExtractor:
             logger.exception("Failed to parse pylint output")
             raise
 
+    @staticmethod
+    def _parse_list_msgs(*, output: str) -> list[Rule]:
+        """Parse the message entries printed by 'pylint --list-msgs'.
+
+        Each entry is a header line, such as ':invalid-name (C0103): *%s name
+        "%s" doesn't conform to %s*', followed by its help text on indented
+        lines. Untitled messages have no "*title*" in the header and are
+        described by their help text, as in the in-process extraction.
+
+        Args:
+            output: Output of 'pylint --list-msgs'.
+
+        Returns:
+            Rules in the order pylint listed them.
+
+        """
+        entries: list[tuple[re.Match[str], list[str]]] = []
+        help_lines: list[str] | None = None
+        for line in output.splitlines():
+            header = LIST_MSGS_HEADER_PATTERN.match(line)
+            if header:
+                help_lines = []
+                entries.append((header, help_lines))
+            elif help_lines is not None and line.startswith(" "):
+                help_lines.append(line.strip())
+            else:
+                # Section titles and blank lines end the current entry
+                help_lines = None
+
+        extracted_rules = []
+        for header, entry_help in entries:
+            title = header.group("title")
+            rule = Rule(
+                description=title if title is not None else " ".join(entry_help),
+                pylint_id=header.group("code"),
+                pylint_name=header.group("name"),
+                source=RuleSource.PYLINT_LIST,
+            )
+            extracted_rules.append(rule)
+            logger.debug("Found pylint rule: %s (%s)", rule.pylint_id, rule.pylint_name)
+        return extracted_rules
+
     def resolve_rule_identifiers(
         self,
         all_rules: Rules,
@@ -0,0 +1,211 @@
+"""Persistent cache of extracted pylint rules in the user cache directory."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sys
+from dataclasses import asdict, dataclass
+from importlib import metadata
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pylint_ruff_sync.rules_cache_manager import RulesCacheManager
+
+if TYPE_CHECKING:
+    from pylint_ruff_sync.rule import Rules
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Metadata key used to store the cache key alongside the cached rules
+CACHE_KEY_METADATA = "pylint_cache_key"
+
+# Version of the cached rules layout; bump when extraction output changes
+PYLINT_CACHE_SCHEMA_VERSION = 2
+
+
+def user_cache_dir() -> Path:
+    """Return the per-user cache directory for pylint-ruff-sync.
+
+    Honours XDG_CACHE_HOME and falls back to ~/.cache.
+
+    Returns:
+        Path to the cache directory (not created).
+
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "pylint-ruff-sync"
+
+
+def _plugin_versions(*, plugins: tuple[str, ...]) -> tuple[str, ...] | None:
+    """Find the versions of the distributions providing pylint plugins.
+
+    Plugins outside an installed distribution, such as modules in the project
+    itself, can change without any version changing, so they are not cached.
+
+    Args:
+        plugins: Pylint plugin modules that will be loaded.
+
+    Returns:
+        Sorted "name==version" strings, or None if a plugin's distribution
+        cannot be found.
+
+    """
+    if not plugins:
+        return ()
+
+    distributions = metadata.packages_distributions()
+    versions: set[str] = set()
+    for plugin in plugins:
+        names = distributions.get(plugin.partition(".")[0])
+        if not names:
+            logger.debug("No distribution provides plugin %s, skipping cache", plugin)
+            return None
+        try:
+            versions.update(f"{name}=={metadata.version(name)}" for name in names)
+        except metadata.PackageNotFoundError:
+            logger.debug("Version of plugin %s not found, skipping cache", plugin)
+            return None
+    return tuple(sorted(versions))
+
+
+@dataclass(frozen=True)
+class PylintCacheKey:
+    """Identifies the pylint environment a set of extracted rules belongs to.
+
+    Attributes:
+        plugin_versions: Sorted "name==version" of the distributions providing
+            the plugins.
+        plugins: Sorted pylint plugin modules loaded for extraction.
+        pylint_version: Installed pylint version.
+        python_version: Running Python version (major.minor.micro).
+        schema_version: Version of the cached rules layout.
+
+    """
+
+    plugin_versions: tuple[str, ...]
+    plugins: tuple[str, ...]
+    pylint_version: str
+    python_version: str
+    schema_version: int = PYLINT_CACHE_SCHEMA_VERSION
+
+    @classmethod
+    def current(cls, *, plugins: tuple[str, ...]) -> PylintCacheKey | None:
+        """Build the key for the running interpreter and installed pylint.
+
+        Args:
+            plugins: Pylint plugin modules that will be loaded.
+
+        Returns:
+            Cache key, or None if the pylint version or the version of a
+            plugin cannot be determined.
+
+        """
+        try:
+            pylint_version = metadata.version("pylint")
+        except metadata.PackageNotFoundError:
+            logger.debug("Pylint distribution not found, skipping rules cache")
+            return None
+
+        plugin_versions = _plugin_versions(plugins=plugins)
+        if plugin_versions is None:
+            return None
+
+        return cls(
+            plugin_versions=plugin_versions,
+            plugins=tuple(sorted(plugins)),
+            pylint_version=pylint_version,
+            python_version=".".join(str(part) for part in sys.version_info[:3]),
+        )
+
+    def to_dict(self) -> dict[str, int | str | list[str]]:
+        """Convert the key to a JSON-serializable dictionary.
+
+        Returns:
+            Dictionary representation of the key.
+
+        """
+        data = asdict(self)
+        data["plugin_versions"] = list(self.plugin_versions)
+        data["plugins"] = list(self.plugins)
+        return data
+
+    def digest(self) -> str:
+        """Return a short stable hash of the key for use in file names.
+
+        Returns:
+            Hex digest identifying this key.
+
+        """
+        encoded = json.dumps(self.to_dict(), sort_keys=True).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+class PylintRulesCache:
+    """Stores PylintExtractor results keyed by pylint, Python and plugin versions."""
+
+    def __init__(self, *, cache_dir: Path) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cached rule files.
+
+        """
+        self.cache_dir = cache_dir
+
+    def _cache_manager(self, *, key: PylintCacheKey) -> RulesCacheManager:
+        """Get the cache manager for the file belonging to a key.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            RulesCacheManager for the key's cache file.
+
+        """
+        cache_path = self.cache_dir / f"pylint-rules-{key.digest()}.json"
+        return RulesCacheManager(cache_path=cache_path)
+
+    def load(self, *, key: PylintCacheKey) -> Rules | None:
+        """Load cached pylint rules for a key.
+
+        Args:
+            key: Cache key for the current pylint environment.
+
+        Returns:
+            Cached Rules, or None on a cache miss.
+
+        """
+        rules = self._cache_manager(key=key).load_rules()
+        if rules is None:
+            return None
+
+        if rules.metadata.get(CACHE_KEY_METADATA) != key.to_dict() or not rules:
+            logger.debug("Ignoring pylint rules cache with mismatched key")
+            return None
+
+        logger.info("Using cached pylint rules for pylint %s", key.pylint_version)
+        return rules
+
+    def save(self, *, key: PylintCacheKey, rules: Rules) -> None:
+        """Save extracted pylint rules for a key.
+
+        Failures are logged and otherwise ignored, since the cache is only an
+        optimization.
+
+        Args:
+            key: Cache key for the current pylint environment.
+            rules: Rules extracted from pylint.
+
+        """
+        original_metadata = rules.metadata
+        rules.metadata = {**original_metadata, CACHE_KEY_METADATA: key.to_dict()}
+        try:
+            self._cache_manager(key=key).save_rules(rules=rules)
+        except OSError as e:
+            logger.debug("Failed to save pylint rules cache: %s", e)
+        finally:
+            rules.metadata = original_metadata
@@ -16,6 +16,9 @@ from .toml_file import SimpleArrayWithComments, TomlFile
 
 logger = logging.getLogger(__name__)
 
+# Section holding the disable and enable arrays
+MESSAGES_CONTROL_SECTION = "tool.pylint.messages_control"
+
 
 @dataclass
 class RuleFormat:
@@ -41,7 +44,7 @@ class PyprojectUpdater:
 
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         *,
         config_file: Path,
@@ -49,6 +52,7 @@ class PyprojectUpdater:
         dry_run: bool = False,
         message_generator: MessageGenerator | None = None,
         rule_format: RuleFormat | None = None,
+        toml_sort_backend: str = "library",
     ) -> None:
         """Initialize the PyprojectUpdater.
 
@@ -59,6 +63,7 @@ class PyprojectUpdater:
                 be done.
             message_generator: Optional MessageGenerator for dry-run messages.
             rule_format: Configuration for rule formatting in output.
+            toml_sort_backend: How to run toml-sort (library or subprocess).
 
         """
         self.rules = rules
@@ -66,7 +71,9 @@ class PyprojectUpdater:
         self.dry_run = dry_run
         self.message_generator = message_generator
         self.rule_format = rule_format or RuleFormat()
-        self.toml_file = TomlFile(file_path=config_file)
+        self.toml_file = TomlFile(
+            file_path=config_file, toml_sort_backend=toml_sort_backend
+        )
 
     def update(self, *, disable_mypy_overlap: bool = False) -> None:
         """Update the pylint configuration with optimized rule settings.
@@ -104,16 +111,62 @@ class PyprojectUpdater:
                 logger.info("  - Rules to enable: %d", len(rules_to_enable))
             return
 
-        # Step 1: Update disable array with "all" and collected disable rules
-        self._update_disable_array(rules_to_disable, unknown_disabled_rules)
+        # Build the arrays as they would be written
+        desired_arrays = {
+            "disable": self._build_disable_array(
+                disable_rules=rules_to_disable,
+                unknown_disabled_rules=unknown_disabled_rules,
+            ),
+            "enable": self._build_enable_array(enable_rules=rules_to_enable),
+        }
+
+        # Most runs change nothing, so skip editing, sorting and writing
+        if self._arrays_up_to_date(desired_arrays=desired_arrays):
+            logger.info("Pylint configuration is already up to date")
+            return
 
-        # Step 2: Update enable array with URL comments
-        self._update_enable_array(enable_rules=rules_to_enable)
+        # Steps 1 and 2: update the disable array (with "all") and the enable
+        # array together so the file is sorted only once
+        with self.toml_file.batch():
+            for key, array in desired_arrays.items():
+                self.toml_file.update_section_array(
+                    array_data=array,
+                    key=key,
+                    section_path=MESSAGES_CONTROL_SECTION,
+                )
 
         # Step 3: Save the file
         self.save()
         logger.info("Configuration updated successfully")
 
+    def _arrays_up_to_date(
+        self, *, desired_arrays: dict[str, SimpleArrayWithComments]
+    ) -> bool:
+        """Check whether the file already contains the desired arrays.
+
+        Each array written in the file is parsed and compared with the desired
+        one by items, order and item comments. Layout is ignored, so arrays
+        that the user's toml-sort settings reformat still count as up to date.
+
+        Args:
+            desired_arrays: Arrays to write, keyed by messages_control key.
+
+        Returns:
+            True if every array is already present with the same content,
+            False otherwise.
+
+        """
+        for key, array in desired_arrays.items():
+            text = self.toml_file.get_value_text(
+                key=key, section_path=MESSAGES_CONTROL_SECTION
+            )
+            current = (
+                None if text is None else SimpleArrayWithComments.from_toml(text=text)
+            )
+            if current is None or not current.same_content(other=array):
+                return False
+        return True
+
     def _resolve_rule_identifiers(
         self, *, disable_mypy_overlap: bool = False
     ) -> tuple[list[Rule], list[str], list[Rule]]:
@@ -131,9 +184,9 @@ class PyprojectUpdater:
         self._add_user_disabled_rules()
 
         # Load existing configuration to check currently disabled and enabled rules
-        current_dict = self.toml_file.as_dict()
+        current_config = self.toml_file.as_mapping()
         messages_control = (
-            current_dict.get("tool", {}).get("pylint", {}).get("messages_control", {})
+            current_config.get("tool", {}).get("pylint", {}).get("messages_control", {})
         )
 
         current_disable = messages_control.get("disable", [])
@@ -182,9 +235,9 @@ class PyprojectUpdater:
     def _add_user_disabled_rules(self) -> None:
         """Add user-disabled rules that aren't in the main rule set."""
         # Load existing configuration to check currently disabled rules
-        current_dict = self.toml_file.as_dict()
+        current_config = self.toml_file.as_mapping()
         messages_control = (
-            current_dict.get("tool", {}).get("pylint", {}).get("messages_control", {})
+            current_config.get("tool", {}).get("pylint", {}).get("messages_control", {})
         )
 
         current_disable = messages_control.get("disable", [])
@@ -217,15 +270,18 @@ class PyprojectUpdater:
         self.toml_file.write()
         logger.debug("Saved configuration to %s", self.config_file)
 
-    def _update_disable_array(
-        self, disable_rules: list[Rule], unknown_disabled_rules: list[str]
-    ) -> None:
-        """Update the disable array with "all", disable rules, and unknown rules.
+    def _build_disable_array(
+        self, *, disable_rules: list[Rule], unknown_disabled_rules: list[str]
+    ) -> SimpleArrayWithComments:
+        """Build the disable array with "all", disable rules, and unknown rules.
 
         Args:
             disable_rules: List of rules to disable.
             unknown_disabled_rules: List of unknown rule identifiers to keep disabled.
 
+        Returns:
+            The disable array with comments based on format settings.
+
         """
         # Collect all disable items and their comments
         disable_items = []
@@ -263,34 +319,28 @@ class PyprojectUpdater:
         disable_items.sort(key=str.lower)
 
         # Create SimpleArrayWithComments for proper formatting
-        disable_array = SimpleArrayWithComments(
+        return SimpleArrayWithComments(
             comments=disable_comments
             if self.rule_format.comment_type != "none"
             else None,
             items=disable_items,
         )
 
-        self.toml_file.update_section_array(
-            array_data=disable_array,
-            key="disable",
-            section_path="tool.pylint.messages_control",
-        )
-
-    def _update_enable_array(self, *, enable_rules: list[Rule]) -> None:
-        """Update the enable array with rules and comments based on format settings.
+    def _build_enable_array(
+        self, *, enable_rules: list[Rule]
+    ) -> SimpleArrayWithComments:
+        """Build the enable array with rules and comments based on format settings.
 
         Args:
             enable_rules: List of rules to enable.
 
+        Returns:
+            The enable array, empty if there are no rules to enable so that the
+            key still exists.
+
         """
         if not enable_rules:
-            # Ensure enable array exists but is empty
-            self.toml_file.update_section_array(
-                array_data=[],
-                key="enable",
-                section_path="tool.pylint.messages_control",
-            )
-            return
+            return SimpleArrayWithComments(items=[])
 
         # Generate rule identifiers based on rule_format
         enable_items = []
@@ -322,19 +372,13 @@ class PyprojectUpdater:
         # Sort for consistent output (case-insensitive)
         enable_items.sort(key=str.lower)
 
-        enable_array = SimpleArrayWithComments(
+        return SimpleArrayWithComments(
             comments=enable_comments
             if self.rule_format.comment_type != "none"
             else None,
             items=enable_items,
         )
 
-        self.toml_file.update_section_array(
-            array_data=enable_array,
-            key="enable",
-            section_path="tool.pylint.messages_control",
-        )
-
     def _get_current_disable_array(self, *, current_dict: dict[str, Any]) -> list[str]:
         """Get the current disable array from the file dictionary.
 
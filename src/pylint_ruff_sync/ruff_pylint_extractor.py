@@ -7,8 +7,12 @@ import logging
 import re
 import subprocess
 from pathlib import Path
+from typing import Any
 
+from pylint_ruff_sync.command_probe import probe_command
 from pylint_ruff_sync.constants import (
+    GH_AUTH_STATUS_COMMAND,
+    RUFF_ISSUE_UPDATED_AT_METADATA,
     RUFF_PYLINT_ISSUE_NUMBER,
     RUFF_PYLINT_ISSUE_URL,
     RUFF_REPO,
@@ -52,15 +56,17 @@ class RuffPylintExtractor:
                     legacy_rules = data["implemented_rules"]
                     if isinstance(legacy_rules, list):
                         # Convert legacy format to new format
-                        rules = Rules()
-                        for rule_id in legacy_rules:
-                            rule = Rule(
-                                is_implemented_in_ruff=True,
-                                is_in_ruff_issue=True,
-                                pylint_id=rule_id,
-                                source=RuleSource.RUFF_ISSUE,
-                            )
-                            rules.add_rule(rule=rule)
+                        rules = Rules(
+                            rules=[
+                                Rule(
+                                    is_implemented_in_ruff=True,
+                                    is_in_ruff_issue=True,
+                                    pylint_id=rule_id,
+                                    source=RuleSource.RUFF_ISSUE,
+                                )
+                                for rule_id in legacy_rules
+                            ]
+                        )
                         logger.debug(
                             "Loaded %d rules from legacy package data: %s",
                             len(rules),
@@ -103,25 +109,97 @@ class RuffPylintExtractor:
     def _test_github_access(self) -> bool:
         """Test if GitHub CLI is available and authenticated.
 
+        Reuses the process-wide probe result, so 'gh auth status' runs at most
+        once even when DataCollector has already checked it.
+
         Returns:
             True if GitHub access is available, False otherwise.
 
         """
-        try:
-            subprocess.run(
-                ["gh", "auth", "status"],  # noqa: S607
-                capture_output=True,
-                check=True,
-                text=True,
+        return probe_command(command=GH_AUTH_STATUS_COMMAND)
+
+    def _view_issue(self) -> dict[str, Any]:
+        """Fetch the body and updatedAt of the ruff pylint tracking issue.
+
+        Returns:
+            Dictionary with the issue's body and updatedAt fields.
+
+        """
+        result = subprocess.run(  # noqa: S603
+            [  # noqa: S607
+                "gh",
+                "issue",
+                "view",
+                RUFF_PYLINT_ISSUE_NUMBER,
+                "--repo",
+                RUFF_REPO,
+                "--json",
+                "body,updatedAt",
+            ],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        issue_data: dict[str, Any] = json.loads(result.stdout)
+        return issue_data
+
+    def _reuse_unchanged_cache(self, *, updated_at: str | None) -> Rules | None:
+        """Reuse the cached issue rules if the issue has not changed since.
+
+        This avoids parsing the issue body again when the cache recorded the
+        same updatedAt timestamp.
+
+        Args:
+            updated_at: The issue's current updatedAt timestamp.
+
+        Returns:
+            Rules rebuilt from the cache, or None if the body must be parsed.
+
+        """
+        cached_rules = self._load_cache()
+        if cached_rules is None:
+            return None
+
+        cached_updated_at = cached_rules.metadata.get(RUFF_ISSUE_UPDATED_AT_METADATA)
+        if not cached_updated_at:
+            return None
+
+        if updated_at != cached_updated_at:
+            logger.debug(
+                "Ruff issue updated at %s, cache is from %s",
+                updated_at,
+                cached_updated_at,
             )
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
-        else:
-            return True
+            return None
+
+        rules = Rules(
+            metadata={RUFF_ISSUE_UPDATED_AT_METADATA: updated_at},
+            rules=[
+                Rule(
+                    is_implemented_in_ruff=rule.is_implemented_in_ruff,
+                    is_in_ruff_issue=True,
+                    pylint_id=rule.pylint_id,
+                    pylint_name=rule.pylint_name,
+                    ruff_rule=rule.ruff_rule,
+                    source=RuleSource.RUFF_ISSUE,
+                )
+                for rule in cached_rules
+                if rule.is_in_ruff_issue
+            ],
+        )
+        if not rules:
+            return None
+
+        logger.info("Ruff issue unchanged since %s, reusing cached rules", updated_at)
+        return rules
 
     def _fetch_from_github(self) -> Rules:
         """Fetch the ruff pylint implementation status from GitHub issue.
 
+        The issue body and updatedAt timestamp are fetched in one call, and
+        the body is only parsed when the timestamp differs from the one
+        recorded in the cache.
+
         Returns:
             Rules object with ruff implementation information.
 
@@ -137,23 +215,13 @@ class RuffPylintExtractor:
 
         try:
             # Use GitHub CLI to fetch the issue body as JSON
-            result = subprocess.run(  # noqa: S603
-                [  # noqa: S607
-                    "gh",
-                    "issue",
-                    "view",
-                    RUFF_PYLINT_ISSUE_NUMBER,
-                    "--repo",
-                    RUFF_REPO,
-                    "--json",
-                    "body",
-                ],
-                capture_output=True,
-                check=True,
-                text=True,
-            )
+            issue_data = self._view_issue()
+            updated_at = issue_data.get("updatedAt")
+
+            unchanged_rules = self._reuse_unchanged_cache(updated_at=updated_at)
+            if unchanged_rules is not None:
+                return unchanged_rules
 
-            issue_data = json.loads(result.stdout)
             issue_body = issue_data["body"]
 
             if not issue_body:
@@ -161,7 +229,7 @@ class RuffPylintExtractor:
                 return Rules()
 
             # Extract rules information using regex
-            rules = Rules()
+            issue_rules = []
 
             # Pattern to match task list items with pylint codes and optional ruff codes
             # Format: - [x] `rule-name` / `E0237` (PLE0237)
@@ -184,7 +252,7 @@ class RuffPylintExtractor:
                         ruff_rule=ruff_code,
                         source=RuleSource.RUFF_ISSUE,  # From ruff GitHub issue
                     )
-                    rules.add_rule(rule=rule)
+                    issue_rules.append(rule)
                     logger.debug(
                         "Found rule in issue: %s (%s) - implemented: %s, ruff_rule: %s",
                         pylint_code,
@@ -193,6 +261,9 @@ class RuffPylintExtractor:
                         ruff_code,
                     )
 
+            rules = Rules(rules=issue_rules)
+            if updated_at:
+                rules.metadata[RUFF_ISSUE_UPDATED_AT_METADATA] = updated_at
             if not rules:
                 msg = "No rules found in issue body"
                 raise KeyError(msg)  # noqa: TRY301
@@ -262,19 +333,26 @@ class RuffPylintExtractor:
         else:
             return rules
 
-    def extract(self) -> None:
+    def extract(self, *, ruff_rules: Rules | None = None) -> None:
         """Extract ruff implementation data and update the Rules object.
 
         Populates the Rules object with ruff implementation metadata for all
         rules that exist in both pylint and ruff.
+
+        Args:
+            ruff_rules: Rules already fetched with get_all_ruff_rules. When
+                omitted they are fetched now.
+
         """
-        ruff_rules = self.get_all_ruff_rules()
+        if ruff_rules is None:
+            ruff_rules = self.get_all_ruff_rules()
 
         # Create a mapping of ruff rules by pylint_id
         ruff_map = {rule.pylint_id: rule for rule in ruff_rules}
 
         # Track which ruff rules we successfully matched
         matched_ruff_rules = set()
+        names_changed = False
 
         # Update existing rules with ruff data, preserving original source
         for rule in self.rules:
@@ -289,6 +367,7 @@ class RuffPylintExtractor:
                 # Update name if we have it from ruff but not from pylint
                 if not rule.pylint_name and ruff_rule.pylint_name:
                     rule.pylint_name = ruff_rule.pylint_name
+                    names_changed = True
 
             # Special case: useless-suppression should always be enabled
             # Mark it as not implemented by ruff so it appears in enable list
@@ -297,6 +376,15 @@ class RuffPylintExtractor:
                 rule.is_in_ruff_issue = False
                 rule.ruff_rule = ""
 
+        # Keep name lookups in sync with names filled in from the ruff issue
+        if names_changed:
+            self.rules.reindex()
+
+        # Record the issue version so the next fetch can skip an unchanged issue
+        updated_at = ruff_rules.metadata.get(RUFF_ISSUE_UPDATED_AT_METADATA)
+        if updated_at:
+            self.rules.metadata[RUFF_ISSUE_UPDATED_AT_METADATA] = updated_at
+
         # Log warnings for ruff rules that don't exist in current pylint
         unmatched_ruff_rules = set(ruff_map.keys()) - matched_ruff_rules
         if unmatched_ruff_rules:
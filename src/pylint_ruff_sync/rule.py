@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import bisect
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING, Any, ClassVar
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator
 
 
 class RuleSource(Enum):
@@ -43,6 +44,11 @@ class Rule:
         source: Source where this rule was discovered
         pylint_category: Category from rule ID (C/E/W/R/I/F)
         user_comment: User comment from disable list
+        old_pylint_ids: Previous pylint IDs this rule was known by
+        old_pylint_names: Previous pylint names this rule was known by
+        scope: Pylint message scope (e.g., 'node-based-msg', 'line-based-msg')
+        min_python_version: Minimum Python version the rule applies to (e.g., '3.8')
+        max_python_version: Maximum Python version the rule applies to
         CATEGORY_MAP: Map rule category codes to URL categories
 
     """
@@ -58,6 +64,11 @@ class Rule:
     source: RuleSource = RuleSource.UNKNOWN
     pylint_category: str = ""
     user_comment: str = ""
+    old_pylint_ids: list[str] = field(default_factory=list)
+    old_pylint_names: list[str] = field(default_factory=list)
+    scope: str = ""
+    min_python_version: str = ""
+    max_python_version: str = ""
 
     # Map rule category codes to URL categories
     CATEGORY_MAP: ClassVar[dict[str, str]] = {
@@ -152,6 +163,11 @@ class Rule:
             "source": self.source.value,
             "pylint_category": self.pylint_category,
             "user_comment": self.user_comment,
+            "old_pylint_ids": list(self.old_pylint_ids),
+            "old_pylint_names": list(self.old_pylint_names),
+            "scope": self.scope,
+            "min_python_version": self.min_python_version,
+            "max_python_version": self.max_python_version,
         }
 
     @classmethod
@@ -177,11 +193,16 @@ class Rule:
             is_implemented_in_ruff=data.get("is_implemented_in_ruff", False),
             is_in_ruff_issue=data.get("is_in_ruff_issue", False),
             is_mypy_overlap=data.get("is_mypy_overlap", False),
+            max_python_version=data.get("max_python_version", ""),
+            min_python_version=data.get("min_python_version", ""),
+            old_pylint_ids=list(data.get("old_pylint_ids", [])),
+            old_pylint_names=list(data.get("old_pylint_names", [])),
             pylint_category=data.get("pylint_category", ""),
             pylint_docs_url=data.get("pylint_docs_url", ""),
             pylint_id=data.get("pylint_id", ""),
             pylint_name=data.get("pylint_name", ""),
             ruff_rule=data.get("ruff_rule", ""),
+            scope=data.get("scope", ""),
             source=source,
             user_comment=data.get("user_comment", ""),
         )
@@ -194,16 +215,51 @@ class Rules:
     Attributes:
         rules: List of Rule objects
         metadata: Additional metadata about the rule collection
+        _by_id: Index of rules keyed by pylint_id
+        _by_name: Index of rules keyed by pylint_name
 
     """
 
     rules: list[Rule] = field(default_factory=list)
     metadata: dict[str, Any] = field(default_factory=dict)
+    _by_id: dict[str, Rule] = field(
+        compare=False, default_factory=dict, init=False, repr=False
+    )
+    _by_name: dict[str, Rule] = field(
+        compare=False, default_factory=dict, init=False, repr=False
+    )
 
     def __post_init__(self) -> None:
         """Post-initialization processing."""
         # Ensure rules are sorted by pylint_id
         self.rules.sort(key=lambda r: r.pylint_id)
+        self.reindex()
+
+    def _index_rule(self, *, rule: Rule) -> None:
+        """Add a single rule to the identifier indexes.
+
+        The first rule in pylint_id order wins for duplicate identifiers, which
+        matches what a linear scan over the sorted list would return.
+
+        Args:
+            rule: Rule to index.
+
+        """
+        self._by_id.setdefault(rule.pylint_id, rule)
+        current = self._by_name.get(rule.pylint_name)
+        if current is None or rule.pylint_id < current.pylint_id:
+            self._by_name[rule.pylint_name] = rule
+
+    def reindex(self) -> None:
+        """Rebuild the identifier indexes from the rules list.
+
+        Call this after changing the pylint_id or pylint_name of a rule that is
+        already part of the collection.
+        """
+        self._by_id = {}
+        self._by_name = {}
+        for rule in self.rules:
+            self._index_rule(rule=rule)
 
     def add_rule(self, *, rule: Rule) -> None:
         """Add a rule to the collection.
@@ -212,9 +268,26 @@ class Rules:
             rule: Rule to add.
 
         """
-        self.rules.append(rule)
-        # Re-sort after adding
+        # Insert in pylint_id order, after any rules with the same ID
+        bisect.insort_right(self.rules, rule, key=lambda r: r.pylint_id)
+        self._index_rule(rule=rule)
+
+    def extend(self, *, new_rules: Iterable[Rule]) -> None:
+        """Add many rules to the collection with a single sort.
+
+        Prefer this over calling add_rule in a loop when loading a large
+        number of rules at once.
+
+        Args:
+            new_rules: Rules to add.
+
+        """
+        added = list(new_rules)
+        if not added:
+            return
+        self.rules.extend(added)
         self.rules.sort(key=lambda r: r.pylint_id)
+        self.reindex()
 
     def update_rule(self, *, updated_rule: Rule) -> None:
         """Update an existing rule or add if not found.
@@ -223,12 +296,21 @@ class Rules:
             updated_rule: Rule with updated information.
 
         """
-        for i, rule in enumerate(self.rules):
-            if rule.pylint_id == updated_rule.pylint_id:
-                self.rules[i] = updated_rule
-                return
-        # If not found, add as new rule
-        self.add_rule(rule=updated_rule)
+        existing = self._by_id.get(updated_rule.pylint_id)
+        if existing is None:
+            # If not found, add as new rule
+            self.add_rule(rule=updated_rule)
+            return
+
+        i = bisect.bisect_left(
+            self.rules, updated_rule.pylint_id, key=lambda r: r.pylint_id
+        )
+        self.rules[i] = updated_rule
+        self._by_id[updated_rule.pylint_id] = updated_rule
+        if existing.pylint_name != updated_rule.pylint_name:
+            self.reindex()
+        elif self._by_name.get(existing.pylint_name) is existing:
+            self._by_name[existing.pylint_name] = updated_rule
 
     def get_by_id(self, *, pylint_id: str) -> Rule | None:
         """Get rule by pylint ID.
@@ -240,10 +322,7 @@ class Rules:
             Rule if found, None otherwise.
 
         """
-        for rule in self.rules:
-            if rule.pylint_id == pylint_id:
-                return rule
-        return None
+        return self._by_id.get(pylint_id)
 
     def get_by_name(self, *, pylint_name: str) -> Rule | None:
         """Get rule by pylint name.
@@ -255,10 +334,7 @@ class Rules:
             Rule if found, None otherwise.
 
         """
-        for rule in self.rules:
-            if rule.pylint_name == pylint_name:
-                return rule
-        return None
+        return self._by_name.get(pylint_name)
 
     def get_by_identifier(self, *, identifier: str) -> Rule | None:
         """Get rule by ID or name.
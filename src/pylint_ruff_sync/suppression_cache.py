@@ -0,0 +1,241 @@
+"""Persistent cache of useless-suppression findings per source file.
+
+Pylint's useless-suppression (I0021) messages for a file are stored under a
+key combining the file's path and content with a digest of everything else
+that decides them: the pylint configuration file, the pylint and Python
+versions and the cleaner mode. Unchanged files can then skip pylint entirely.
+The cache holds a bounded number of entries and evicts the least recently
+used ones first.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sys
+from collections import OrderedDict
+from importlib import metadata
+from typing import TYPE_CHECKING
+
+from pylint_ruff_sync.atomic_write import write_text_if_changed
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from pathlib import Path
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Name of the cache file in the user cache directory
+SUPPRESSION_CACHE_FILE = "useless-suppressions.json"
+
+# Entries kept before the least recently used ones are evicted
+SUPPRESSION_CACHE_MAX_ENTRIES = 20000
+
+# Bumped whenever the cache layout or the meaning of its entries changes
+SUPPRESSION_CACHE_VERSION = 1
+
+
+def suppression_cache_context(*, config_file: Path, targeted: bool) -> str:
+    """Hash the inputs besides the file itself that affect pylint's findings.
+
+    Args:
+        config_file: Pylint configuration file passed to pylint.
+        targeted: Whether pylint runs with only the referenced rules enabled.
+
+    Returns:
+        Hex digest of the configuration, versions and mode.
+
+    """
+    try:
+        config = config_file.read_bytes()
+    except OSError:
+        config = b""
+
+    try:
+        pylint_version = metadata.version("pylint")
+    except metadata.PackageNotFoundError:
+        pylint_version = "unknown"
+
+    digest = hashlib.sha256()
+    for part in (
+        str(SUPPRESSION_CACHE_VERSION),
+        pylint_version,
+        ".".join(str(part) for part in sys.version_info[:3]),
+        "targeted" if targeted else "full",
+    ):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    digest.update(config)
+    return digest.hexdigest()
+
+
+class SuppressionCache:
+    """Stores useless suppressions by file content and pylint context.
+
+    Entries are kept in least recently used order in a single JSON file, which
+    is loaded on the first lookup and rewritten atomically by save().
+    """
+
+    def __init__(
+        self,
+        *,
+        cache_path: Path,
+        context: str,
+        max_entries: int = SUPPRESSION_CACHE_MAX_ENTRIES,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_path: JSON file holding the cached entries.
+            context: Digest from suppression_cache_context for this run.
+            max_entries: Maximum number of entries kept when saving.
+
+        """
+        self.cache_path = cache_path
+        self.context = context
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, list[tuple[int, str]]] | None = None
+        self._pending: dict[Path, str] = {}
+
+    def lookup(
+        self, *, files: Sequence[Path], root: Path
+    ) -> tuple[dict[Path, list[tuple[int, str]]], list[Path]]:
+        """Split files into cache hits and misses.
+
+        The keys of missed files are remembered so their results can be added
+        with store() once pylint has linted them.
+
+        Args:
+            files: Files to look up.
+            root: Directory the files' keyed paths are relative to.
+
+        Returns:
+            Tuple of (suppressions of each hit, possibly empty; missed files in
+            their original order).
+
+        """
+        entries = self._load()
+        hits: dict[Path, list[tuple[int, str]]] = {}
+        misses: list[Path] = []
+        for file_path in files:
+            key = self._file_key(file_path=file_path, root=root)
+            if key is not None and key in entries:
+                entries.move_to_end(key)
+                hits[file_path] = list(entries[key])
+                continue
+            if key is not None:
+                self._pending[file_path] = key
+            misses.append(file_path)
+
+        logger.info(
+            "Reusing cached pylint results for %d of %d files", len(hits), len(files)
+        )
+        return hits, misses
+
+    def store(self, *, file_path: Path, suppressions: list[tuple[int, str]]) -> None:
+        """Record the suppressions pylint found in a missed file.
+
+        Files that were not returned as misses by lookup() are ignored.
+
+        Args:
+            file_path: File as passed to lookup().
+            suppressions: Useless suppressions found, as (line, rule) tuples.
+
+        """
+        key = self._pending.pop(file_path, None)
+        if key is None:
+            return
+        entries = self._load()
+        entries[key] = list(suppressions)
+        entries.move_to_end(key)
+
+    def save(self) -> None:
+        """Evict the least recently used entries and write the cache file.
+
+        Failures are logged and otherwise ignored, since the cache is only an
+        optimization.
+        """
+        if self._entries is None:
+            return
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+        data = {
+            "entries": [
+                [key, [list(suppression) for suppression in suppressions]]
+                for key, suppressions in self._entries.items()
+            ],
+            "version": SUPPRESSION_CACHE_VERSION,
+        }
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            write_text_if_changed(
+                content=json.dumps(data, separators=(",", ":")), path=self.cache_path
+            )
+        except OSError as e:
+            logger.debug("Failed to save useless-suppression cache: %s", e)
+
+    def _load(self) -> OrderedDict[str, list[tuple[int, str]]]:
+        """Load the cache file on first use.
+
+        Returns:
+            Entries from least to most recently used, or no entries if the
+            file is missing, unreadable or from another cache version.
+
+        """
+        if self._entries is not None:
+            return self._entries
+
+        self._entries = OrderedDict()
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return self._entries
+        except (OSError, ValueError) as e:
+            logger.debug("Ignoring unreadable useless-suppression cache: %s", e)
+            return self._entries
+
+        if not isinstance(data, dict) or data.get("version") != (
+            SUPPRESSION_CACHE_VERSION
+        ):
+            logger.debug("Ignoring useless-suppression cache with another version")
+            return self._entries
+
+        try:
+            for key, suppressions in data["entries"]:
+                self._entries[str(key)] = [
+                    (int(line), str(rule)) for line, rule in suppressions
+                ]
+        except (KeyError, TypeError, ValueError) as e:
+            logger.debug("Ignoring malformed useless-suppression cache: %s", e)
+            self._entries.clear()
+        return self._entries
+
+    def _file_key(self, *, file_path: Path, root: Path) -> str | None:
+        """Build the cache key for a file's current content.
+
+        Args:
+            file_path: File to key.
+            root: Directory the keyed path is relative to.
+
+        Returns:
+            Hex digest of the context, relative path and content, or None if
+            the file cannot be read.
+
+        """
+        try:
+            content = file_path.read_bytes()
+        except OSError as e:
+            logger.debug("Not caching unreadable file %s: %s", file_path, e)
+            return None
+
+        digest = hashlib.sha256()
+        for part in (self.context, os.path.relpath(file_path, root)):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        digest.update(content)
+        return digest.hexdigest()
@@ -2,22 +2,131 @@
 
 from __future__ import annotations
 
+import contextlib
+import hashlib
 import logging
+import re
 import subprocess
 import tempfile
 import tomllib
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
-
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, cast
+
+from toml_sort import cli as toml_sort_cli
+from toml_sort.tomlsort import (
+    CommentConfiguration,
+    FormattingConfiguration,
+    SortConfiguration,
+    SortOverrideConfiguration,
+    TomlSort,
+)
+
+from .atomic_write import write_text_if_changed
+from .toml_index import TomlIndex
 from .toml_regex import TOML_REGEX
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+    from tomlkit import TOMLDocument
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
 # Constants
 MAX_LINE_LENGTH = 88
 
+# A string item of a multiline array followed by a comment on the same line
+ARRAY_ITEM_COMMENT_PATTERN = re.compile(
+    r'^[ \t]*"((?:[^"\\\n]|\\.)*)"[ \t]*,?[ \t]*#[ \t]*(.*?)[ \t]*$', re.MULTILINE
+)
+
+# Ways of running toml-sort: its Python API, or the toml-sort CLI
+TOML_SORT_BACKENDS = ("library", "subprocess")
+
+
+def apply_toml_sort_library(*, content: str, working_directory: Path) -> str:
+    """Apply toml-sort in-process using its Python API.
+
+    Reads the [tool.tomlsort] configuration from pyproject.toml in the working
+    directory and sorts exactly as 'toml-sort --in-place --ignore-case' run
+    there would.
+
+    Args:
+        content: TOML content to sort.
+        working_directory: Directory whose pyproject.toml configures toml-sort.
+
+    Returns:
+        Sorted TOML content.
+
+    Raises:
+        ValueError: If the [tool.tomlsort] configuration is invalid.
+
+    """
+    if not content.strip():
+        return content
+
+    settings = _load_toml_sort_settings(working_directory=working_directory)
+    try:
+        override_settings = settings.pop("overrides", {})
+        overrides = {
+            path: SortOverrideConfiguration(**override)
+            for path, override in override_settings.items()
+        }
+        # parse_config only needs a mapping, which the tomllib table provides
+        configuration = toml_sort_cli.parse_config(cast("TOMLDocument", settings))
+    except (AttributeError, SystemExit, TypeError) as e:
+        msg = f"Invalid [tool.tomlsort] configuration in {working_directory}"
+        raise ValueError(msg) from e
+
+    # Resolve defaults through the CLI parser so they match toml-sort itself
+    args = toml_sort_cli.get_parser(configuration).parse_args(["--ignore-case"])
+    sort_first, overrides = toml_sort_cli.parse_sort_first(args.sort_first, overrides)
+
+    return TomlSort(
+        comment_config=CommentConfiguration(
+            block=not (args.no_block_comments or args.no_comments),
+            footer=not (args.no_footer_comments or args.no_comments),
+            header=not (args.no_header or args.no_header_comments or args.no_comments),
+            inline=not (args.no_inline_comments or args.no_comments),
+        ),
+        format_config=FormattingConfiguration(
+            spaces_before_inline_comment=args.spaces_before_inline_comment,
+            spaces_indent_inline_array=args.spaces_indent_inline_array,
+            trailing_comma_inline_array=args.trailing_comma_inline_array,
+        ),
+        input_toml=content,
+        sort_config=SortConfiguration(
+            first=sort_first,
+            ignore_case=args.ignore_case,
+            inline_arrays=bool(args.sort_inline_arrays or args.all),
+            inline_tables=bool(args.sort_inline_tables or args.all),
+            table_keys=bool(args.sort_table_keys or args.all),
+            tables=not args.no_sort_tables,
+        ),
+        sort_config_overrides=overrides,
+    ).sorted()
+
+
+def _load_toml_sort_settings(*, working_directory: Path) -> dict[str, Any]:
+    """Load the [tool.tomlsort] section the toml-sort CLI would use.
+
+    Args:
+        working_directory: Directory containing the pyproject.toml to read.
+
+    Returns:
+        The [tool.tomlsort] settings, or an empty dictionary if there are none.
+
+    """
+    try:
+        content = (working_directory / "pyproject.toml").read_text(encoding="utf-8")
+        settings = tomllib.loads(content).get("tool", {}).get("tomlsort", {})
+    except (OSError, tomllib.TOMLDecodeError):
+        return {}
+    return dict(settings)
+
 
 def apply_toml_sort_subprocess(*, content: str, working_directory: Path) -> str:
     """Apply toml-sort using subprocess to properly format TOML content.
@@ -68,6 +177,40 @@ def apply_toml_sort_subprocess(*, content: str, working_directory: Path) -> str:
         raise
 
 
+def _freeze(value: Any) -> Any:  # noqa: ANN401
+    """Convert parsed TOML data into a read-only equivalent.
+
+    Args:
+        value: Value produced by tomllib.
+
+    Returns:
+        The value with tables as read-only mappings and arrays as tuples.
+
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:  # noqa: ANN401
+    """Convert frozen TOML data back into fresh dictionaries and lists.
+
+    Args:
+        value: Value produced by _freeze.
+
+    Returns:
+        A mutable copy, shaped as tomllib.loads would return it.
+
+    """
+    if isinstance(value, MappingProxyType):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
 @dataclass
 class SimpleArrayWithComments:
     """Represents a simple TOML array with optional comments for each item.
@@ -118,13 +261,7 @@ class SimpleArrayWithComments:
 
             # Escape newlines and other special characters in comments
             if comment:
-                # Replace newlines with escaped newlines and remove other
-                # problematic chars
-                comment = (
-                    comment.replace("\n", "\\n")
-                    .replace("\r", "\\r")
-                    .replace("\t", "\\t")
-                )
+                comment = _escape_comment(comment=comment)
 
             if comment:
                 if is_last:
@@ -138,26 +275,125 @@ class SimpleArrayWithComments:
         lines.append("]")
         return "\n".join(lines)
 
+    @classmethod
+    def from_toml(cls, *, text: str) -> SimpleArrayWithComments | None:
+        """Parse a TOML array of strings along with its item comments.
+
+        Args:
+            text: The array as written in a TOML file, for example the value
+                text returned by TomlFile.get_value_text.
+
+        Returns:
+            The parsed array, or None if the text is not an array of strings.
+
+        """
+        try:
+            items = tomllib.loads(f"value = {text}\n")["value"]
+        except tomllib.TOMLDecodeError:
+            return None
+        if not isinstance(items, list) or not all(
+            isinstance(item, str) for item in items
+        ):
+            return None
+
+        comments = {
+            match.group(1): match.group(2)
+            for match in ARRAY_ITEM_COMMENT_PATTERN.finditer(text)
+        }
+        return cls(comments=comments or None, items=items)
+
+    def same_content(self, *, other: SimpleArrayWithComments) -> bool:
+        """Check whether two arrays hold the same items and item comments.
+
+        Layout is ignored, so an array reformatted by toml-sort, for example
+        with trailing commas or different spacing, still has the same content.
+
+        Args:
+            other: Array to compare with.
+
+        Returns:
+            True if the items, their order and their comments all match.
+
+        """
+        return (
+            self.items == other.items
+            and self._item_comments() == other._item_comments()
+        )
+
+    def _item_comments(self) -> dict[str, str]:
+        """Return the non-empty comments of the array's items as written.
+
+        Returns:
+            Mapping of item values to their escaped, stripped comments.
+
+        """
+        comments = self.comments or {}
+        return {
+            item: comment
+            for item in self.items
+            if (comment := _escape_comment(comment=comments.get(item, "")).strip())
+        }
+
+
+def _escape_comment(*, comment: str) -> str:
+    """Escape the characters that would break a single-line TOML comment.
+
+    Args:
+        comment: Comment text.
+
+    Returns:
+        The comment with newlines, carriage returns and tabs escaped.
+
+    """
+    return comment.replace("\n", "\\n").replace("\r", "\\r").replace("\t", "\\t")
+
 
 class TomlFile:
     """Represents a TOML file with in-memory editing capabilities.
 
     This class loads a TOML file once into memory and provides methods to modify
     the in-memory representation. All changes are applied with toml-sort formatting.
-    The file is only written when explicitly requested.
+    The file is only written when explicitly requested, and only if the content
+    changed since it was loaded or last written.
 
     """
 
-    def __init__(self, *, file_path: Path) -> None:
+    def __init__(self, *, file_path: Path, toml_sort_backend: str = "library") -> None:
         """Initialize the TomlFile with content loaded from disk.
 
         Args:
             file_path: Path to the TOML file to load.
+            toml_sort_backend: How to run toml-sort, one of TOML_SORT_BACKENDS.
+
+        Raises:
+            ValueError: If toml_sort_backend is not a known backend.
 
         """
+        if toml_sort_backend not in TOML_SORT_BACKENDS:
+            msg = f"Unknown toml-sort backend: {toml_sort_backend}"
+            raise ValueError(msg)
+
         self.file_path = file_path
+        self.toml_sort_backend = toml_sort_backend
+        self._dirty = False
+        # Read-only parse of the current content, None until first requested
+        self._parsed: Mapping[str, Any] | None = None
+        # Unsorted content accumulated inside batch(), None outside a batch
+        self._pending_content: str | None = None
         self._raw_content = ""
         self._raw_content = self._load_file()
+        # toml-sort results keyed by the SHA-256 of the input content
+        self._sort_cache: dict[str, str] = {}
+
+    @property
+    def is_dirty(self) -> bool:
+        """Whether the content changed since it was loaded or last written.
+
+        Returns:
+            True if write() would update the file, False otherwise.
+
+        """
+        return self._dirty
 
     @property
     def _content(self) -> str:
@@ -177,8 +413,53 @@ class TomlFile:
             value: The new content to set.
 
         """
+        if value == self._raw_content:
+            return
+
         # Apply toml-sort automatically whenever content changes
-        self._raw_content = self._apply_toml_sort(content=value)
+        sorted_content = self._apply_toml_sort(content=value)
+        if sorted_content != self._raw_content:
+            self._raw_content = sorted_content
+            self._parsed = None
+            self._dirty = True
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[None]:
+        """Apply several updates as one transaction.
+
+        Updates made inside the block are spliced into a pending copy of the
+        content. When the block exits, the result is validated and sorted
+        once. If the block raises, or the result is not valid TOML, the
+        content is left unchanged. Reads inside the block see the content
+        from before the batch. Nested batches join the outermost one.
+
+        Yields:
+            None: Control returns to commit the pending updates on exit.
+
+        Raises:
+            tomllib.TOMLDecodeError: If the updated content is invalid TOML.
+
+        """
+        if self._pending_content is not None:
+            yield
+            return
+
+        self._pending_content = self._raw_content
+        try:
+            yield
+            pending = self._pending_content
+        finally:
+            self._pending_content = None
+
+        if pending == self._raw_content:
+            return
+
+        try:
+            tomllib.loads(pending)
+        except tomllib.TOMLDecodeError:
+            logger.exception("Batched TOML updates produced invalid content")
+            raise
+        self._content = pending
 
     def _load_file(self) -> str:
         """Load the TOML file content from disk.
@@ -192,10 +473,12 @@ class TomlFile:
         return self.file_path.read_text(encoding="utf-8")
 
     def _apply_toml_sort(self, *, content: str) -> str:
-        """Apply toml-sort formatting to the content using subprocess.
+        """Apply toml-sort formatting to the content.
 
-        This method uses the toml-sort CLI tool via subprocess, which respects
-        the user's toml-sort configuration in their pyproject.toml file.
+        Both backends respect the user's toml-sort configuration in the
+        pyproject.toml next to the file. Results are memoized by content hash,
+        and since sorting is idempotent each result is also recorded as its own
+        sorted form.
 
         Args:
             content: TOML content to sort.
@@ -204,27 +487,62 @@ class TomlFile:
             Sorted TOML content.
 
         """
-        return apply_toml_sort_subprocess(
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        cached = self._sort_cache.get(digest)
+        if cached is not None:
+            return cached
+
+        sort_function = (
+            apply_toml_sort_subprocess
+            if self.toml_sort_backend == "subprocess"
+            else apply_toml_sort_library
+        )
+        sorted_content = sort_function(
             content=content, working_directory=self.file_path.parent
         )
+        self._sort_cache[digest] = sorted_content
+        sorted_digest = hashlib.sha256(sorted_content.encode("utf-8")).hexdigest()
+        self._sort_cache[sorted_digest] = sorted_content
+        return sorted_content
 
-    def as_dict(self) -> dict[str, Any]:
-        """Return the current file content as a dictionary.
+    def as_mapping(self) -> Mapping[str, Any]:
+        """Return the current file content as a read-only mapping.
+
+        The content is parsed once and reused until it changes. Tables are
+        read-only mappings and arrays are tuples, so callers cannot modify the
+        shared result.
 
         Returns:
-            Dictionary representation of the TOML file.
+            Read-only mapping representation of the TOML file.
 
         Raises:
             tomllib.TOMLDecodeError: If the TOML content is invalid.
 
         """
-        if not self._content.strip():
-            return {}
-        try:
-            return tomllib.loads(self._content)
-        except tomllib.TOMLDecodeError:
-            logger.exception("Failed to parse TOML content")
-            raise
+        if self._parsed is None:
+            if not self._content.strip():
+                self._parsed = MappingProxyType({})
+            else:
+                try:
+                    parsed = tomllib.loads(self._content)
+                except tomllib.TOMLDecodeError:
+                    logger.exception("Failed to parse TOML content")
+                    raise
+                self._parsed = _freeze(parsed)
+        return self._parsed
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the current file content as a dictionary.
+
+        Parsing is shared with as_mapping(); the result is a fresh copy.
+
+        Returns:
+            Mutable dictionary representation of the TOML file, owned by the
+            caller.
+
+        """
+        content: dict[str, Any] = _thaw(self.as_mapping())
+        return content
 
     def as_str(self) -> str:
         """Return the current file content as a string.
@@ -235,6 +553,24 @@ class TomlFile:
         """
         return self._content
 
+    def get_value_text(self, *, key: str, section_path: str) -> str | None:
+        """Return a key's value exactly as written in the current content.
+
+        Args:
+            key: Key within the section.
+            section_path: Dot-separated path to the section.
+
+        Returns:
+            The raw value text, including any comments inside a multiline
+            array, or None if the key is not present.
+
+        """
+        index = TomlIndex(content=self._content)
+        span = index.find_key(key=key, section_path=section_path)
+        if span is None:
+            return None
+        return self._content[span.value_start : span.value_end]
+
     def update_section_array(
         self,
         array_data: list[str] | SimpleArrayWithComments,
@@ -270,9 +606,10 @@ class TomlFile:
         new_value: str,
         section_path: str,
     ) -> None:
-        """Update a specific key in a section using regex replacement.
+        """Update a specific key in a section, adding it if it is missing.
 
-        This method uses the centralized TomlRegex class for all regex operations.
+        This method uses the centralized TomlRegex class, which locates the key
+        with a single index scan and splices in the new value.
 
         Args:
             key: Key within the section to update.
@@ -281,30 +618,36 @@ class TomlFile:
 
         """
         # Work with the current content and only set it once at the end
-        current_content = self._content
+        current_content = (
+            self._content if self._pending_content is None else self._pending_content
+        )
 
-        try:
-            # Try to replace the key using the centralized regex
-            new_content = TOML_REGEX.replace_key_in_section(
-                content=current_content,
-                key=key,
-                new_value=new_value,
-                section_path=section_path,
-            )
-        except ValueError:
-            # Key not found, add it using the centralized regex
-            new_content = TOML_REGEX.add_key_to_section(
-                content=current_content,
-                key=key,
-                section_path=section_path,
-                value=new_value,
-            )
+        # Replaces the key if it exists, otherwise adds it (and its section)
+        new_content = TOML_REGEX.add_key_to_section(
+            content=current_content,
+            key=key,
+            section_path=section_path,
+            value=new_value,
+        )
 
-        # Only set the content once at the end
-        self._content = new_content
+        # Only set the content once at the end, deferring the sort in a batch
+        if self._pending_content is None:
+            self._content = new_content
+        else:
+            self._pending_content = new_content
 
     def write(self) -> None:
-        """Write the current in-memory content to the file with toml-sort formatting."""
+        """Write the current in-memory content to the file with toml-sort formatting.
+
+        Does nothing if the content has not changed, or if the file on disk
+        already holds the same bytes, so its modification time is preserved.
+        Changes are written through a temporary file and an atomic rename.
+        """
+        if not self._dirty:
+            logger.debug("No changes to write to %s", self.file_path)
+            return
+
         # Apply toml-sort before writing
         formatted_content = self._apply_toml_sort(content=self._content)
-        self.file_path.write_text(formatted_content, encoding="utf-8")
+        write_text_if_changed(content=formatted_content, path=self.file_path)
+        self._dirty = False
@@ -0,0 +1,287 @@
+"""Single-pass index of TOML section headers and key-value spans.
+
+The index records where each table header, key and value sits in the raw
+text, so edits can be applied as string splices without regex scans over the
+whole document. Values are scanned with awareness of strings, nested brackets
+and comments, which lets multiline arrays with inline comments be replaced
+as a unit.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+
+# A bare, basic or literal key part, and a dotted key or table path of them
+_KEY_PART = r"""(?:[A-Za-z0-9_-]+|"(?:[^"\\\n]|\\.)*"|'[^'\n]*')"""
+_DOTTED_KEY = rf"{_KEY_PART}(?:[ \t]*\.[ \t]*{_KEY_PART})*"
+_KEY_PARTS = re.compile(_KEY_PART)
+
+# A value that ends on its own line: anything but brackets, comments and
+# unterminated strings, with inner (not trailing) whitespace
+_INLINE_VALUE = (
+    r"""(?:[^\[\]{}"'#\s]|[ \t]+(?=[^\s#])|"(?:[^"\\\n]|\\.)*"|'[^'\n]*')*"""
+)
+_LINE_END = r"[ \t\r]*(?:#[^\n]*)?(?:\n|\Z)"
+
+# One logical line. Values that may continue onto later lines match only up
+# to the start of the value and are finished by TomlIndex._scan_value.
+_LINE = re.compile(
+    r"[ \t]*(?:"
+    r"(?P<blank>\r?(?:\n|\Z))"
+    r"|(?P<comment>#[^\n]*(?:\n|\Z))"
+    rf"|(?P<header>\[\[?)[ \t]*(?P<path>{_DOTTED_KEY})[ \t]*\][^\n]*(?:\n|\Z)"
+    rf"|(?P<key>{_DOTTED_KEY})[ \t]*=[ \t]*"
+    rf"(?:(?P<value>{_INLINE_VALUE}){_LINE_END})?"
+    r")"
+)
+
+# Characters that change the scanner state inside a multiline value
+_VALUE_TOKEN = re.compile(r"[\[\]{}\"'#\n]")
+
+# Strings matched from their opening quote. Unterminated strings run to the
+# end of the line (single-line) or input (multiline), and up to two quotes may
+# directly precede a multiline closing delimiter.
+_BASIC_STRING = re.compile(r'"(?:[^"\\\n]|\\.)*"?')
+_LITERAL_STRING = re.compile(r"'[^'\n]*'?")
+_MULTILINE_BASIC_STRING = re.compile(
+    r'"""(?:[^"\\]|\\.|"(?!""))*(?:"""(?:""?)?|\Z)', re.DOTALL
+)
+_MULTILINE_LITERAL_STRING = re.compile(
+    r"'''(?:[^']|'(?!''))*(?:'''(?:''?)?|\Z)", re.DOTALL
+)
+
+
+@dataclass(frozen=True)
+class KeySpan:
+    """Location of a key-value pair in TOML text.
+
+    Attributes:
+        line_start: Offset of the start of the line holding the key.
+        value_start: Offset of the first character of the value.
+        value_end: Offset just past the last character of the value, excluding
+            any trailing comment.
+
+    """
+
+    line_start: int
+    value_start: int
+    value_end: int
+
+
+@dataclass
+class SectionSpan:
+    """Location of a table and its keys in TOML text.
+
+    Attributes:
+        path: Dot-separated table path, or "" for the root table.
+        header_start: Offset of the table header ('[').
+        content_end: Offset just past the last non-blank line of the table.
+        end: Offset where the next table header starts, or the content length.
+        keys: Key spans in the table by key name, first occurrence only.
+
+    """
+
+    path: str
+    header_start: int
+    content_end: int
+    end: int = 0
+    keys: dict[str, KeySpan] = field(default_factory=dict)
+
+
+class TomlIndex:
+    """Index of the tables and keys in a TOML document, built in one pass.
+
+    The scan is linear in the size of the content: each line is matched once
+    by a single regex, and only values that may span lines are walked token
+    by token. Malformed lines are skipped rather than rejected, since the
+    index is used for editing and validation is left to the TOML parser.
+    """
+
+    def __init__(self, *, content: str) -> None:
+        """Scan the content and build the index.
+
+        Args:
+            content: TOML content to index.
+
+        """
+        self.content = content
+        self.sections: dict[str, SectionSpan] = {}
+        self._scan()
+
+    def find_section(self, *, section_path: str) -> SectionSpan | None:
+        """Find a table by its path.
+
+        Args:
+            section_path: Dot-separated path to the table.
+
+        Returns:
+            The first table with that path, or None if there is none.
+
+        """
+        return self.sections.get(section_path)
+
+    def find_key(self, *, key: str, section_path: str) -> KeySpan | None:
+        """Find a key within a table.
+
+        Args:
+            key: Key name to find.
+            section_path: Dot-separated path to the table.
+
+        Returns:
+            The first occurrence of the key in the table, or None.
+
+        """
+        section = self.sections.get(section_path)
+        if section is None:
+            return None
+        return section.keys.get(key)
+
+    def _scan(self) -> None:
+        """Scan the content line by line, recording tables and keys."""
+        content = self.content
+        length = len(content)
+        current = SectionSpan(content_end=0, header_start=0, path="")
+        # Array-of-tables headers end the previous table but are not indexed
+        indexed = True
+        pos = 0
+
+        while pos < length:
+            line_start = pos
+            line = _LINE.match(content, pos)
+            if line is None:
+                # Not a recognizable TOML line; skip it
+                pos = self._next_line(pos=pos)
+            elif line.group("blank") is not None:
+                pos = line.end()
+                continue
+            elif line.group("header") is not None:
+                pos = line.end()
+                current.end = line_start
+                if indexed:
+                    self.sections.setdefault(current.path, current)
+                indexed = line.group("header") == "["
+                current = SectionSpan(
+                    content_end=pos,
+                    header_start=line_start,
+                    path=self._normalize_dotted(text=line.group("path")),
+                )
+            elif line.group("key") is not None:
+                if line.group("value") is not None:
+                    value_start, value_end = line.span("value")
+                    pos = line.end()
+                else:
+                    value_start = line.end()
+                    value_end, stop = self._scan_value(pos=value_start)
+                    pos = self._next_line(pos=stop)
+                current.keys.setdefault(
+                    self._normalize_dotted(text=line.group("key")),
+                    KeySpan(
+                        line_start=line_start,
+                        value_end=value_end,
+                        value_start=value_start,
+                    ),
+                )
+            else:
+                pos = line.end()
+            current.content_end = pos
+
+        current.end = length
+        if indexed:
+            self.sections.setdefault(current.path, current)
+
+    def _scan_value(self, *, pos: int) -> tuple[int, int]:
+        """Scan a value, following strings, brackets and comments across lines.
+
+        Plain text between the characters that matter is skipped with a single
+        regex search, so long values are not walked one character at a time.
+
+        Args:
+            pos: Offset of the first character of the value.
+
+        Returns:
+            Tuple of (offset just past the value, offset where scanning stopped).
+
+        """
+        content = self.content
+        length = len(content)
+        depth = 0
+        value_end = pos
+
+        while pos < length:
+            match = _VALUE_TOKEN.search(content, pos)
+            stop = match.start() if match else length
+            plain = content[pos:stop].rstrip(" \t\r")
+            if plain.strip():
+                value_end = pos + len(plain)
+            if match is None:
+                pos = length
+                break
+
+            char = match.group()
+            pos = stop
+            if char == "\n":
+                if not depth:
+                    break
+                pos += 1
+            elif char == "#":
+                newline = content.find("\n", pos)
+                pos = length if newline == -1 else newline
+            elif char in "\"'":
+                pos = self._skip_string(pos=pos)
+                value_end = pos
+            else:
+                depth = depth + 1 if char in "[{" else max(depth - 1, 0)
+                pos += 1
+                value_end = pos
+
+        return value_end, pos
+
+    def _skip_string(self, *, pos: int) -> int:
+        """Skip over a basic, literal or multiline string.
+
+        Args:
+            pos: Offset of the opening quote.
+
+        Returns:
+            Offset just past the closing quote, or where an unterminated
+            string ends.
+
+        """
+        content = self.content
+        quote = content[pos]
+        if content.startswith(quote * 3, pos):
+            pattern = (
+                _MULTILINE_BASIC_STRING if quote == '"' else _MULTILINE_LITERAL_STRING
+            )
+        else:
+            pattern = _BASIC_STRING if quote == '"' else _LITERAL_STRING
+
+        match = pattern.match(content, pos)
+        return match.end() if match else len(content)
+
+    def _next_line(self, *, pos: int) -> int:
+        """Find the start of the line after the one containing an offset.
+
+        Args:
+            pos: Offset within the current line.
+
+        Returns:
+            Offset of the next line, or the content length.
+
+        """
+        newline = self.content.find("\n", pos)
+        return len(self.content) if newline == -1 else newline + 1
+
+    @staticmethod
+    def _normalize_dotted(*, text: str) -> str:
+        """Normalize a dotted key or table path by removing spaces around dots.
+
+        Args:
+            text: Dotted key or table path as written.
+
+        Returns:
+            Parts joined with single dots, quoted parts kept as written.
+
+        """
+        return ".".join(_KEY_PARTS.findall(text))
@@ -9,6 +9,12 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 from re import Match, Pattern
+from typing import TYPE_CHECKING
+
+from .toml_index import TomlIndex
+
+if TYPE_CHECKING:
+    from .toml_index import KeySpan
 
 
 @dataclass
@@ -246,9 +252,6 @@ class TomlRegex:
     ) -> bool:
         """Check if a key exists within a section's content.
 
-        This method first finds the section, then checks if the key exists
-        within that section's boundaries.
-
         Args:
             content: TOML content to search.
             key: Key name to check for.
@@ -258,23 +261,18 @@ class TomlRegex:
             True if the key exists in the section, False otherwise.
 
         """
-        # First find the section content
-        section_pattern = self.build_section_content_pattern(section_path=section_path)
-        section_match = section_pattern.search(content)
-
-        if not section_match:
-            return False
-
-        # Then check if key exists within that section
-        section_content = section_match.group(1)
-        key_pattern = self.build_key_exists_in_section_pattern(key=key)
-        return bool(key_pattern.search(section_content))
+        index = TomlIndex(content=content)
+        return index.find_key(key=key, section_path=section_path) is not None
 
     def replace_key_in_section(
         self, content: str, key: str, new_value: str, section_path: str
     ) -> str:
         """Replace a key's value within a specific section.
 
+        The value is located with a single TomlIndex scan and replaced as a
+        string splice, so multiline values and trailing comments are handled
+        without backtracking.
+
         Args:
             content: TOML content to modify.
             key: Key name to replace.
@@ -288,18 +286,13 @@ class TomlRegex:
             ValueError: If the key is not found in the section.
 
         """
-        pattern = self.build_key_in_section_pattern(key=key, section_path=section_path)
-
-        # Check if the pattern matches first
-        if not pattern.search(content):
+        index = TomlIndex(content=content)
+        span = index.find_key(key=key, section_path=section_path)
+        if span is None:
             msg = f"Key '{key}' not found in section '{section_path}'"
             raise ValueError(msg)
 
-        # The replacement preserves everything up to and including "key = "
-        # and replaces everything after with the new value plus a newline
-        replacement = rf"\g<1>{new_value}\n"
-
-        return pattern.sub(replacement, content)
+        return self._splice_value(content=content, new_value=new_value, span=span)
 
     def add_key_to_section(
         self, content: str, key: str, section_path: str, value: str
@@ -319,26 +312,39 @@ class TomlRegex:
             Modified TOML content with the key added.
 
         """
-        # Check if key already exists and replace if so
-        if self.key_exists_in_section(
-            content=content, key=key, section_path=section_path
-        ):
-            return self.replace_key_in_section(
-                content=content, key=key, new_value=value, section_path=section_path
-            )
-
-        # Find the section
-        section_pattern = self.build_section_content_pattern(section_path=section_path)
-        section_match = section_pattern.search(content)
-
-        if section_match:
-            # Section exists, add key to it
-            section_content = section_match.group(1)
-            new_section_content = f"{section_content.rstrip()}\n{key} = {value}\n"
-            return content.replace(section_content, new_section_content, 1)
-        # Section doesn't exist, create it
-        new_section = f"\n[{section_path}]\n{key} = {value}\n"
-        return content + new_section
+        index = TomlIndex(content=content)
+        section = index.find_section(section_path=section_path)
+
+        if section is None:
+            # Section doesn't exist, create it
+            new_section = f"\n[{section_path}]\n{key} = {value}\n"
+            return content + new_section
+
+        span = section.keys.get(key)
+        if span is not None:
+            return self._splice_value(content=content, new_value=value, span=span)
+
+        # Section exists, add the key after its last non-blank line
+        prefix = content[: section.content_end]
+        if not prefix.endswith("\n"):
+            prefix += "\n"
+        return f"{prefix}{key} = {value}\n{content[section.content_end :]}"
+
+    @staticmethod
+    def _splice_value(*, content: str, new_value: str, span: KeySpan) -> str:
+        """Replace the value covered by a key span.
+
+        Args:
+            content: TOML content to modify.
+            new_value: New value for the key.
+            span: Location of the key's current value.
+
+        Returns:
+            Modified TOML content, ending the value's line with a newline.
+
+        """
+        suffix = content[span.value_end :] or "\n"
+        return f"{content[: span.value_start]}{new_value}{suffix}"
 
 
 # Pre-compiled patterns for common operations
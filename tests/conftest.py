@@ -8,6 +8,7 @@ from typing import Protocol
 
 import pytest
 
+from pylint_ruff_sync.command_probe import probe_command
 from tests.constants import TOML_SORT_MIN_ARGS
 
 
@@ -40,6 +41,24 @@ class MockSubprocessResult:
         self.stderr = ""
 
 
+@pytest.fixture(autouse=True)
+def _isolate_user_cache(*, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Keep the persistent user cache inside the test's temporary directory.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture for mocking.
+        tmp_path: Pytest temporary directory fixture.
+
+    """
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "user-cache"))
+
+
+@pytest.fixture(autouse=True)
+def _reset_command_probes() -> None:
+    """Clear memoized command probes so each test sees its own mocks."""
+    probe_command.cache_clear()
+
+
 @pytest.fixture(name="mock_github_response")
 def _mock_github_response() -> str:
     """Mock GitHub CLI response for tests.
@@ -207,3 +226,8 @@ def _mocked_subprocess(
 
     monkeypatch.setattr("subprocess.run", mock_subprocess_run)
     monkeypatch.setattr("shutil.which", mock_shutil_which)
+    # Route pylint rule extraction through the mocked 'pylint --list-msgs'
+    monkeypatch.setattr(
+        "pylint_ruff_sync.pylint_extractor.PylintExtractor._extract_in_process",
+        lambda _self: False,
+    )
@@ -0,0 +1,174 @@
+"""Unit tests for atomic, change-aware file writes."""
+
+from __future__ import annotations
+
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from pylint_ruff_sync import atomic_write
+from pylint_ruff_sync.atomic_write import atomic_write_bytes, write_text_if_changed
+from pylint_ruff_sync.toml_file import TomlFile
+
+# Permission bits that differ from the usual umask defaults
+CUSTOM_MODE = 0o640
+
+# Owner and group that no file in the temporary directory starts with
+OTHER_ID = 54321
+
+
+def test_write_skips_identical_bytes(
+    *, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test a file holding the same bytes is not rewritten.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture for mocking.
+        tmp_path: Pytest temporary directory fixture.
+
+    """
+    path = tmp_path / "pyproject.toml"
+    path.write_bytes(b'[tool.test]\nkey = "value"\n')
+
+    def failing_write(*, data: bytes, path: Path) -> None:
+        msg = f"Unexpected write of {len(data)} bytes to {path}"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(atomic_write, "atomic_write_bytes", failing_write)
+
+    assert not write_text_if_changed(content='[tool.test]\nkey = "value"\n', path=path)
+
+
+def test_write_replaces_changed_file(*, tmp_path: Path) -> None:
+    """Test changed content replaces the file, keeping its permissions.
+
+    Args:
+        tmp_path: Pytest temporary directory fixture.
+
+    """
+    path = tmp_path / "pyproject.toml"
+    path.write_text("old = 1\n", encoding="utf-8")
+    path.chmod(CUSTOM_MODE)
+
+    assert write_text_if_changed(content="new = 2\n", path=path)
+    assert write_text_if_changed(content="created = 3\n", path=tmp_path / "new.toml")
+
+    assert path.read_text(encoding="utf-8") == "new = 2\n"
+    assert stat.S_IMODE(path.stat().st_mode) == CUSTOM_MODE
+    assert sorted(child.name for child in tmp_path.iterdir()) == [
+        "new.toml",
+        "pyproject.toml",
+    ]
+
+
+def test_failed_write_keeps_original(
+    *, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test a failed rename leaves the original file and no temporary file.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture for mocking.
+        tmp_path: Pytest temporary directory fixture.
+
+    """
+    path = tmp_path / "pyproject.toml"
+    path.write_text("old = 1\n", encoding="utf-8")
+
+    def failing_replace(self: Path, target: Path) -> Path:
+        msg = f"Cannot replace {target} with {self}"
+        raise OSError(msg)
+
+    monkeypatch.setattr(Path, "replace", failing_replace)
+
+    with pytest.raises(OSError, match="Cannot replace"):
+        atomic_write_bytes(data=b"new = 2\n", path=path)
+
+    assert path.read_text(encoding="utf-8") == "old = 1\n"
+    assert [child.name for child in tmp_path.iterdir()] == ["pyproject.toml"]
+
+
+def test_write_through_symlink_replaces_target(*, tmp_path: Path) -> None:
+    """Test writing through a symlink updates its target and keeps the link.
+
+    Args:
+        tmp_path: Pytest temporary directory fixture.
+
+    """
+    target = tmp_path / "shared.toml"
+    target.write_text("old = 1\n", encoding="utf-8")
+    link = tmp_path / "pyproject.toml"
+    link.symlink_to(target)
+
+    atomic_write_bytes(data=b"new = 2\n", path=link)
+
+    assert link.is_symlink()
+    assert target.read_text(encoding="utf-8") == "new = 2\n"
+    assert sorted(child.name for child in tmp_path.iterdir()) == [
+        "pyproject.toml",
+        "shared.toml",
+    ]
+
+
+def test_write_keeps_hard_links(*, tmp_path: Path) -> None:
+    """Test a file with other hard links is updated under all its names.
+
+    Args:
+        tmp_path: Pytest temporary directory fixture.
+
+    """
+    path = tmp_path / "pyproject.toml"
+    path.write_text("old = 1\n", encoding="utf-8")
+    other = tmp_path / "linked.toml"
+    other.hardlink_to(path)
+
+    atomic_write_bytes(data=b"new = 2\n", path=path)
+
+    assert other.read_text(encoding="utf-8") == "new = 2\n"
+    assert path.samefile(other)
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "geteuid") or bool(os.geteuid()),
+    reason="changing a file's owner needs root",
+)
+def test_write_keeps_owner(*, tmp_path: Path) -> None:
+    """Test the replacement file gets the original file's owner and group.
+
+    Args:
+        tmp_path: Pytest temporary directory fixture.
+
+    """
+    path = tmp_path / "pyproject.toml"
+    path.write_text("old = 1\n", encoding="utf-8")
+    os.chown(path, OTHER_ID, OTHER_ID)
+
+    atomic_write_bytes(data=b"new = 2\n", path=path)
+
+    status = path.stat()
+    assert (status.st_uid, status.st_gid) == (OTHER_ID, OTHER_ID)
+
+
+def test_toml_file_write_preserves_mtime_when_unchanged(*, tmp_path: Path) -> None:
+    """Test TomlFile.write leaves the file alone when the sorted bytes match.
+
+    Args:
+        tmp_path: Pytest temporary directory fixture.
+
+    """
+    path = tmp_path / "pyproject.toml"
+    path.write_text('[tool.test]\nitems = ["a"]\n', encoding="utf-8")
+
+    toml_file = TomlFile(file_path=path)
+    toml_file.update_section_array(
+        array_data=["b"], key="items", section_path="tool.test"
+    )
+    # Another process writes the same result before this one saves
+    path.write_text(toml_file.as_str(), encoding="utf-8")
+    mtime_ns = path.stat().st_mtime_ns
+
+    toml_file.write()
+
+    assert not toml_file.is_dirty
+    assert path.stat().st_mtime_ns == mtime_ns
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import dataclasses
 import subprocess
+import threading
+from importlib import metadata
 from typing import TYPE_CHECKING
 
 import pytest
+from pylint.lint import PyLinter
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -14,6 +18,11 @@ if TYPE_CHECKING:
 from pylint_ruff_sync.data_collector import DataCollector
 from pylint_ruff_sync.mypy_overlap import MypyOverlapExtractor
 from pylint_ruff_sync.pylint_extractor import PylintExtractor
+from pylint_ruff_sync.pylint_rules_cache import (
+    PYLINT_CACHE_SCHEMA_VERSION,
+    PylintCacheKey,
+    PylintRulesCache,
+)
 from pylint_ruff_sync.ruff_pylint_extractor import RuffPylintExtractor
 from pylint_ruff_sync.rule import Rule, Rules, RuleSource
 from pylint_ruff_sync.rules_cache_manager import RulesCacheManager
@@ -234,6 +243,63 @@ def test_is_online_capable_partial_availability(
     assert not collector._is_online_capable()
 
 
+def test_is_online_capable_probes_concurrently(
+    *, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test both capability probes run at the same time.
+
+    Each probe waits on a barrier that only releases once both are running,
+    so a sequential implementation would time out.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture for mocking.
+        tmp_path: Pytest temporary directory fixture.
+
+    """
+    barrier = threading.Barrier(2, timeout=5)
+
+    def mock_run(*_args: object, **_kwargs: object) -> MockCompletedProcess:
+        barrier.wait()
+        return MockCompletedProcess(returncode=0)
+
+    monkeypatch.setattr(subprocess, "run", mock_run)
+
+    cache_manager = RulesCacheManager(cache_path=tmp_path / "test.json")
+    collector = DataCollector(cache_manager=cache_manager)
+
+    assert collector._is_online_capable()
+
+
+def test_capability_probes_are_memoized(
+    *, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test each probe command runs once and is shared with the extractor.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture for mocking.
+        tmp_path: Pytest temporary directory fixture.
+
+    """
+    commands: list[tuple[str, ...]] = []
+    lock = threading.Lock()
+
+    def mock_run(cmd: tuple[str, ...], **_kwargs: object) -> MockCompletedProcess:
+        with lock:
+            commands.append(cmd)
+        return MockCompletedProcess(returncode=0)
+
+    monkeypatch.setattr(subprocess, "run", mock_run)
+
+    cache_manager = RulesCacheManager(cache_path=tmp_path / "test.json")
+    collector = DataCollector(cache_manager=cache_manager)
+
+    assert collector._is_online_capable()
+    assert collector._is_online_capable()
+    assert RuffPylintExtractor(rules=Rules())._test_github_access()
+
+    assert sorted(commands) == [("gh", "auth", "status"), ("pylint", "--version")]
+
+
 def test_collect_fresh_rules(
     *, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
@@ -254,6 +320,54 @@ def test_collect_fresh_rules(
     assert len(rules.rules) == EXPECTED_MOCK_RULES_COUNT
 
 
+def test_collect_fresh_rules_overlaps_ruff_fetch(
+    *, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test the ruff issue is fetched while pylint rules are extracted.
+
+    Both steps wait on a barrier that only releases once both are running,
+    so running them one after the other would time out.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture for mocking.
+        tmp_path: Pytest temporary directory fixture.
+
+    """
+    barrier = threading.Barrier(2, timeout=5)
+
+    def mock_pylint_extract(self: PylintExtractor) -> None:
+        barrier.wait()
+        self.rules.add_rule(rule=Rule(pylint_id="C0103", pylint_name="invalid-name"))
+
+    def mock_get_all_ruff_rules(_self: RuffPylintExtractor) -> Rules:
+        barrier.wait()
+        return Rules(
+            rules=[
+                Rule(
+                    is_implemented_in_ruff=True,
+                    is_in_ruff_issue=True,
+                    pylint_id="C0103",
+                    ruff_rule="N815",
+                )
+            ]
+        )
+
+    monkeypatch.setattr(PylintExtractor, "extract", mock_pylint_extract)
+    monkeypatch.setattr(
+        RuffPylintExtractor, "get_all_ruff_rules", mock_get_all_ruff_rules
+    )
+    monkeypatch.setattr(MypyOverlapExtractor, "extract", _create_mock_mypy_extract())
+
+    cache_manager = RulesCacheManager(cache_path=tmp_path / "test.json")
+    collector = DataCollector(cache_manager=cache_manager)
+    rules = collector.collect_fresh_rules()
+
+    rule = rules.get_by_name(pylint_name="invalid-name")
+    assert rule is not None
+    assert rule.is_implemented_in_ruff
+    assert rule.ruff_rule == "N815"
+
+
 def test_load_rules_from_cache_success(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
 ) -> None:
@@ -362,13 +476,17 @@ def _create_mock_ruff_extract(
 
     """
 
-    def mock_ruff_extract(self: RuffPylintExtractor) -> None:
+    def mock_ruff_extract(
+        self: RuffPylintExtractor, *, ruff_rules: Rules | None = None
+    ) -> None:
         """Mock ruff extractor.
 
         Args:
             self: RuffPylintExtractor instance.
+            ruff_rules: Prefetched ruff rules (ignored).
 
         """
+        del ruff_rules
         for rule in mock_rules.rules:
             if rule.source == RuleSource.RUFF_ISSUE:
                 # Find existing rule and update it, or add if new
@@ -419,6 +537,9 @@ def setup_extractor_mocks(*, monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(
         RuffPylintExtractor, "extract", _create_mock_ruff_extract(mock_rules)
     )
+    monkeypatch.setattr(
+        RuffPylintExtractor, "get_all_ruff_rules", lambda _self: Rules()
+    )
     monkeypatch.setattr(MypyOverlapExtractor, "extract", _create_mock_mypy_extract())
 
 
@@ -529,3 +650,151 @@ def test_collect_rules_both_fail(
 
     with pytest.raises(ValueError, match="Cache error"):
         collector.collect_rules()
+
+
+def test_collect_fresh_rules_reuses_pylint_rules_cache(
+    *, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test a second collection with an unchanged key skips pylint extraction.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture for mocking.
+        tmp_path: Pytest temporary directory fixture.
+
+    """
+    setup_extractor_mocks(monkeypatch=monkeypatch)
+    extract_calls: list[tuple[str, ...]] = []
+    mock_extract = _create_mock_pylint_extract(mock_rules=create_mock_rules())
+
+    def counting_extract(self: PylintExtractor) -> None:
+        extract_calls.append(self.plugins)
+        mock_extract(self)
+
+    monkeypatch.setattr(PylintExtractor, "extract", counting_extract)
+
+    pylint_cache = PylintRulesCache(cache_dir=tmp_path / "pylint-cache")
+    cache_manager = RulesCacheManager(cache_path=tmp_path / "test.json")
+
+    first = DataCollector(cache_manager=cache_manager, pylint_cache=pylint_cache)
+    first_rules = first.collect_fresh_rules()
+    second = DataCollector(cache_manager=cache_manager, pylint_cache=pylint_cache)
+    second_rules = second.collect_fresh_rules()
+
+    assert extract_calls == [()]
+    assert [rule.pylint_id for rule in second_rules] == [
+        rule.pylint_id for rule in first_rules
+    ]
+    cached_rule = second_rules.get_by_id(pylint_id="C0103")
+    assert cached_rule is not None
+    assert cached_rule.source == RuleSource.PYLINT_LIST
+
+
+def test_pylint_rules_cache_key_mismatch(*, tmp_path: Path) -> None:
+    """Test cached rules are only returned for the key they were saved with.
+
+    Args:
+        tmp_path: Pytest temporary directory fixture.
+
+    """
+    key = PylintCacheKey.current(plugins=())
+    assert key is not None
+    plugin_key = PylintCacheKey.current(plugins=("pylint.extensions.docparams",))
+    assert plugin_key is not None
+    assert key.digest() != plugin_key.digest()
+
+    pylint_cache = PylintRulesCache(cache_dir=tmp_path)
+    pylint_cache.save(key=key, rules=create_mock_rules())
+
+    cached = pylint_cache.load(key=key)
+    assert cached is not None
+    assert len(cached) == EXPECTED_MOCK_RULES_COUNT
+    assert pylint_cache.load(key=plugin_key) is None
+
+
+def test_pylint_rules_cache_key_versions(*, tmp_path: Path) -> None:
+    """Test the key records the schema and plugin distribution versions.
+
+    Args:
+        tmp_path: Pytest temporary directory fixture.
+
+    """
+    key = PylintCacheKey.current(plugins=("pylint.extensions.docparams",))
+    assert key is not None
+    assert key.plugin_versions == (f"pylint=={metadata.version('pylint')}",)
+    assert key.schema_version == PYLINT_CACHE_SCHEMA_VERSION
+
+    # Plugins outside any installed distribution are not cached
+    assert PylintCacheKey.current(plugins=("project_local_plugin",)) is None
+
+    pylint_cache = PylintRulesCache(cache_dir=tmp_path)
+    pylint_cache.save(key=key, rules=create_mock_rules())
+    older_schema = dataclasses.replace(
+        key, schema_version=PYLINT_CACHE_SCHEMA_VERSION - 1
+    )
+    upgraded_plugin = dataclasses.replace(key, plugin_versions=("pylint==0",))
+
+    assert pylint_cache.load(key=key) is not None
+    assert pylint_cache.load(key=older_schema) is None
+    assert pylint_cache.load(key=upgraded_plugin) is None
+
+
+def test_collect_fresh_rules_does_not_cache_degraded_extraction(
+    *, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test rules from the fallback after a failed plugin load are not cached.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture for mocking.
+        tmp_path: Pytest temporary directory fixture.
+
+    """
+    real_extract = PylintExtractor.extract
+    setup_extractor_mocks(monkeypatch=monkeypatch)
+    mock_extract = _create_mock_pylint_extract(mock_rules=create_mock_rules())
+    fallback_calls: list[tuple[str, ...]] = []
+
+    def failing_plugin_load(_self: object, _modules: list[str]) -> None:
+        msg = "broken plugin"
+        raise ImportError(msg)
+
+    def fallback(self: PylintExtractor) -> None:
+        fallback_calls.append(self.plugins)
+        mock_extract(self)
+
+    monkeypatch.setattr(PylintExtractor, "extract", real_extract)
+    monkeypatch.setattr(PyLinter, "load_plugin_modules", failing_plugin_load)
+    monkeypatch.setattr(PylintExtractor, "_extract_from_subprocess", fallback)
+
+    pylint_cache = PylintRulesCache(cache_dir=tmp_path / "pylint-cache")
+    cache_manager = RulesCacheManager(cache_path=tmp_path / "test.json")
+    for _attempt in range(2):
+        collector = DataCollector(
+            cache_manager=cache_manager, pylint_cache=pylint_cache
+        )
+        assert len(collector.collect_fresh_rules())
+
+    assert fallback_calls == [(), ()]
+    assert not (tmp_path / "pylint-cache").exists()
+
+
+def test_configured_plugins(*, tmp_path: Path) -> None:
+    """Test reading load-plugins from the pylint configuration.
+
+    Args:
+        tmp_path: Pytest temporary directory fixture.
+
+    """
+    config_file = tmp_path / "pyproject.toml"
+    cache_manager = RulesCacheManager(cache_path=tmp_path / "test.json")
+    collector = DataCollector(cache_manager=cache_manager, config_file=config_file)
+    assert not collector._configured_plugins()
+
+    config_file.write_text(
+        '[tool.pylint.main]\nload-plugins = ["pylint.extensions.docparams"]\n'
+    )
+    assert collector._configured_plugins() == ("pylint.extensions.docparams",)
+
+    config_file.write_text(
+        '[tool.pylint.MASTER]\nload-plugins = "plugin_a, plugin_b"\n'
+    )
+    assert collector._configured_plugins() == ("plugin_a", "plugin_b")
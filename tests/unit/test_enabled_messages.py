@@ -0,0 +1,76 @@
+"""Unit tests for resolving the messages a pylint configuration enables."""
+
+from __future__ import annotations
+
+import subprocess
+from typing import TYPE_CHECKING
+
+from pylint_ruff_sync.enabled_messages import enabled_messages
+from tests.conftest import MockSubprocessResult
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+# Trimmed output of 'pylint --list-msgs-enabled'
+LIST_MSGS_ENABLED_OUTPUT = """\
+Enabled messages:
+  invalid-name (C0103)
+  useless-suppression (I0021)
+
+Disabled messages:
+  unused-import (W0611)
+
+Non-emittable messages with current interpreter:
+  return-arg-in-generator (E0106)
+"""
+
+
+def test_enabled_messages_reads_enabled_section(
+    *, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test only the names and ids of enabled messages are returned.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture for mocking.
+        tmp_path: Pytest temporary directory fixture.
+
+    """
+    commands: list[list[str]] = []
+
+    def mock_run(cmd: list[str], **_kwargs: object) -> MockSubprocessResult:
+        commands.append(cmd)
+        return MockSubprocessResult(stdout=LIST_MSGS_ENABLED_OUTPUT)
+
+    monkeypatch.setattr(subprocess, "run", mock_run)
+    config_file = tmp_path / "pyproject.toml"
+
+    assert enabled_messages(config_file=config_file, cwd=tmp_path) == {
+        "C0103",
+        "I0021",
+        "invalid-name",
+        "useless-suppression",
+    }
+    assert commands[0][-3:] == ["--rcfile", str(config_file), "--list-msgs-enabled"]
+
+
+def test_enabled_messages_returns_none_when_pylint_fails(
+    *, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test a failing pylint leaves the enabled messages unresolved.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture for mocking.
+        tmp_path: Pytest temporary directory fixture.
+
+    """
+
+    def mock_run(cmd: list[str], **_kwargs: object) -> MockSubprocessResult:
+        raise subprocess.CalledProcessError(returncode=32, cmd=cmd)
+
+    monkeypatch.setattr(subprocess, "run", mock_run)
+
+    assert (
+        enabled_messages(config_file=tmp_path / "pyproject.toml", cwd=tmp_path) is None
+    )
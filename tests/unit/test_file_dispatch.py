@@ -0,0 +1,78 @@
+"""Unit tests for git file listing and command-line batching."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pylint_ruff_sync import file_dispatch
+from pylint_ruff_sync.file_dispatch import (
+    command_length,
+    command_line_limit,
+    git_python_files,
+    split_batches,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Argument space for the small batches built in these tests
+BATCH_LIMIT = 60
+
+# Size of an environment variable that eats into the argument space
+LARGE_VALUE_SIZE = 50000
+
+
+def test_git_python_files_handles_unusual_names(tmp_path: Path) -> None:
+    """Test names with spaces, newlines and non-ASCII characters survive listing.
+
+    Args:
+        tmp_path: Pytest temporary directory fixture.
+
+    """
+    names = ["plain.py", "with space.py", "new\nline.py", "ünïcode.py", "notes.txt"]
+    for name in names:
+        (tmp_path / name).write_text("x = 1\n")
+    subprocess.run(["git", "init", "-q"], check=True, cwd=tmp_path)  # noqa: S607
+    subprocess.run(["git", "add", "."], check=True, cwd=tmp_path)  # noqa: S607
+
+    listed = git_python_files(args=["ls-files", "-z"], cwd=tmp_path)
+
+    assert sorted(listed) == sorted(tmp_path / name for name in names[:-1])
+    assert not git_python_files(args=["ls-files", "-z"], cwd=tmp_path / "missing")
+
+
+def test_split_batches_respects_limit() -> None:
+    """Test batches stay under the limit, keep order and isolate huge items."""
+    items = ["a" * 10, "b" * 20, "c" * 5, "d" * 100, "e" * 15, "f" * 10]
+
+    batches = split_batches(items=items, limit=BATCH_LIMIT, to_argument=str)
+
+    assert [item for batch in batches for item in batch] == items
+    assert ["d" * 100] in batches
+    for batch in batches:
+        assert len(batch) == 1 or command_length(args=batch) <= BATCH_LIMIT
+    assert not split_batches(items=[], limit=BATCH_LIMIT, to_argument=str)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Windows has a fixed limit")
+def test_command_line_limit_accounts_for_environment(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test the environment's size is subtracted from the argument space.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture for mocking.
+
+    """
+    base = command_line_limit()
+    assert 0 < base < os.sysconf("SC_ARG_MAX")
+
+    monkeypatch.setenv("LARGE_VALUE", "x" * LARGE_VALUE_SIZE)
+    assert command_line_limit() <= base - LARGE_VALUE_SIZE
+
+    monkeypatch.setattr(os, "sysconf", lambda _name: -1)
+    assert command_line_limit() < file_dispatch.DEFAULT_ARG_MAX
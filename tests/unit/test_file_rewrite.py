@@ -0,0 +1,77 @@
+"""Unit tests for rewriting files in a bounded thread pool."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from pylint_ruff_sync.file_rewrite import rewrite_files
+
+# Threads in the pool for the concurrency tests
+WORKERS = 2
+
+# Jobs submitted in the concurrency tests, several per worker
+JOB_COUNT = 12
+
+# Job whose rewrite reports this many modified lines
+EXAMPLE_INDEX = 3
+
+# Seconds a rewrite waits for another to run alongside it
+BARRIER_TIMEOUT = 5.0
+
+
+def test_rewrite_files_reports_every_job() -> None:
+    """Test each job yields its path, modified lines and a timing."""
+    jobs = [(Path(f"file{index}.py"), index) for index in range(JOB_COUNT)]
+
+    results = list(
+        rewrite_files(
+            jobs=jobs,
+            rewrite=lambda _path, index: index or None,
+        )
+    )
+
+    assert sorted(result.file_path for result in results) == sorted(
+        path for path, _index in jobs
+    )
+    by_path = {result.file_path: result for result in results}
+    assert by_path[Path("file0.py")].modified_lines is None
+    assert by_path[Path(f"file{EXAMPLE_INDEX}.py")].modified_lines == EXAMPLE_INDEX
+    assert all(result.seconds >= 0 for result in results)
+
+
+def test_rewrite_files_runs_jobs_concurrently_within_bound() -> None:
+    """Test rewrites overlap but never exceed the worker count."""
+    barrier = threading.Barrier(WORKERS, timeout=BARRIER_TIMEOUT)
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def rewrite(_path: Path, _data: None) -> int:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        # Only returns once another rewrite has reached the same point
+        barrier.wait()
+        with lock:
+            running -= 1
+        return 1
+
+    jobs = [(Path(f"file{index}.py"), None) for index in range(JOB_COUNT)]
+    results = list(rewrite_files(jobs=jobs, max_workers=WORKERS, rewrite=rewrite))
+
+    assert len(results) == JOB_COUNT
+    assert peak == WORKERS
+
+
+def test_rewrite_files_propagates_errors() -> None:
+    """Test an unexpected error in a rewrite is raised to the caller."""
+
+    def rewrite(path: Path, _data: None) -> int:
+        raise ValueError(path.name)
+
+    with pytest.raises(ValueError, match="broken"):
+        list(rewrite_files(jobs=[(Path("broken.py"), None)], rewrite=rewrite))
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+import shutil
+import subprocess
 import sys
 import tempfile
 from pathlib import Path
@@ -12,9 +14,10 @@ import pytest
 from pylint_ruff_sync.constants import RUFF_PYLINT_ISSUE_URL
 from pylint_ruff_sync.main import _setup_argument_parser, main
 from pylint_ruff_sync.pylint_extractor import PylintExtractor
-from pylint_ruff_sync.pyproject_updater import PyprojectUpdater
+from pylint_ruff_sync.pyproject_updater import PyprojectUpdater, RuleFormat
 from pylint_ruff_sync.ruff_pylint_extractor import RuffPylintExtractor
-from pylint_ruff_sync.rule import Rule, Rules
+from pylint_ruff_sync.rule import Rule, Rules, RuleSource
+from tests.conftest import MockSubprocessResult
 from tests.constants import (
     EXPECTED_IMPLEMENTED_RULES_COUNT,
     EXPECTED_RULES_COUNT,
@@ -23,6 +26,9 @@ from tests.constants import (
 # Constants for test expectations
 EXPECTED_DISABLE_LIST_LENGTH = 3
 
+# Worker count passed on the command line in argument parsing tests
+EXPECTED_JOBS = 4
+
 # We expect 6 mock rules total in our test setup
 EXPECTED_MOCK_RULES_COUNT = 6
 
@@ -73,6 +79,91 @@ def test_extract_all_rules() -> None:
     assert rule_list[5].name == "too-few-public-methods"
 
 
+def test_extract_all_rules_in_process() -> None:
+    """Test extracting pylint rules from pylint's message store in-process."""
+    rules = Rules()
+    extractor = PylintExtractor(rules=rules)
+    assert extractor._extract_in_process()
+
+    invalid_name = rules.get_by_id(pylint_id="C0103")
+    assert invalid_name is not None
+    assert invalid_name.pylint_name == "invalid-name"
+    assert invalid_name.scope
+    assert invalid_name.source == RuleSource.PYLINT_LIST
+
+    # Fields that the --list-msgs text output does not carry
+    deprecated_pragma = rules.get_by_name(pylint_name="deprecated-pragma")
+    assert deprecated_pragma is not None
+    assert deprecated_pragma.old_pylint_ids
+
+    # Descriptions are single line, like the --list-msgs output
+    assert all("\n" not in rule.description for rule in rules)
+
+
+def test_extract_falls_back_to_subprocess(
+    *,
+    mock_pylint_output: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test extraction falls back to 'pylint --list-msgs' without importable pylint.
+
+    Args:
+        mock_pylint_output: Mock pylint output.
+        monkeypatch: Pytest monkeypatch fixture for mocking.
+
+    """
+    commands: list[list[str]] = []
+
+    def mock_run(cmd: list[str], **_kwargs: object) -> MockSubprocessResult:
+        commands.append(cmd)
+        return MockSubprocessResult(stdout=mock_pylint_output)
+
+    monkeypatch.setitem(sys.modules, "pylint.lint", None)
+    monkeypatch.setattr(subprocess, "run", mock_run)
+
+    rules = Rules()
+    PylintExtractor(rules=rules).extract()
+
+    assert commands == [["pylint", "--list-msgs"]]
+    assert len(rules) == EXPECTED_RULES_COUNT
+
+
+def test_parse_list_msgs_keeps_untitled_messages() -> None:
+    """Test messages listed without a title are described by their help text."""
+    output = """Emittable messages with current interpreter:
+:syntax-error (E0001):
+  Used when a syntax error is raised for a module. This message belongs to
+  the basic checker.
+:invalid-name (C0103): *%s name "%s" doesn't conform to %s*
+  Used when the name doesn't conform to naming rules.
+"""
+
+    rules = PylintExtractor._parse_list_msgs(output=output)
+
+    assert [(rule.pylint_id, rule.pylint_name) for rule in rules] == [
+        ("E0001", "syntax-error"),
+        ("C0103", "invalid-name"),
+    ]
+    assert rules[0].description == (
+        "Used when a syntax error is raised for a module. This message belongs"
+        " to the basic checker."
+    )
+    assert rules[1].description == '%s name "%s" doesn\'t conform to %s'
+
+
+@pytest.mark.skipif(shutil.which("pylint") is None, reason="pylint is not on PATH")
+def test_extract_paths_agree_on_real_pylint() -> None:
+    """Test in-process and 'pylint --list-msgs' extraction find the same rules."""
+    in_process = Rules()
+    assert PylintExtractor(rules=in_process)._extract_in_process()
+    listed = Rules()
+    PylintExtractor(rules=listed)._extract_from_subprocess()
+
+    assert {
+        (rule.pylint_id, rule.pylint_name, rule.description) for rule in listed
+    } == {(rule.pylint_id, rule.pylint_name, rule.description) for rule in in_process}
+
+
 def test_update_pylint_config() -> None:
     """Test updating pylint configuration."""
     # Create a temporary file for testing
@@ -176,6 +267,104 @@ def test_update_pylint_config_dry_run() -> None:
         temp_path.unlink()
 
 
+def test_update_skips_unchanged_configuration(
+    *, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test a second update with the same rules does not edit, sort or write.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture for mocking.
+        tmp_path: Temporary path for the test file.
+
+    """
+    config_file = tmp_path / "pyproject.toml"
+    config_file.write_text('[project]\nname = "demo"\n', encoding="utf-8")
+
+    rules = Rules()
+    rules.add_rule(
+        rule=Rule(
+            description="Invalid name",
+            pylint_id="C0103",
+            pylint_name="invalid-name",
+        )
+    )
+    rules.add_rule(
+        rule=Rule(
+            description="Unused import",
+            is_implemented_in_ruff=True,
+            pylint_id="W0611",
+            pylint_name="unused-import",
+        )
+    )
+
+    PyprojectUpdater(config_file=config_file, rules=rules).update()
+    written = config_file.read_text(encoding="utf-8")
+    assert "C0103" in written
+
+    def failing_edit(**kwargs: object) -> None:
+        msg = f"Unexpected edit: {kwargs}"
+        raise AssertionError(msg)
+
+    updater = PyprojectUpdater(config_file=config_file, rules=rules)
+    monkeypatch.setattr(updater.toml_file, "update_section_array", failing_edit)
+    monkeypatch.setattr(updater.toml_file, "write", failing_edit)
+    updater.update()
+
+    assert config_file.read_text(encoding="utf-8") == written
+
+    # A changed comment format is a change even though the items are the same
+    updater = PyprojectUpdater(
+        config_file=config_file,
+        rule_format=RuleFormat(comment_type="name"),
+        rules=rules,
+    )
+    updater.update()
+    assert 'C0103" # invalid-name' in config_file.read_text(encoding="utf-8")
+
+
+def test_update_skips_configuration_reformatted_by_toml_sort(
+    *, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test arrays reformatted by the user's toml-sort settings are up to date.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture for mocking.
+        tmp_path: Temporary path for the test file.
+
+    """
+    config_file = tmp_path / "pyproject.toml"
+    config_file.write_text(
+        '[project]\nname = "demo"\n\n'
+        "[tool.tomlsort]\ntrailing_comma_inline_array = true\n",
+        encoding="utf-8",
+    )
+
+    rules = Rules()
+    rules.add_rule(
+        rule=Rule(
+            description="Invalid name",
+            pylint_id="C0103",
+            pylint_name="invalid-name",
+        )
+    )
+
+    PyprojectUpdater(config_file=config_file, rules=rules).update()
+    written = config_file.read_text(encoding="utf-8")
+    # toml-sort adds a trailing comma that the updater itself never writes
+    assert '"C0103", #' in written
+
+    def failing_edit(**kwargs: object) -> None:
+        msg = f"Unexpected edit: {kwargs}"
+        raise AssertionError(msg)
+
+    updater = PyprojectUpdater(config_file=config_file, rules=rules)
+    monkeypatch.setattr(updater.toml_file, "update_section_array", failing_edit)
+    monkeypatch.setattr(updater.toml_file, "write", failing_edit)
+    updater.update()
+
+    assert config_file.read_text(encoding="utf-8") == written
+
+
 def test_main_argument_parsing() -> None:
     """Test that main function parses arguments correctly."""
     # Test that the argument parser is set up correctly by testing the dry run flag
@@ -193,6 +382,24 @@ def test_main_argument_parsing() -> None:
     args = parser.parse_args(["--config-file", "custom.toml"])
     assert args.config_file == Path("custom.toml")
 
+    # Test targeted cleaner argument
+    assert not parser.parse_args([]).cleaner_targeted
+    assert parser.parse_args(["--cleaner-targeted"]).cleaner_targeted
+
+    # Test cleaner worker count argument
+    assert parser.parse_args([]).cleaner_jobs is None
+    assert parser.parse_args(["--cleaner-jobs", "4"]).cleaner_jobs == EXPECTED_JOBS
+
+    # Test cleaner result cache argument
+    assert not parser.parse_args([]).cleaner_cache
+    assert parser.parse_args(["--cleaner-cache"]).cleaner_cache
+
+    # Test incremental cleaner arguments
+    args = parser.parse_args(["--cleaner-since", "main", "a.py", "b.py"])
+    assert args.cleaner_since == "main"
+    assert args.files == [Path("a.py"), Path("b.py")]
+    assert not parser.parse_args([]).files
+
 
 def test_resolve_rule_identifiers() -> None:
     """Test resolving rule identifiers to rule codes."""
@@ -0,0 +1,97 @@
+"""Unit tests for locating pylint pragmas in comments."""
+
+from __future__ import annotations
+
+from pylint_ruff_sync.pragma_locator import (
+    PragmaLocator,
+    comment_columns,
+    find_comment_start,
+    find_pragma,
+)
+
+# Line a disable-next pragma on the line above applies to
+TARGET_LINE = 2
+
+# Last line of the suppression_line test file, with its own disable pragma
+LAST_LINE = 4
+
+
+def test_find_pragma_kinds() -> None:
+    """Test every supported pragma kind is recognized with its rules."""
+    cases = {
+        "x = 1  # pylint: disable=invalid-name": ("disable", ("invalid-name",)),
+        "# pylint: disable-next=C0103, W0613": ("disable-next", ("C0103", "W0613")),
+        "# noqa: E501  # pylint:enable=eval-used": ("enable", ("eval-used",)),
+        "# pylint: skip-file": ("skip-file", ()),
+        "import os  # pylint: disable=unused-import,": ("disable", ("unused-import",)),
+        "# pylint: disable=C0103, W0613 ,": ("disable", ("C0103", "W0613")),
+    }
+    for line, (kind, rules) in cases.items():
+        pragma = find_pragma(line=line)
+        assert pragma is not None, line
+        assert (pragma.kind, pragma.rules) == (kind, rules)
+        assert line[pragma.start :].startswith("pylint:")
+        # Every pragma above ends its line, trailing separators included
+        assert pragma.end == len(line), line
+
+    assert find_pragma(line="x = 1  # just a comment") is None
+    assert find_pragma(line="x = 1") is None
+
+
+def test_find_comment_start_skips_strings() -> None:
+    """Test "#" characters inside string literals do not start a comment."""
+    commented = [
+        'x = "#"  # c',
+        "x = '#' + \"it's\"  # c",
+        'x = """# not a comment"""  # c',
+        r'x = "\"#"  # c',
+    ]
+    for line in commented:
+        assert find_comment_start(line=line) == line.rindex("# c"), line
+
+    assert find_comment_start(line='x = "# unterminated') is None
+    assert find_comment_start(line="x = 1") is None
+    assert find_pragma(line='x = "# pylint: disable=invalid-name"') is None
+
+
+def test_comment_columns_follow_multiline_strings() -> None:
+    """Test the tokenizer finds comments after a multiline string ends."""
+    content = 'text = """\n# pylint: disable=a\n"""  # pylint: disable=b\n'
+
+    columns = comment_columns(content=content)
+
+    assert columns == {3: 5}
+    locator = PragmaLocator(content=content)
+    lines = content.splitlines()
+    # A line scan misreads lines that start inside a multiline string
+    assert find_pragma(line=lines[2]) is None
+    pragma = locator.find(line=lines[2], line_number=3)
+    assert pragma is not None
+    assert pragma.rules == ("b",)
+    assert locator.find(line=lines[0], line_number=1) is None
+    assert comment_columns(content="x = (\n") is None
+
+
+def test_suppression_line_maps_disable_next_to_its_pragma() -> None:
+    """Test findings on a disable-next target line move to the pragma line."""
+    locator = PragmaLocator(
+        content=(
+            "# pylint: disable-next=eval-used\n"
+            "x = eval('1')\n"
+            "# pylint: disable-next=eval-used\n"
+            "y = eval('2')  # pylint: disable=eval-used\n"
+        )
+    )
+    eval_used = {"eval-used", "W0123"}
+
+    assert locator.suppression_line(line_number=TARGET_LINE, rules=eval_used) == 1
+    # The reported line's own pragma takes precedence
+    assert locator.suppression_line(line_number=LAST_LINE, rules=eval_used) == LAST_LINE
+    # Other rules, and findings on a pragma's own line, stay put
+    assert (
+        locator.suppression_line(line_number=TARGET_LINE, rules={"invalid-name"})
+        == TARGET_LINE
+    )
+    assert locator.suppression_line(line_number=1, rules=eval_used) == 1
+    assert locator.find_line(line_number=0) is None
+    assert locator.find_line(line_number=LAST_LINE + 1) is None
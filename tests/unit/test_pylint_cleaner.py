@@ -2,15 +2,26 @@
 
 from __future__ import annotations
 
+import os
+import subprocess
+import sys
 import textwrap
+import threading
 from pathlib import Path
-from typing import Self
+from typing import TYPE_CHECKING, Self
 
 import pytest
 
+from pylint_ruff_sync import pylint_cleaner as pylint_cleaner_module
+from pylint_ruff_sync.file_dispatch import command_length
 from pylint_ruff_sync.pylint_cleaner import DisableComment, PylintCleaner
 from pylint_ruff_sync.rule import Rule, Rules, RuleSource
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from pylint_ruff_sync.pylint_cleaner import FileSuppressions
+
 
 class LongStr(str):
     """Helper class for creating clean multiline strings in tests.
@@ -39,6 +50,71 @@ class LongStr(str):
         return super().__new__(cls, cleaned)
 
 
+class FakePopen:
+    """Stand-in for subprocess.Popen that replays canned pylint output."""
+
+    def __init__(
+        self, *, lines: list[str], hang: bool = False, returncode: int = 0
+    ) -> None:
+        """Initialize the fake process.
+
+        Args:
+            lines: Lines of output to produce.
+            hang: Whether to block after the output until the process is killed.
+            returncode: Exit status of the process.
+
+        """
+        self.killed = threading.Event()
+        self.returncode = returncode
+        self.stdout = self._read(hang=hang, lines=lines)
+
+    def __enter__(self) -> Self:
+        """Enter the process context.
+
+        Returns:
+            The fake process.
+
+        """
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Leave the process context.
+
+        Args:
+            *args: Exception details, ignored.
+
+        """
+
+    def _read(self, *, hang: bool, lines: list[str]) -> Iterator[str]:
+        """Produce the output lines, hanging until killed if requested.
+
+        Args:
+            hang: Whether to block after the output until killed.
+            lines: Lines of output to produce.
+
+        Yields:
+            str: Lines of output.
+
+        """
+        yield from lines
+        if hang:
+            self.killed.wait()
+
+    def kill(self) -> None:
+        """Kill the fake process."""
+        self.killed.set()
+        self.returncode = -9
+
+    def wait(self) -> int:
+        """Wait for the fake process.
+
+        Returns:
+            The exit status.
+
+        """
+        return self.returncode
+
+
 @pytest.fixture
 def mock_rules() -> Rules:
     """Create a mock Rules object for testing.
@@ -114,6 +190,32 @@ def pylint_cleaner(tmp_path: Path, mock_rules: Rules) -> PylintCleaner:
     )
 
 
+def read_pylint_output(
+    *, cleaner: PylintCleaner, output: str
+) -> dict[Path, list[tuple[int, str]]]:
+    """Read complete pylint output the way the cleaner reads a shard's output.
+
+    Args:
+        cleaner: Cleaner reading the output.
+        output: Pylint output.
+
+    Returns:
+        Useless suppressions of each file, including the last file reported.
+
+    """
+    results: dict[Path, list[tuple[int, str]]] = {}
+
+    def on_complete(suppressions: FileSuppressions) -> None:
+        results[suppressions[0]] = suppressions[1]
+
+    _completed, last = cleaner._read_pylint_output(
+        lines=output.splitlines(), on_complete=on_complete
+    )
+    if last is not None:
+        on_complete(last)
+    return results
+
+
 @pytest.fixture
 def pylint_cleaner_dry_run(tmp_path: Path, mock_rules: Rules) -> PylintCleaner:
     """Create a PylintCleaner instance for dry-run testing.
@@ -161,24 +263,6 @@ def test_disable_comment_dataclass() -> None:
     assert comment.comment_format == "inline"
 
 
-def test_compile_disable_patterns(
-    pylint_cleaner: PylintCleaner,
-) -> None:
-    """Test that disable patterns are compiled correctly.
-
-    Args:
-        pylint_cleaner: PylintCleaner instance.
-
-    """
-    patterns = pylint_cleaner._disable_patterns
-    assert len(patterns) > 0
-
-    # Test that patterns can match basic disable comments
-    test_line = "x = eval('1')  # pylint: disable=eval-used"
-    matched = any(pattern.match(test_line) for pattern in patterns)
-    assert matched
-
-
 def test_parse_disable_comment_simple(
     pylint_cleaner: PylintCleaner,
 ) -> None:
@@ -265,6 +349,104 @@ def test_parse_disable_comment_skip_file(
     assert comment.comment_format == "skip-file"
 
 
+def test_remove_useless_disables_ignores_hash_in_strings(
+    pylint_cleaner: PylintCleaner,
+) -> None:
+    """Test "#" in strings is kept and pragma kinds and positions are respected.
+
+    Args:
+        pylint_cleaner: PylintCleaner instance.
+
+    """
+    content = LongStr(
+        content='''
+        color = "#fff"  # pylint: disable=invalid-name,unused-variable
+        # pylint: disable-next=eval-used,invalid-name
+        x = eval("'#'")
+        text = """
+        # pylint: disable=not-a-comment
+        """  # pylint: disable=invalid-name
+        '''
+    )
+
+    # Pylint reports the disable-next pragma on the line it applies to, and
+    # the last line starts inside a string, so only the tokenizer finds its
+    # comment
+    useless_suppressions = [(1, "invalid-name"), (3, "eval-used"), (6, "invalid-name")]
+    result, modified = pylint_cleaner._remove_useless_disables(
+        content=content,
+        file_path=Path("test.py"),
+        useless_suppressions=useless_suppressions,
+    )
+
+    assert modified == len(useless_suppressions)
+    lines = result.splitlines()
+    assert lines[:2] == [
+        'color = "#fff"  # pylint: disable=unused-variable',
+        "# pylint: disable-next=invalid-name",
+    ]
+    assert lines[4:] == ["# pylint: disable=not-a-comment", '"""']
+
+
+def test_remove_useless_disables_with_trailing_comma(
+    pylint_cleaner: PylintCleaner,
+) -> None:
+    """Test a trailing comma after the rules is removed along with them.
+
+    Args:
+        pylint_cleaner: PylintCleaner instance.
+
+    """
+    content = LongStr(
+        content="""
+        import os  # pylint: disable=unused-import,
+        import re  # pylint: disable=unused-import, invalid-name ,
+        """
+    )
+
+    result, modified = pylint_cleaner._remove_useless_disables(
+        content=content,
+        file_path=Path("test.py"),
+        useless_suppressions=[(1, "unused-import"), (2, "invalid-name")],
+    )
+
+    assert modified == EXPECTED_SUPPRESSION_COUNT
+    assert result.splitlines() == [
+        "import os",
+        "import re  # pylint: disable=unused-import",
+    ]
+
+
+def test_remove_useless_disable_next_reported_on_next_line(
+    pylint_cleaner: PylintCleaner,
+) -> None:
+    """Test disable-next findings, reported on the line below, reach the pragma.
+
+    Args:
+        pylint_cleaner: PylintCleaner instance.
+
+    """
+    content = LongStr(
+        content="""
+        # pylint: disable-next=eval-used
+        x = 1
+        # pylint: disable-next=C0103
+        y = 2  # pylint: disable=invalid-name
+        """
+    )
+
+    # Findings as pylint reports them, with the first pragma's on line 2; the
+    # one on line 4 belongs to that line's own disable pragma
+    result, modified = pylint_cleaner._remove_useless_disables(
+        content=content,
+        file_path=Path("test.py"),
+        useless_suppressions=[(2, "eval-used"), (4, "invalid-name")],
+    )
+
+    assert modified == EXPECTED_SUPPRESSION_COUNT
+    assert result.splitlines() == ["x = 1", "# pylint: disable-next=C0103", "y = 2"]
+
+
 def test_remove_useless_rules_partial(
     pylint_cleaner: PylintCleaner,
 ) -> None:
@@ -388,7 +570,7 @@ def test_remove_useless_rules_skip_file(
     assert result is None
 
 
-def test_parse_pylint_output(
+def test_read_pylint_output(
     pylint_cleaner: PylintCleaner,
 ) -> None:
     """Test parsing pylint useless-suppression output.
@@ -405,7 +587,7 @@ def test_parse_pylint_output(
     """
     )
 
-    result = pylint_cleaner._parse_pylint_output(output=output)
+    result = read_pylint_output(cleaner=pylint_cleaner, output=output)
 
     assert len(result) == EXPECTED_FILE_COUNT  # Two files
     # Paths are now absolute relative to project root
@@ -445,8 +627,8 @@ def test_clean_files_dry_run(
     mock_suppressions = {test_file: [(1, "eval-used")]}
     monkeypatch.setattr(
         pylint_cleaner_dry_run,
-        "_detect_useless_suppressions",
-        lambda: mock_suppressions,
+        "_iter_useless_suppressions",
+        lambda: iter(mock_suppressions.items()),
     )
 
     # Run in dry-run mode
@@ -482,8 +664,8 @@ def test_clean_files_actual_modification(
     mock_suppressions = {test_file: [(1, "eval-used")]}
     monkeypatch.setattr(
         pylint_cleaner,
-        "_detect_useless_suppressions",
-        lambda: mock_suppressions,
+        "_iter_useless_suppressions",
+        lambda: iter(mock_suppressions.items()),
     )
 
     # Run actual cleaning
@@ -499,6 +681,530 @@ def test_clean_files_actual_modification(
     assert "x = eval('1')" in content
 
 
+def test_clean_files_rewrites_atomically_and_records_timings(
+    pylint_cleaner: PylintCleaner,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test files are replaced via temp files and each rewrite is timed.
+
+    Args:
+        pylint_cleaner: PylintCleaner instance.
+        tmp_path: Temporary project directory.
+        monkeypatch: Pytest monkeypatch fixture.
+
+    """
+    changed = tmp_path / "changed.py"
+    changed.write_text("x = eval('1')  # pylint: disable=eval-used\n")
+    changed.chmod(CLEANED_FILE_MODE)
+    unchanged = tmp_path / "unchanged.py"
+    unchanged.write_text("x = eval('1')  # pylint: disable=eval-used\n")
+    mock_suppressions = {changed: [(1, "eval-used")], unchanged: [(2, "eval-used")]}
+    monkeypatch.setattr(
+        pylint_cleaner,
+        "_iter_useless_suppressions",
+        lambda: iter(mock_suppressions.items()),
+    )
+
+    result = pylint_cleaner.clean_files()
+
+    assert result == {changed: 1}
+    assert changed.read_text() == "x = eval('1')\n"
+    assert changed.stat().st_mode & 0o777 == CLEANED_FILE_MODE
+    assert not [path for path in tmp_path.iterdir() if path.suffix == ".tmp"]
+    assert set(pylint_cleaner.rewrite_timings) == {changed, unchanged}
+    assert all(seconds >= 0 for seconds in pylint_cleaner.rewrite_timings.values())
+
+
+def test_iter_useless_suppressions_lints_only_pragma_files(
+    pylint_cleaner: PylintCleaner,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test pylint only receives files that contain a pylint pragma.
+
+    Args:
+        pylint_cleaner: PylintCleaner instance.
+        tmp_path: Temporary project directory.
+        monkeypatch: Pytest monkeypatch fixture.
+
+    """
+    suppressed = tmp_path / "suppressed.py"
+    suppressed.write_text("x = eval('1')  # pylint: disable=eval-used\n")
+    plain = tmp_path / "plain.py"
+    plain.write_text("x = 1\n")
+    monkeypatch.setattr(
+        pylint_cleaner, "_list_python_files", lambda: [plain, suppressed]
+    )
+
+    commands: list[list[str]] = []
+
+    def fake_popen(cmd: list[str], **kwargs: object) -> FakePopen:
+        assert "shell" not in kwargs
+        commands.append(cmd)
+        return FakePopen(
+            lines=[
+                "suppressed.py:1:0: C0103: Invalid name (invalid-name)\n",
+                (
+                    "suppressed.py:1: [I0021(useless-suppression), ] "
+                    "Useless suppression of 'eval-used'\n"
+                ),
+            ]
+        )
+
+    monkeypatch.setattr(subprocess, "Popen", fake_popen)
+
+    result = dict(pylint_cleaner._iter_useless_suppressions())
+
+    assert len(commands) == 1
+    assert commands[0][-1] == "suppressed.py"
+    assert "plain.py" not in commands[0]
+    assert result == {suppressed: [(1, "eval-used")]}
+
+    # Without any pragmas pylint is not run at all
+    monkeypatch.setattr(pylint_cleaner, "_list_python_files", lambda: [plain])
+    assert not dict(pylint_cleaner._iter_useless_suppressions())
+    assert len(commands) == 1
+
+
+def test_targeted_command_enables_only_referenced_rules(
+    tmp_path: Path, mock_rules: Rules, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test targeted mode enables useless-suppression and the pragma rules only.
+
+    Referenced rules the configuration disables are left disabled.
+
+    Args:
+        tmp_path: Temporary project directory.
+        mock_rules: Mock rules object.
+        monkeypatch: Pytest monkeypatch fixture.
+
+    """
+    enabled = {"C0103", "W0122", "eval-used", "unused-import", "useless-suppression"}
+    monkeypatch.setattr(
+        pylint_cleaner_module, "enabled_messages", lambda **_kwargs: enabled
+    )
+    first = tmp_path / "first.py"
+    first.write_text(
+        LongStr(
+            content="""
+            # pylint: disable=all
+            import os  # pylint: disable=unused-import,C0103  # noqa: F401
+            # pylint: disable-next=eval-used
+            x = eval("1")
+            """
+        )
+    )
+    second = tmp_path / "pkg" / "second.py"
+    second.parent.mkdir()
+    second.write_text("# pylint: enable=W0613\n# pylint: skip-file\n")
+
+    cleaner = PylintCleaner(
+        config_file=tmp_path / "pyproject.toml",
+        dry_run=True,
+        project_root=tmp_path,
+        rules=mock_rules,
+        targeted=True,
+    )
+    cmd = cleaner._pylint_command(files=[first, second])
+
+    assert "--jobs=1" in cmd
+    assert "--disable=all" in cmd
+    assert "--enable=useless-suppression,C0103,eval-used,unused-import" in cmd
+    assert cmd[-2:] == ["first.py", str(Path("pkg") / "second.py")]
+
+    cleaner.targeted = False
+    assert not any(
+        arg.startswith(("--disable", "--enable"))
+        for arg in cleaner._pylint_command(files=[first])
+    )
+
+    # Without the enabled rules the full configuration is used
+    unresolved = PylintCleaner(
+        config_file=tmp_path / "pyproject.toml",
+        dry_run=True,
+        project_root=tmp_path,
+        rules=mock_rules,
+        targeted=True,
+    )
+    monkeypatch.setattr(
+        pylint_cleaner_module, "enabled_messages", lambda **_kwargs: None
+    )
+    assert "--disable=all" not in unresolved._pylint_command(files=[first])
+
+
+def test_targeted_run_cleans_suppression_of_disabled_rule(
+    tmp_path: Path, mock_rules: Rules, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test targeted mode cleans a suppression of a rule the config disables.
+
+    Runs the real pylint, which reports suppressing a disabled message as
+    useless in a full run, so a targeted run has to report it too.
+
+    Args:
+        tmp_path: Temporary project directory.
+        mock_rules: Mock rules object.
+        monkeypatch: Pytest monkeypatch fixture.
+
+    """
+    # The cleaner runs "python -m pylint", so use the interpreter running tests
+    monkeypatch.setenv("PATH", str(Path(sys.executable).parent), prepend=os.pathsep)
+    config_file = tmp_path / "pyproject.toml"
+    config_file.write_text(
+        LongStr(
+            content="""
+            [tool.pylint.messages_control]
+            disable = ["all"]
+            enable = ["invalid-name", "useless-suppression"]
+            """
+        )
+    )
+    module = tmp_path / "module.py"
+    module.write_text('"""Module."""\nimport os  # pylint: disable=unused-import\n')
+
+    for targeted in (False, True):
+        cleaner = PylintCleaner(
+            cache=False,
+            config_file=config_file,
+            dry_run=True,
+            files=[module],
+            project_root=tmp_path,
+            rules=mock_rules,
+            targeted=targeted,
+        )
+        assert dict(cleaner._iter_useless_suppressions()) == {
+            module: [(2, "unused-import")]
+        }
+
+
+def test_make_shards_balances_bytes(tmp_path: Path, mock_rules: Rules) -> None:
+    """Test shards get similar byte totals and keep the original file order.
+
+    Args:
+        tmp_path: Temporary project directory.
+        mock_rules: Mock rules object.
+
+    """
+    sizes = [10, 400, 50, 300, 60, 200, 20]
+    files = []
+    for index, size in enumerate(sizes):
+        path = tmp_path / f"module_{index}.py"
+        path.write_text("#" * size)
+        files.append(path)
+
+    cleaner = PylintCleaner(
+        config_file=tmp_path / "pyproject.toml",
+        dry_run=True,
+        jobs=3,
+        project_root=tmp_path,
+        rules=mock_rules,
+    )
+    shards = cleaner._make_shards(files=files)
+
+    assert len(shards) == cleaner.jobs
+    assert sorted(path for shard in shards for path in shard) == sorted(files)
+    totals = [sum(path.stat().st_size for path in shard) for shard in shards]
+    assert max(totals) - min(totals) <= max(sizes) // 2
+    for shard in shards:
+        assert shard == sorted(shard, key=files.index)
+
+    assert cleaner._make_shards(files=files[:1]) == [files[:1]]
+    assert not cleaner._make_shards(files=[])
+
+
+def test_make_batches_fit_command_line_limit(
+    tmp_path: Path,
+    mock_rules: Rules,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test shards are split so every pylint command fits the OS limit.
+
+    Args:
+        tmp_path: Temporary project directory.
+        mock_rules: Mock rules object.
+        monkeypatch: Pytest monkeypatch fixture.
+
+    """
+    files = [tmp_path / f"module_{index:03d}.py" for index in range(SMALL_FILE_COUNT)]
+    cleaner = PylintCleaner(
+        config_file=tmp_path / "pyproject.toml",
+        dry_run=True,
+        jobs=2,
+        project_root=tmp_path,
+        rules=mock_rules,
+    )
+    options_length = command_length(args=cleaner._pylint_command(files=[]))
+    limit = options_length + COMMAND_LINE_FILE_BUDGET
+    monkeypatch.setattr(pylint_cleaner_module, "command_line_limit", lambda: limit)
+
+    batches = cleaner._make_batches(shards=[files[::2], files[1::2]])
+
+    assert len(batches) > cleaner.jobs
+    assert sorted(path for batch in batches for path in batch) == files
+    for batch in batches:
+        assert command_length(args=cleaner._pylint_command(files=batch)) <= limit
+
+
+def test_timed_out_shard_is_bisected(
+    tmp_path: Path,
+    mock_rules: Rules,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test a timed-out shard is retried in halves and keeps completed results.
+
+    Args:
+        tmp_path: Temporary project directory.
+        mock_rules: Mock rules object.
+        monkeypatch: Pytest monkeypatch fixture.
+
+    """
+    files = []
+    for name in ("a", "b", "slow", "c"):
+        path = tmp_path / f"{name}.py"
+        path.write_text("x = 1  # pylint: disable=invalid-name\n")
+        files.append(path)
+
+    runs: list[list[str]] = []
+
+    def fake_popen(cmd: list[str], **_kwargs: object) -> FakePopen:
+        file_args = [arg for arg in cmd if arg.endswith(".py")]
+        runs.append(file_args)
+        # Pylint hangs on slow.py after reporting the files before it
+        reported = (
+            file_args[: file_args.index("slow.py")]
+            if "slow.py" in file_args
+            else file_args
+        )
+        return FakePopen(
+            hang="slow.py" in file_args,
+            lines=[
+                f"{name}:1: [I0021(useless-suppression), ] "
+                "Useless suppression of 'invalid-name'\n"
+                for name in reported
+            ],
+        )
+
+    monkeypatch.setattr(subprocess, "Popen", fake_popen)
+    monkeypatch.setattr(pylint_cleaner_module, "PYLINT_SHARD_TIMEOUT", SHORT_TIMEOUT)
+
+    cleaner = PylintCleaner(
+        config_file=tmp_path / "pyproject.toml",
+        dry_run=True,
+        jobs=1,
+        project_root=tmp_path,
+        rules=mock_rules,
+    )
+    monkeypatch.setattr(cleaner, "_list_python_files", lambda: files)
+
+    result = dict(cleaner._iter_useless_suppressions())
+
+    # a.py finished before the timeout; b.py may have been partial
+    assert runs == [
+        ["a.py", "b.py", "slow.py", "c.py"],
+        ["b.py"],
+        ["slow.py", "c.py"],
+        ["slow.py"],
+        ["c.py"],
+    ]
+    assert result == {
+        tmp_path / name: [(1, "invalid-name")] for name in ("a.py", "b.py", "c.py")
+    }
+
+
+def test_results_are_yielded_while_pylint_runs(
+    tmp_path: Path,
+    mock_rules: Rules,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test a file's results arrive once pylint moves on, before it exits.
+
+    Args:
+        tmp_path: Temporary project directory.
+        mock_rules: Mock rules object.
+        monkeypatch: Pytest monkeypatch fixture.
+
+    """
+    files = []
+    for name in ("a", "b"):
+        path = tmp_path / f"{name}.py"
+        path.write_text("x = 1  # pylint: disable=invalid-name\n")
+        files.append(path)
+
+    process = FakePopen(
+        hang=True,
+        lines=[
+            "a.py:1:0: C0103: Invalid name (invalid-name)\n",
+            "a.py:1:0: I0021: Useless suppression of 'invalid-name'\n",
+            "b.py:1:0: I0021: Useless suppression of 'invalid-name'\n",
+        ],
+    )
+    monkeypatch.setattr(subprocess, "Popen", lambda *_args, **_kwargs: process)
+
+    cleaner = PylintCleaner(
+        cache=False,
+        config_file=tmp_path / "pyproject.toml",
+        dry_run=True,
+        jobs=1,
+        project_root=tmp_path,
+        rules=mock_rules,
+    )
+    monkeypatch.setattr(cleaner, "_list_python_files", lambda: files)
+
+    results = cleaner._iter_useless_suppressions()
+    assert next(results) == (files[0], [(1, "invalid-name")])
+    assert not process.killed.is_set()
+
+    # Let pylint exit; the last file is complete once the output ends
+    process.kill()
+    assert list(results) == [(files[1], [(1, "invalid-name")])]
+
+
+def test_iter_useless_suppressions_reuses_cached_results(
+    tmp_path: Path,
+    mock_rules: Rules,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test only changed or unreliably linted files are linted again.
+
+    Args:
+        tmp_path: Temporary project directory.
+        mock_rules: Mock rules object.
+        monkeypatch: Pytest monkeypatch fixture.
+
+    """
+    config_file = tmp_path / "pyproject.toml"
+    config_file.write_text('[tool.pylint.messages_control]\ndisable = ["all"]\n')
+    files = []
+    for name in ("a", "b"):
+        path = tmp_path / f"{name}.py"
+        path.write_text("x = 1  # pylint: disable=invalid-name\n")
+        files.append(path)
+
+    runs: list[list[str]] = []
+    returncodes = [0]
+
+    def fake_popen(cmd: list[str], **kwargs: object) -> FakePopen:
+        assert kwargs["cwd"] == tmp_path
+        file_args = [arg for arg in cmd if arg.endswith(".py")]
+        runs.append(file_args)
+        return FakePopen(
+            lines=[
+                f"{name}:1: [I0021(useless-suppression), ] "
+                "Useless suppression of 'invalid-name'\n"
+                for name in file_args
+                if name == "a.py"
+            ],
+            returncode=returncodes[-1],
+        )
+
+    monkeypatch.setattr(subprocess, "Popen", fake_popen)
+
+    def detect(*, cache: bool = True) -> dict[Path, list[tuple[int, str]]]:
+        cleaner = PylintCleaner(
+            cache=cache,
+            config_file=config_file,
+            dry_run=True,
+            jobs=1,
+            project_root=tmp_path,
+            rules=mock_rules,
+        )
+        monkeypatch.setattr(cleaner, "_list_python_files", lambda: files)
+        return dict(cleaner._iter_useless_suppressions())
+
+    expected = {files[0]: [(1, "invalid-name")]}
+    assert detect() == expected
+    assert detect() == expected
+    assert runs == [["a.py", "b.py"]]
+
+    # A changed file misses; a fatal pylint exit leaves it uncached
+    files[1].write_text("y = 2  # pylint: disable=invalid-name\n")
+    returncodes.append(1)
+    assert detect() == expected
+    returncodes.append(0)
+    assert detect() == expected
+    assert runs == [["a.py", "b.py"], ["b.py"], ["b.py"]]
+
+    # A configuration change invalidates every entry
+    config_file.write_text("[tool.pylint.messages_control]\ndisable = []\n")
+    assert detect() == expected
+    assert runs[-1] == ["a.py", "b.py"]
+
+    # The cache is opt-in, so by default every file is linted again
+    run_count = len(runs)
+    assert detect(cache=False) == expected
+    assert runs[run_count:] == [["a.py", "b.py"]]
+
+
+def _git(*args: str, cwd: Path) -> None:
+    """Run a git command for test repository setup.
+
+    Args:
+        *args: Git subcommand and arguments.
+        cwd: Repository directory.
+
+    """
+    identity = ["-c", "user.email=test@example.com", "-c", "user.name=Test"]
+    subprocess.run(  # noqa: S603
+        ["git", *identity, *args],  # noqa: S607
+        capture_output=True,
+        check=True,
+        cwd=cwd,
+    )
+
+
+def test_list_python_files_since_ref_and_explicit_files(
+    tmp_path: Path, mock_rules: Rules
+) -> None:
+    """Test files changed since a ref and explicit files replace the full sweep.
+
+    Args:
+        tmp_path: Temporary project directory.
+        mock_rules: Mock rules object.
+
+    """
+    _git("init", "--quiet", cwd=tmp_path)
+    for name in ("committed.py", "modified.py"):
+        (tmp_path / name).write_text("x = 1\n")
+    _git("add", "--all", cwd=tmp_path)
+    _git("commit", "--quiet", "--message=initial", cwd=tmp_path)
+
+    (tmp_path / "modified.py").write_text("x = 2\n")
+    (tmp_path / "staged.py").write_text("y = 1\n")
+    _git("add", "staged.py", cwd=tmp_path)
+    (tmp_path / "untracked.py").write_text("z = 1\n")
+    (tmp_path / "notes.txt").write_text("not python\n")
+
+    def list_files(
+        *, files: list[Path] | None = None, since: str | None = None
+    ) -> list[str]:
+        cleaner = PylintCleaner(
+            config_file=tmp_path / "pyproject.toml",
+            dry_run=True,
+            files=files,
+            project_root=tmp_path,
+            rules=mock_rules,
+            since=since,
+        )
+        return sorted(path.name for path in cleaner._list_python_files())
+
+    assert list_files() == ["committed.py", "modified.py", "staged.py"]
+    assert list_files(since="HEAD") == ["modified.py", "staged.py"]
+    assert list_files(files=[tmp_path / "notes.txt", tmp_path / "untracked.py"]) == [
+        "untracked.py"
+    ]
+    # Without any Python file, e.g. a commit touching only the configuration
+    assert list_files(files=[tmp_path / "pyproject.toml"]) == list_files()
+    assert list_files(files=[tmp_path / "notes.txt"], since="HEAD") == [
+        "modified.py",
+        "staged.py",
+    ]
+    assert list_files(files=[tmp_path / "modified.py"], since="HEAD") == [
+        "modified.py",
+        "staged.py",
+    ]
+    assert not list_files(since="no-such-ref")
+
+
 def test_integration_real_pylint_execution(
     tmp_path: Path,
     mock_rules: Rules,
@@ -549,13 +1255,17 @@ def test_integration_real_pylint_execution(
     test_file.write_text(test_content)
 
     # Mock the pylint execution to return specific useless suppressions
-    def mock_detect_useless_suppressions() -> dict[Path, list[tuple[int, str]]]:
-        return {
-            test_file: [
-                (3, "invalid-name"),  # Line with valid_function_name
-                (7, "unused-argument"),  # Line with another_function
-            ]
-        }
+    def mock_iter_useless_suppressions() -> Iterator[
+        tuple[Path, list[tuple[int, str]]]
+    ]:
+        return iter(
+            {
+                test_file: [
+                    (3, "invalid-name"),  # Line with valid_function_name
+                    (7, "unused-argument"),  # Line with another_function
+                ]
+            }.items()
+        )
 
     # Create PylintCleaner instance
     cleaner = PylintCleaner(
@@ -567,7 +1277,7 @@ def test_integration_real_pylint_execution(
 
     # Mock the useless suppressions detection
     monkeypatch.setattr(
-        cleaner, "_detect_useless_suppressions", mock_detect_useless_suppressions
+        cleaner, "_iter_useless_suppressions", mock_iter_useless_suppressions
     )
 
     # Run the cleaner
@@ -599,7 +1309,7 @@ def test_real_pylint_output_parsing(
     tmp_path: Path,
     mock_rules: Rules,
 ) -> None:
-    """Test that _parse_pylint_output correctly handles real pylint output.
+    """Test that _read_pylint_output correctly handles real pylint output.
 
     Args:
         tmp_path: Temporary project directory.
@@ -629,7 +1339,7 @@ def test_real_pylint_output_parsing(
     """
     )
 
-    result = cleaner._parse_pylint_output(output=real_output)
+    result = read_pylint_output(cleaner=cleaner, output=real_output)
 
     # Should correctly parse the real format
     assert len(result) == EXPECTED_FILE_COUNT
@@ -651,6 +1361,10 @@ def test_real_pylint_output_parsing(
 
 # Constants for test values
 EXAMPLE_LINE_NUMBER = 10
+SHORT_TIMEOUT = 0.05
+SMALL_FILE_COUNT = 40
+COMMAND_LINE_FILE_BUDGET = 200
+CLEANED_FILE_MODE = 0o640
 EXPECTED_RULE_COUNT = 2
 EXPECTED_FILE_COUNT = 2
 EXPECTED_SUPPRESSION_COUNT = 2
@@ -669,15 +1383,18 @@ def test_is_rule_useless_direct_match(
         pylint_cleaner: PylintCleaner instance.
 
     """
+    useless_ids = pylint_cleaner._useless_rule_ids(useless_rules=["invalid-name"])
+
     # Test direct matches
+    assert pylint_cleaner._is_rule_useless(rule="invalid-name", useless_ids=useless_ids)
     assert pylint_cleaner._is_rule_useless(
-        rule="invalid-name", useless_rules=["invalid-name"]
+        rule="C0103",
+        useless_ids=pylint_cleaner._useless_rule_ids(useless_rules=["C0103"]),
     )
-    assert pylint_cleaner._is_rule_useless(rule="C0103", useless_rules=["C0103"])
 
     # Test no match
     assert not pylint_cleaner._is_rule_useless(
-        rule="valid-name", useless_rules=["invalid-name"]
+        rule="valid-name", useless_ids=useless_ids
     )
 
 
@@ -693,27 +1410,69 @@ def test_is_rule_useless_bidirectional_matching(
         pylint_cleaner: PylintCleaner instance.
 
     """
+
+    def is_useless(rule: str, useless_rules: list[str]) -> bool:
+        useless_ids = pylint_cleaner._useless_rule_ids(useless_rules=useless_rules)
+        return pylint_cleaner._is_rule_useless(rule=rule, useless_ids=useless_ids)
+
     # Test rule code in disable comment, rule name in useless_rules
     # (This is the scenario that was failing in ansible-creator)
-    assert pylint_cleaner._is_rule_useless(rule="E0401", useless_rules=["import-error"])
+    assert is_useless("E0401", ["import-error"])
 
     # Test rule name in disable comment, rule code in useless_rules
-    assert pylint_cleaner._is_rule_useless(rule="import-error", useless_rules=["E0401"])
+    assert is_useless("import-error", ["E0401"])
 
     # Test other examples
-    assert pylint_cleaner._is_rule_useless(rule="C0103", useless_rules=["invalid-name"])
-    assert pylint_cleaner._is_rule_useless(rule="invalid-name", useless_rules=["C0103"])
+    assert is_useless("C0103", ["invalid-name"])
+    assert is_useless("invalid-name", ["C0103"])
 
     # Test mixed list with different formats
-    assert pylint_cleaner._is_rule_useless(
-        rule="E0401", useless_rules=["C0103", "import-error", "unused-argument"]
-    )
+    assert is_useless("E0401", ["C0103", "import-error", "unused-argument"])
 
     # Test no match with bidirectional checking
-    assert not pylint_cleaner._is_rule_useless(
-        rule="E0401", useless_rules=["invalid-name", "unused-argument"]
+    assert not is_useless("E0401", ["invalid-name", "unused-argument"])
+
+
+def test_useless_rules_resolved_once_per_comment(
+    monkeypatch: pytest.MonkeyPatch,
+    pylint_cleaner: PylintCleaner,
+) -> None:
+    """Test each rule is looked up once however many rules a comment lists.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture.
+        pylint_cleaner: PylintCleaner instance.
+
+    """
+    useless_rules = ["import-error", "C0103", "unused-argument"]
+    comment_rules = ["E0401", "invalid-name", "W0613", "line-too-long"]
+    comment = DisableComment(
+        comment_format="inline",
+        file_path=Path("test.py"),
+        line_number=1,
+        original_line=f"x = 1  # pylint: disable={','.join(comment_rules)}",
+        other_tools_content="",
+        pylint_rules=comment_rules,
+    )
+
+    lookups: list[str] = []
+    get_by_identifier = pylint_cleaner.rules.get_by_identifier
+
+    def counting_get_by_identifier(*, identifier: str) -> Rule | None:
+        lookups.append(identifier)
+        return get_by_identifier(identifier=identifier)
+
+    monkeypatch.setattr(
+        pylint_cleaner.rules, "get_by_identifier", counting_get_by_identifier
+    )
+
+    result = pylint_cleaner._remove_useless_rules_from_comment(
+        disable_comment=comment, useless_rules=useless_rules
     )
 
+    assert result == "x = 1  # pylint: disable=line-too-long"
+    assert len(lookups) <= len(useless_rules) + len(comment_rules)
+
 
 def test_remove_useless_rules_bidirectional_matching(
     pylint_cleaner: PylintCleaner,
@@ -814,7 +1573,7 @@ def test_ansible_creator_scenario(
     assert result is None
 
 
-def test_parse_pylint_output_ansible_creator_format(
+def test_read_pylint_output_ansible_creator_format(
     pylint_cleaner: PylintCleaner,
 ) -> None:
     """Test parsing pylint output in the format that ansible-creator produces.
@@ -834,7 +1593,7 @@ def test_parse_pylint_output_ansible_creator_format(
     """
     )
 
-    result = pylint_cleaner._parse_pylint_output(output=pylint_output)
+    result = read_pylint_output(cleaner=pylint_cleaner, output=pylint_output)
 
     # Should correctly parse all files
     expected_file_count = 3
@@ -910,13 +1669,17 @@ def test_full_integration_bidirectional_matching(
     )
 
     # Mock pylint to report useless suppression by rule name
-    def mock_detect_useless_suppressions() -> dict[Path, list[tuple[int, str]]]:
-        return {
-            test_file: [(4, "import-error")]  # Pylint reports by rule name
-        }
+    def mock_iter_useless_suppressions() -> Iterator[
+        tuple[Path, list[tuple[int, str]]]
+    ]:
+        return iter(
+            {
+                test_file: [(4, "import-error")]  # Pylint reports by rule name
+            }.items()
+        )
 
     monkeypatch.setattr(
-        cleaner, "_detect_useless_suppressions", mock_detect_useless_suppressions
+        cleaner, "_iter_useless_suppressions", mock_iter_useless_suppressions
     )
 
     # Run the cleaner
@@ -1019,13 +1782,17 @@ def test_preserve_trailing_newline_when_removing_suppressions(
     )
 
     # Mock pylint to report E0401 as useless (by rule name)
-    def mock_detect_useless_suppressions() -> dict[Path, list[tuple[int, str]]]:
-        return {
-            test_file: [(2, "import-error")]  # Line with E0401 disable
-        }
+    def mock_iter_useless_suppressions() -> Iterator[
+        tuple[Path, list[tuple[int, str]]]
+    ]:
+        return iter(
+            {
+                test_file: [(2, "import-error")]  # Line with E0401 disable
+            }.items()
+        )
 
     monkeypatch.setattr(
-        cleaner, "_detect_useless_suppressions", mock_detect_useless_suppressions
+        cleaner, "_iter_useless_suppressions", mock_iter_useless_suppressions
     )
 
     # Run the cleaner
@@ -1097,13 +1864,17 @@ def test_preserve_no_trailing_newline_when_removing_suppressions(
     )
 
     # Mock pylint to report E0401 as useless (by rule name)
-    def mock_detect_useless_suppressions() -> dict[Path, list[tuple[int, str]]]:
-        return {
-            test_file: [(2, "import-error")]  # Line with E0401 disable
-        }
+    def mock_iter_useless_suppressions() -> Iterator[
+        tuple[Path, list[tuple[int, str]]]
+    ]:
+        return iter(
+            {
+                test_file: [(2, "import-error")]  # Line with E0401 disable
+            }.items()
+        )
 
     monkeypatch.setattr(
-        cleaner, "_detect_useless_suppressions", mock_detect_useless_suppressions
+        cleaner, "_iter_useless_suppressions", mock_iter_useless_suppressions
     )
 
     # Run the cleaner
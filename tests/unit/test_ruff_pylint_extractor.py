@@ -0,0 +1,207 @@
+"""Tests for RuffPylintExtractor using a fake GitHub CLI."""
+
+from __future__ import annotations
+
+import json
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pylint_ruff_sync.constants import RUFF_ISSUE_UPDATED_AT_METADATA
+from pylint_ruff_sync.ruff_pylint_extractor import RuffPylintExtractor
+from pylint_ruff_sync.rule import Rule, Rules, RuleSource
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+ISSUE_BODY = (
+    "- [x] `unused-import` / `W0611` (`F401`)\n- [ ] `invalid-name` / `C0103`\n"
+)
+UPDATED_AT = "2024-05-01T12:00:00Z"
+
+FAKE_GH_SCRIPT = """\
+import json
+import sys
+from pathlib import Path
+
+here = Path(__file__).parent
+with (here / "gh-calls.log").open("a", encoding="utf-8") as log:
+    log.write(" ".join(sys.argv[1:]) + "\\n")
+
+if sys.argv[1:3] == ["auth", "status"]:
+    sys.exit(0)
+
+issue = json.loads((here / "issue.json").read_text(encoding="utf-8"))
+fields = sys.argv[sys.argv.index("--json") + 1].split(",")
+print(json.dumps({field: issue[field] for field in fields}))
+"""
+
+
+class FakeGh:
+    """Handle on a fake gh executable placed first on PATH."""
+
+    def __init__(self, *, bin_dir: Path) -> None:
+        """Initialize the handle.
+
+        Args:
+            bin_dir: Directory containing the fake gh executable.
+
+        """
+        self.bin_dir = bin_dir
+
+    def set_issue(self, *, body: str, updated_at: str) -> None:
+        """Set the issue data the fake gh returns.
+
+        Args:
+            body: Issue body.
+            updated_at: Issue updatedAt timestamp.
+
+        """
+        issue = {"body": body, "updatedAt": updated_at}
+        (self.bin_dir / "issue.json").write_text(json.dumps(issue), encoding="utf-8")
+
+    def issue_requests(self) -> list[str]:
+        """Return the --json fields requested by each 'gh issue view' call.
+
+        Returns:
+            Requested fields, one entry per call.
+
+        """
+        log_path = self.bin_dir / "gh-calls.log"
+        if not log_path.exists():
+            return []
+        return [
+            line.split()[-1]
+            for line in log_path.read_text(encoding="utf-8").splitlines()
+            if line.startswith("issue view")
+        ]
+
+
+@pytest.fixture(name="fake_gh")
+def _fake_gh(*, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> FakeGh:
+    """Put a fake gh executable that serves a local issue first on PATH.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture for mocking.
+        tmp_path: Pytest temporary directory fixture.
+
+    Returns:
+        Handle for configuring and inspecting the fake gh.
+
+    """
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    gh_path = bin_dir / "gh"
+    gh_path.write_text(
+        f"#!{sys.executable}\n{FAKE_GH_SCRIPT}",
+        encoding="utf-8",
+    )
+    gh_path.chmod(0o755)
+    monkeypatch.setenv("PATH", str(bin_dir), prepend=":")
+
+    fake_gh = FakeGh(bin_dir=bin_dir)
+    fake_gh.set_issue(body=ISSUE_BODY, updated_at=UPDATED_AT)
+    return fake_gh
+
+
+def _cached_rules(*, updated_at: str) -> Rules:
+    """Create rules as saved by --update-cache after a fetch.
+
+    Args:
+        updated_at: Issue timestamp recorded in the cache metadata.
+
+    Returns:
+        Merged Rules with the issue timestamp in the metadata.
+
+    """
+    return Rules(
+        metadata={RUFF_ISSUE_UPDATED_AT_METADATA: updated_at},
+        rules=[
+            Rule(
+                is_in_ruff_issue=True,
+                pylint_id="C0103",
+                pylint_name="invalid-name",
+            ),
+            Rule(pylint_id="R0903", pylint_name="too-few-public-methods"),
+            Rule(
+                is_implemented_in_ruff=True,
+                is_in_ruff_issue=True,
+                pylint_id="W0611",
+                pylint_name="unused-import",
+                ruff_rule="F401",
+            ),
+        ],
+    )
+
+
+def test_fetch_records_issue_updated_at(*, fake_gh: FakeGh) -> None:
+    """Test a full fetch parses the body and records updatedAt.
+
+    Args:
+        fake_gh: Fake GitHub CLI handle.
+
+    """
+    rules = Rules()
+    extractor = RuffPylintExtractor(rules=rules)
+    extractor.extract()
+
+    assert fake_gh.issue_requests() == ["body,updatedAt"]
+    assert rules.metadata[RUFF_ISSUE_UPDATED_AT_METADATA] == UPDATED_AT
+
+    ruff_rules = extractor.get_all_ruff_rules()
+    rule = ruff_rules.get_by_id(pylint_id="W0611")
+    assert rule is not None
+    assert rule.is_implemented_in_ruff
+    assert rule.ruff_rule == "F401"
+
+
+def test_fetch_reuses_cache_when_issue_unchanged(
+    *, fake_gh: FakeGh, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the issue body is not parsed when updatedAt matches the cache.
+
+    Args:
+        fake_gh: Fake GitHub CLI handle.
+        monkeypatch: Pytest monkeypatch fixture for mocking.
+
+    """
+    # A body the fetch would fail to parse proves the cached rules were used
+    fake_gh.set_issue(body="no rules here", updated_at=UPDATED_AT)
+    monkeypatch.setattr(
+        RuffPylintExtractor,
+        "_load_cache",
+        lambda _self: _cached_rules(updated_at=UPDATED_AT),
+    )
+
+    ruff_rules = RuffPylintExtractor(rules=Rules()).get_all_ruff_rules()
+
+    assert fake_gh.issue_requests() == ["body,updatedAt"]
+    assert [rule.pylint_id for rule in ruff_rules] == ["C0103", "W0611"]
+    assert all(rule.source == RuleSource.RUFF_ISSUE for rule in ruff_rules)
+    rule = ruff_rules.get_by_name(pylint_name="unused-import")
+    assert rule is not None
+    assert rule.ruff_rule == "F401"
+    assert ruff_rules.metadata[RUFF_ISSUE_UPDATED_AT_METADATA] == UPDATED_AT
+
+
+def test_fetch_downloads_body_when_issue_changed(
+    *, fake_gh: FakeGh, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the issue body is parsed again when updatedAt has moved on.
+
+    Args:
+        fake_gh: Fake GitHub CLI handle.
+        monkeypatch: Pytest monkeypatch fixture for mocking.
+
+    """
+    monkeypatch.setattr(
+        RuffPylintExtractor,
+        "_load_cache",
+        lambda _self: _cached_rules(updated_at="2023-01-01T00:00:00Z"),
+    )
+
+    ruff_rules = RuffPylintExtractor(rules=Rules()).get_all_ruff_rules()
+
+    assert fake_gh.issue_requests() == ["body,updatedAt"]
+    assert ruff_rules.metadata[RUFF_ISSUE_UPDATED_AT_METADATA] == UPDATED_AT
@@ -0,0 +1,152 @@
+"""Unit tests for the Rule and Rules dataclasses."""
+
+from __future__ import annotations
+
+from pylint_ruff_sync.rule import Rule, Rules, RuleSource
+
+
+def _sample_rules() -> Rules:
+    """Create a small Rules collection for lookup tests.
+
+    Returns:
+        Rules object with test data.
+
+    """
+    rules = Rules()
+    rules.add_rule(rule=Rule(pylint_id="W0613", pylint_name="unused-argument"))
+    rules.add_rule(rule=Rule(pylint_id="C0103", pylint_name="invalid-name"))
+    rules.add_rule(rule=Rule(pylint_id="E0401", pylint_name="import-error"))
+    return rules
+
+
+def test_get_by_id_and_name() -> None:
+    """Test identifier lookups after rules are added one at a time."""
+    rules = _sample_rules()
+
+    rule = rules.get_by_id(pylint_id="C0103")
+    assert rule is not None
+    assert rule.pylint_name == "invalid-name"
+
+    rule = rules.get_by_name(pylint_name="import-error")
+    assert rule is not None
+    assert rule.pylint_id == "E0401"
+
+    assert rules.get_by_id(pylint_id="X9999") is None
+    assert rules.get_by_name(pylint_name="no-such-rule") is None
+
+
+def test_get_by_identifier_resolves_id_and_name() -> None:
+    """Test get_by_identifier resolves both codes and names to the same rule."""
+    rules = _sample_rules()
+
+    by_id = rules.get_by_identifier(identifier="W0613")
+    by_name = rules.get_by_identifier(identifier="unused-argument")
+
+    assert by_id is not None
+    assert by_id is by_name
+    assert rules.get_by_identifier(identifier="unknown") is None
+
+
+def test_update_rule_keeps_indexes_in_sync() -> None:
+    """Test update_rule replaces the indexed rule, including renamed rules."""
+    rules = _sample_rules()
+
+    rules.update_rule(
+        updated_rule=Rule(
+            is_implemented_in_ruff=True,
+            pylint_id="C0103",
+            pylint_name="renamed-rule",
+        )
+    )
+
+    rule = rules.get_by_id(pylint_id="C0103")
+    assert rule is not None
+    assert rule.is_implemented_in_ruff
+    assert rules.get_by_name(pylint_name="renamed-rule") is rule
+    assert rules.get_by_name(pylint_name="invalid-name") is None
+    assert len(rules) == len(_sample_rules())
+
+    # Updating an unknown rule adds it
+    rules.update_rule(updated_rule=Rule(pylint_id="R0903", pylint_name="too-few"))
+    assert rules.get_by_identifier(identifier="too-few") is not None
+
+
+def test_from_dict_builds_indexes() -> None:
+    """Test that rules loaded from a dictionary are indexed."""
+    data = _sample_rules().to_dict()
+    rules = Rules.from_dict(data=data)
+
+    rule = rules.get_by_identifier(identifier="import-error")
+    assert rule is not None
+    assert rule.pylint_id == "E0401"
+
+    filtered = rules.filter_by_category(category="C")
+    assert filtered.get_by_name(pylint_name="invalid-name") is not None
+    assert filtered.get_by_name(pylint_name="import-error") is None
+
+
+def test_duplicate_identifiers_return_first_in_order() -> None:
+    """Test duplicate identifiers resolve to the first rule in pylint_id order."""
+    rules = Rules()
+    rules.add_rule(rule=Rule(pylint_id="W0001", pylint_name="shared-name"))
+    rules.add_rule(
+        rule=Rule(
+            pylint_id="C0001",
+            pylint_name="shared-name",
+            source=RuleSource.USER_DISABLE,
+        )
+    )
+    rules.add_rule(rule=Rule(pylint_id="C0001", pylint_name="other-name"))
+
+    by_name = rules.get_by_name(pylint_name="shared-name")
+    assert by_name is not None
+    assert by_name.pylint_id == "C0001"
+
+    by_id = rules.get_by_id(pylint_id="C0001")
+    assert by_id is not None
+    assert by_id.source == RuleSource.USER_DISABLE
+
+
+def test_reindex_after_in_place_rename() -> None:
+    """Test reindex picks up names assigned after a rule was added."""
+    rules = Rules()
+    rule = Rule(pylint_id="E0237")
+    rules.add_rule(rule=rule)
+
+    rule.pylint_name = "assigning-non-slot"
+    rules.reindex()
+
+    assert rules.get_by_name(pylint_name="assigning-non-slot") is rule
+
+
+def test_add_rule_keeps_pylint_id_order() -> None:
+    """Test add_rule inserts rules in pylint_id order after equal IDs."""
+    rules = _sample_rules()
+    duplicate = Rule(pylint_id="C0103", pylint_name="invalid-name-duplicate")
+    rules.add_rule(rule=duplicate)
+
+    ids = [rule.pylint_id for rule in rules]
+    assert ids == sorted(ids)
+    assert rules.rules[1] is duplicate
+    assert rules.get_by_id(pylint_id="C0103") is not duplicate
+
+
+def test_extend_bulk_inserts_and_indexes() -> None:
+    """Test extend adds a large batch in sorted order with working lookups."""
+    count = 5000
+    new_rules = [
+        Rule(pylint_id=f"W{i:05d}", pylint_name=f"rule-{i}")
+        for i in reversed(range(count))
+    ]
+
+    rules = _sample_rules()
+    rules.extend(new_rules=new_rules)
+
+    ids = [rule.pylint_id for rule in rules]
+    assert ids == sorted(ids)
+    assert len(rules) == count + len(_sample_rules())
+    assert rules.get_by_identifier(identifier="rule-1234") is new_rules[-1235]
+    assert rules.get_by_identifier(identifier="C0103") is not None
+
+    rules.extend(new_rules=[])
+    assert len(rules) == count + len(_sample_rules())
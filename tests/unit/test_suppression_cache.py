@@ -0,0 +1,134 @@
+"""Unit tests for the persistent useless-suppression cache."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+from pylint_ruff_sync.suppression_cache import (
+    SuppressionCache,
+    suppression_cache_context,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Entries kept by the small caches used in these tests
+MAX_ENTRIES = 2
+
+
+def _write_modules(*, names: list[str], root: Path) -> list[Path]:
+    """Write one small module per name.
+
+    Args:
+        names: Module names without the .py suffix.
+        root: Directory to write the modules to.
+
+    Returns:
+        Paths of the written modules.
+
+    """
+    paths = []
+    for name in names:
+        path = root / f"{name}.py"
+        path.write_text(f"{name} = 1  # pylint: disable=invalid-name\n")
+        paths.append(path)
+    return paths
+
+
+def test_lookup_hits_after_store_and_save(tmp_path: Path) -> None:
+    """Test stored results are found again by a new cache for the same context.
+
+    Args:
+        tmp_path: Pytest temporary directory fixture.
+
+    """
+    cache_path = tmp_path / "cache" / "suppressions.json"
+    first, second = _write_modules(names=["first", "second"], root=tmp_path)
+
+    cache = SuppressionCache(cache_path=cache_path, context="context")
+    hits, misses = cache.lookup(files=[first, second], root=tmp_path)
+    assert not hits
+    assert misses == [first, second]
+    cache.store(file_path=first, suppressions=[(1, "invalid-name")])
+    cache.store(file_path=second, suppressions=[])
+    cache.save()
+
+    cache = SuppressionCache(cache_path=cache_path, context="context")
+    hits, misses = cache.lookup(files=[first, second], root=tmp_path)
+    assert hits == {first: [(1, "invalid-name")], second: []}
+    assert not misses
+
+    other = SuppressionCache(cache_path=cache_path, context="other")
+    assert other.lookup(files=[first], root=tmp_path) == ({}, [first])
+
+    first.write_text("changed = 1\n")
+    assert cache.lookup(files=[first], root=tmp_path) == ({}, [first])
+
+
+def test_save_evicts_least_recently_used(tmp_path: Path) -> None:
+    """Test the cache keeps only the most recently used entries.
+
+    Args:
+        tmp_path: Pytest temporary directory fixture.
+
+    """
+    cache_path = tmp_path / "suppressions.json"
+    first, second, third = _write_modules(
+        names=["first", "second", "third"], root=tmp_path
+    )
+
+    cache = SuppressionCache(
+        cache_path=cache_path, context="context", max_entries=MAX_ENTRIES
+    )
+    cache.lookup(files=[first, second], root=tmp_path)
+    cache.store(file_path=first, suppressions=[])
+    cache.store(file_path=second, suppressions=[])
+    cache.save()
+
+    # Using the first entry makes the second the least recently used
+    cache = SuppressionCache(
+        cache_path=cache_path, context="context", max_entries=MAX_ENTRIES
+    )
+    cache.lookup(files=[first, third], root=tmp_path)
+    cache.store(file_path=third, suppressions=[])
+    cache.save()
+
+    cache = SuppressionCache(cache_path=cache_path, context="context")
+    hits, misses = cache.lookup(files=[first, second, third], root=tmp_path)
+    assert set(hits) == {first, third}
+    assert misses == [second]
+
+
+def test_unreadable_cache_file_is_ignored(tmp_path: Path) -> None:
+    """Test corrupt or outdated cache files behave like an empty cache.
+
+    Args:
+        tmp_path: Pytest temporary directory fixture.
+
+    """
+    cache_path = tmp_path / "suppressions.json"
+    (module,) = _write_modules(names=["module"], root=tmp_path)
+
+    for content in ("{not json", json.dumps({"entries": [], "version": 0}), "[]"):
+        cache_path.write_text(content)
+        cache = SuppressionCache(cache_path=cache_path, context="context")
+        assert cache.lookup(files=[module], root=tmp_path) == ({}, [module])
+
+
+def test_context_tracks_configuration_and_mode(tmp_path: Path) -> None:
+    """Test the context digest changes with the config file and targeted mode.
+
+    Args:
+        tmp_path: Pytest temporary directory fixture.
+
+    """
+    config_file = tmp_path / "pyproject.toml"
+    config_file.write_text('[tool.pylint.messages_control]\ndisable = ["all"]\n')
+    full = suppression_cache_context(config_file=config_file, targeted=False)
+
+    assert full == suppression_cache_context(config_file=config_file, targeted=False)
+    assert full != suppression_cache_context(config_file=config_file, targeted=True)
+
+    config_file.write_text("[tool.pylint.messages_control]\ndisable = []\n")
+    assert full != suppression_cache_context(config_file=config_file, targeted=False)
@@ -0,0 +1,53 @@
+"""Unit tests for the pylint pragma pre-scan."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pylint_ruff_sync.suppression_scan import (
+    filter_files_with_pragmas,
+    has_pylint_pragma,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_has_pylint_pragma(*, tmp_path: Path) -> None:
+    """Test files are matched on the pragma marker bytes only.
+
+    Args:
+        tmp_path: Pytest temporary directory fixture.
+
+    """
+    with_pragma = tmp_path / "with_pragma.py"
+    with_pragma.write_text("x = 1  # pylint: disable=invalid-name\n")
+    without_pragma = tmp_path / "without_pragma.py"
+    without_pragma.write_text("# Pylint is mentioned, but not as a pragma\n")
+    empty = tmp_path / "empty.py"
+    empty.write_text("")
+
+    assert has_pylint_pragma(path=with_pragma)
+    assert not has_pylint_pragma(path=without_pragma)
+    assert not has_pylint_pragma(path=empty)
+    assert not has_pylint_pragma(path=tmp_path / "missing.py")
+
+
+def test_filter_files_with_pragmas_keeps_order(*, tmp_path: Path) -> None:
+    """Test the threaded scan returns matching files in input order.
+
+    Args:
+        tmp_path: Pytest temporary directory fixture.
+
+    """
+    files = []
+    for index in range(20):
+        path = tmp_path / f"module_{index}.py"
+        pragma = "  # pylint: disable=unused-import" if not index % 3 else ""
+        path.write_text(f"import os{pragma}\n" + "x = 1\n" * 1000)
+        files.append(path)
+
+    candidates = filter_files_with_pragmas(files=files, max_workers=4)
+
+    assert candidates == files[::3]
+    assert not filter_files_with_pragmas(files=[])
@@ -12,16 +12,16 @@ from typing import TYPE_CHECKING
 
 import pytest
 
+from pylint_ruff_sync import toml_file as toml_file_module
 from pylint_ruff_sync.toml_file import (
     MAX_LINE_LENGTH,
     SimpleArrayWithComments,
     TomlFile,
+    apply_toml_sort_library,
 )
 from tests.constants import TOML_SORT_MIN_ARGS
 
 if TYPE_CHECKING:
-    import pytest
-
     from tests.conftest import TomlSortMockProtocol
 
 
@@ -714,7 +714,7 @@ disable = ["rule-b", "rule-a"]
     temp_file = tmp_path / "test.toml"
     temp_file.write_text(toml_content)
 
-    toml_file = TomlFile(file_path=temp_file)
+    toml_file = TomlFile(file_path=temp_file, toml_sort_backend="subprocess")
 
     # Update an array - this should trigger automatic sorting
     toml_file.update_section_array(
@@ -748,3 +748,248 @@ disable = ["rule-b", "rule-a"]
     parsed = toml_file.as_dict()
     assert "rule-c" in parsed["tool"]["pylint"]["messages_control"]["disable"]
     assert "rule-a" in parsed["tool"]["pylint"]["messages_control"]["disable"]
+
+
+def test_unchanged_content_runs_no_toml_sort(
+    *, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that re-applying existing values neither sorts nor writes.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture for mocking.
+        tmp_path: Temporary path for the test file.
+
+    """
+    temp_file = tmp_path / "test.toml"
+    temp_file.write_text('[tool.test]\nitems = ["a", "b"]\n', encoding="utf-8")
+    mtime_ns = temp_file.stat().st_mtime_ns
+
+    sort_calls: list[str] = []
+    original_sort = toml_file_module.apply_toml_sort_library
+
+    def counting_sort(*, content: str, working_directory: Path) -> str:
+        sort_calls.append(content)
+        return original_sort(content=content, working_directory=working_directory)
+
+    toml_file = TomlFile(file_path=temp_file)
+    monkeypatch.setattr(toml_file_module, "apply_toml_sort_library", counting_sort)
+
+    toml_file.update_section_array(
+        array_data=["a", "b"], key="items", section_path="tool.test"
+    )
+    toml_file.write()
+
+    assert not sort_calls
+    assert not toml_file.is_dirty
+    assert temp_file.stat().st_mtime_ns == mtime_ns
+
+
+def test_sort_results_are_memoized(
+    *, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that content is sorted once and write reuses the sorted result.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture for mocking.
+        tmp_path: Temporary path for the test file.
+
+    """
+    temp_file = tmp_path / "test.toml"
+    temp_file.write_text('[tool.test]\nitems = ["a"]\n', encoding="utf-8")
+
+    sort_calls: list[str] = []
+    original_sort = toml_file_module.apply_toml_sort_library
+
+    def counting_sort(*, content: str, working_directory: Path) -> str:
+        sort_calls.append(content)
+        return original_sort(content=content, working_directory=working_directory)
+
+    toml_file = TomlFile(file_path=temp_file)
+    monkeypatch.setattr(toml_file_module, "apply_toml_sort_library", counting_sort)
+
+    for items in (["a", "b"], ["a"], ["a", "b"]):
+        toml_file.update_section_array(
+            array_data=items, key="items", section_path="tool.test"
+        )
+    dirty_before_write = toml_file.is_dirty
+
+    toml_file.write()
+
+    assert dirty_before_write
+    assert not toml_file.is_dirty
+    assert sort_calls
+    assert len(sort_calls) == len({*sort_calls})
+    assert temp_file.read_text(encoding="utf-8") == toml_file.as_str()
+
+
+def test_library_backend_honours_tomlsort_configuration(*, tmp_path: Path) -> None:
+    """Test the in-process sort reads [tool.tomlsort] next to the file.
+
+    Args:
+        tmp_path: Temporary path for the test file.
+
+    """
+    content = '[tool.test]\nzebra = 1\nApple = 2\n[tool.a]\nkey = "value"\n'
+
+    # Without configuration toml-sort sorts tables but not keys within them
+    result = apply_toml_sort_library(content=content, working_directory=tmp_path)
+    assert result.index("[tool.a]") < result.index("[tool.test]")
+    assert result.index("zebra") < result.index("Apple")
+
+    (tmp_path / "pyproject.toml").write_text(
+        "[tool.tomlsort]\nsort_table_keys = true\n", encoding="utf-8"
+    )
+    result = apply_toml_sort_library(content=content, working_directory=tmp_path)
+    # Keys are sorted case-insensitively, as with 'toml-sort --ignore-case'
+    assert result.index("Apple") < result.index("zebra")
+
+
+def test_library_backend_rejects_invalid_configuration(*, tmp_path: Path) -> None:
+    """Test an invalid [tool.tomlsort] section raises ValueError.
+
+    Args:
+        tmp_path: Temporary path for the test file.
+
+    """
+    (tmp_path / "pyproject.toml").write_text(
+        '[tool.tomlsort]\nsort_table_keys = "yes"\n', encoding="utf-8"
+    )
+    with pytest.raises(ValueError, match=r"tool\.tomlsort"):
+        apply_toml_sort_library(content="[a]\nb = 1\n", working_directory=tmp_path)
+
+
+def test_subprocess_backend_is_opt_in(
+    *, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test toml-sort only runs as a subprocess when that backend is chosen.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture for mocking.
+        tmp_path: Temporary path for the test file.
+
+    """
+    temp_file = tmp_path / "test.toml"
+    temp_file.write_text('[tool.test]\nitems = ["a"]\n', encoding="utf-8")
+
+    subprocess_calls: list[str] = []
+
+    def recording_sort(*, content: str, working_directory: Path) -> str:
+        del working_directory
+        subprocess_calls.append(content)
+        return content
+
+    monkeypatch.setattr(toml_file_module, "apply_toml_sort_subprocess", recording_sort)
+
+    for backend in ("library", "subprocess"):
+        toml_file = TomlFile(file_path=temp_file, toml_sort_backend=backend)
+        toml_file.update_section_array(
+            array_data=["b"], key="items", section_path="tool.test"
+        )
+        assert toml_file.as_dict()["tool"]["test"]["items"] == ["b"]
+
+    assert len(subprocess_calls) == 1
+
+    with pytest.raises(ValueError, match="Unknown toml-sort backend"):
+        TomlFile(file_path=temp_file, toml_sort_backend="rust")
+
+
+def test_batch_sorts_once_at_commit(
+    *, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that updates inside batch() are sorted together when it exits.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture for mocking.
+        tmp_path: Temporary path for the test file.
+
+    """
+    temp_file = tmp_path / "test.toml"
+    temp_file.write_text('[tool.test]\nitems = ["a"]\n', encoding="utf-8")
+
+    sort_calls: list[str] = []
+    original_sort = toml_file_module.apply_toml_sort_library
+
+    def counting_sort(*, content: str, working_directory: Path) -> str:
+        sort_calls.append(content)
+        return original_sort(content=content, working_directory=working_directory)
+
+    monkeypatch.setattr(toml_file_module, "apply_toml_sort_library", counting_sort)
+
+    toml_file = TomlFile(file_path=temp_file)
+    with toml_file.batch():
+        toml_file.update_section_array(
+            array_data=["b"], key="items", section_path="tool.test"
+        )
+        toml_file.update_section_array(
+            array_data=["c"], key="other", section_path="tool.test"
+        )
+        toml_file.update_section_array(
+            array_data=["d"], key="extra", section_path="tool.new"
+        )
+        # Reads inside the batch see the committed content
+        assert toml_file.as_dict()["tool"]["test"]["items"] == ["a"]
+        assert not sort_calls
+
+    assert len(sort_calls) == 1
+    assert toml_file.is_dirty
+    assert toml_file.as_dict()["tool"] == {
+        "new": {"extra": ["d"]},
+        "test": {"items": ["b"], "other": ["c"]},
+    }
+
+
+def test_batch_rolls_back_on_error(*, tmp_path: Path) -> None:
+    """Test that a failing batch leaves the content unchanged.
+
+    Args:
+        tmp_path: Temporary path for the test file.
+
+    """
+    temp_file = tmp_path / "test.toml"
+    original = '[tool.test]\nitems = ["a"]\n'
+    temp_file.write_text(original, encoding="utf-8")
+
+    toml_file = TomlFile(file_path=temp_file)
+
+    def abort_batch() -> None:
+        """Update a key inside a batch, then fail before it commits.
+
+        Raises:
+            RuntimeError: Always, to abort the batch.
+
+        """
+        with toml_file.batch():
+            toml_file.update_section_array(
+                array_data=["b"], key="items", section_path="tool.test"
+            )
+            msg = "abort"
+            raise RuntimeError(msg)
+
+    with pytest.raises(RuntimeError, match="abort"):
+        abort_batch()
+
+    assert toml_file.as_str() == original
+    assert not toml_file.is_dirty
+
+
+def test_simple_array_from_toml_ignores_layout() -> None:
+    """Test parsed arrays compare by items and comments, not formatting."""
+    array = SimpleArrayWithComments(
+        comments={"C0103": "invalid-name"}, items=["C0103", "W0611"]
+    )
+
+    reformatted = SimpleArrayWithComments.from_toml(
+        text='[\n    "C0103",  # invalid-name\n    "W0611",\n]'
+    )
+    assert reformatted is not None
+    assert reformatted.same_content(other=array)
+
+    round_trip = SimpleArrayWithComments.from_toml(text=array.format_as_toml())
+    assert round_trip is not None
+    assert round_trip.same_content(other=array)
+
+    uncommented = SimpleArrayWithComments.from_toml(text='["C0103", "W0611",]')
+    assert uncommented is not None
+    assert not uncommented.same_content(other=array)
+    assert SimpleArrayWithComments.from_toml(text="[1, 2]") is None
+    assert SimpleArrayWithComments.from_toml(text='"C0103"') is None
@@ -0,0 +1,78 @@
+"""Unit tests for the cached read-only view of TomlFile content."""
+
+from __future__ import annotations
+
+import tomllib
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from pylint_ruff_sync.toml_file import TomlFile
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# One parse for the loaded content and one after the content changes
+EXPECTED_PARSES = 2
+
+
+def test_as_mapping_parses_once_per_change(
+    *, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test the parsed mapping is reused until the content changes.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture for mocking.
+        tmp_path: Temporary path for the test file.
+
+    """
+    temp_file = tmp_path / "test.toml"
+    temp_file.write_text('[tool.test]\nitems = ["a"]\n', encoding="utf-8")
+
+    parse_calls: list[str] = []
+    original_loads = tomllib.loads
+
+    def counting_loads(content: str) -> dict[str, Any]:
+        parse_calls.append(content)
+        return original_loads(content)
+
+    toml_file = TomlFile(file_path=temp_file)
+    monkeypatch.setattr(tomllib, "loads", counting_loads)
+
+    first = toml_file.as_mapping()
+    assert toml_file.as_mapping() is first
+    assert toml_file.as_dict() == {"tool": {"test": {"items": ["a"]}}}
+    assert len(parse_calls) == 1
+
+    # Rewriting the same value leaves the content, and the parse, unchanged
+    toml_file.update_section_array(
+        array_data=["a"], key="items", section_path="tool.test"
+    )
+    assert toml_file.as_mapping() is first
+
+    toml_file.update_section_array(
+        array_data=["b"], key="items", section_path="tool.test"
+    )
+    assert toml_file.as_mapping()["tool"]["test"]["items"] == ("b",)
+    assert len(parse_calls) == EXPECTED_PARSES
+
+
+def test_as_mapping_is_read_only(*, tmp_path: Path) -> None:
+    """Test the shared mapping cannot be modified and as_dict returns a copy.
+
+    Args:
+        tmp_path: Temporary path for the test file.
+
+    """
+    temp_file = tmp_path / "test.toml"
+    temp_file.write_text('[tool.test]\nitems = ["a"]\n', encoding="utf-8")
+    toml_file = TomlFile(file_path=temp_file)
+
+    mapping = toml_file.as_mapping()
+    with pytest.raises(TypeError):
+        mapping["tool"]["test"]["items"] = ["b"]
+
+    copy = toml_file.as_dict()
+    copy["tool"]["test"]["items"].append("b")
+    assert toml_file.as_dict()["tool"]["test"]["items"] == ["a"]
+    assert mapping["tool"]["test"]["items"] == ("a",)
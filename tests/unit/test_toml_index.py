@@ -0,0 +1,130 @@
+"""Unit tests for the single-pass TOML section and key indexer."""
+
+from __future__ import annotations
+
+import tomllib
+
+from pylint_ruff_sync.toml_index import TomlIndex
+from pylint_ruff_sync.toml_regex import TOML_REGEX
+
+SECTION_COUNT = 850
+
+TRICKY_TOML = '''\
+title = "root"
+
+[tool.pylint.messages_control]
+# Pylint configuration
+disable = [
+  "all", # brackets in comments ] are ignored
+  "C0103", # https://example.com/?q=[x]
+]
+enable = ["W0611"] # trailing comment
+notes = """
+[not.a.section]
+still = "inside the string"
+"""
+
+[[tool.runs]]
+name = "first"
+
+[ tool . "quoted.part" ]
+value = "a \\"] quote" # comment
+
+[tool.after]
+key = 1
+'''
+
+
+def test_index_records_tables_and_keys() -> None:
+    """Test tables and keys are found, including around strings and comments."""
+    index = TomlIndex(content=TRICKY_TOML)
+
+    assert set(index.sections) == {
+        "",
+        "tool.pylint.messages_control",
+        'tool."quoted.part"',
+        "tool.after",
+    }
+    assert index.find_key(key="title", section_path="") is not None
+    assert index.find_key(key="still", section_path="not.a.section") is None
+    assert index.find_key(key="name", section_path="tool.runs") is None
+
+    span = index.find_key(key="disable", section_path="tool.pylint.messages_control")
+    assert span is not None
+    value = TRICKY_TOML[span.value_start : span.value_end]
+    assert value.startswith("[\n")
+    assert value.endswith("https://example.com/?q=[x]\n]")
+
+    span = index.find_key(key="enable", section_path="tool.pylint.messages_control")
+    assert span is not None
+    assert TRICKY_TOML[span.value_start : span.value_end] == '["W0611"]'
+
+    span = index.find_key(key="value", section_path='tool."quoted.part"')
+    assert span is not None
+    assert TRICKY_TOML[span.value_start : span.value_end] == '"a \\"] quote"'
+
+
+def test_replace_splices_multiline_value() -> None:
+    """Test replacing a multiline array keeps surrounding text intact."""
+    result = TOML_REGEX.replace_key_in_section(
+        content=TRICKY_TOML,
+        key="disable",
+        new_value='["all"]',
+        section_path="tool.pylint.messages_control",
+    )
+
+    assert 'disable = ["all"]\nenable = ["W0611"] # trailing comment\n' in result
+    assert "# Pylint configuration\n" in result
+    parsed = tomllib.loads(result)
+    assert parsed["tool"]["pylint"]["messages_control"]["disable"] == ["all"]
+    assert parsed["tool"]["after"] == {"key": 1}
+
+
+def test_replace_keeps_trailing_comment() -> None:
+    """Test only the value is replaced, not the comment after it."""
+    result = TOML_REGEX.replace_key_in_section(
+        content=TRICKY_TOML,
+        key="enable",
+        new_value="[]",
+        section_path="tool.pylint.messages_control",
+    )
+
+    assert "enable = [] # trailing comment\n" in result
+
+
+def test_add_key_keeps_blank_line_before_next_table() -> None:
+    """Test a new key goes after the table's last line, not after blank lines."""
+    content = "[tool.a]\nx = 1\n\n[tool.b]\ny = 2"
+
+    result = TOML_REGEX.add_key_to_section(
+        content=content, key="z", section_path="tool.a", value="3"
+    )
+    assert result == "[tool.a]\nx = 1\nz = 3\n\n[tool.b]\ny = 2"
+
+    result = TOML_REGEX.add_key_to_section(
+        content=content, key="z", section_path="tool.b", value="3"
+    )
+    assert result == "[tool.a]\nx = 1\n\n[tool.b]\ny = 2\nz = 3\n"
+
+
+def test_index_large_document() -> None:
+    """Test indexing and editing a 5,000-line document with many tables."""
+    content = "".join(
+        f'[section.s{i}]\nkey = "value"\narray = [\n  "a", # [comment]\n]\n\n'
+        for i in range(SECTION_COUNT)
+    )
+    content += '[tool.pylint.messages_control]\ndisable = ["old"]\n'
+
+    index = TomlIndex(content=content)
+    # The generated tables, the pylint table and the root table
+    assert len(index.sections) == SECTION_COUNT + 2
+
+    result = TOML_REGEX.add_key_to_section(
+        content=content,
+        key="disable",
+        section_path="tool.pylint.messages_control",
+        value='["new"]',
+    )
+    assert tomllib.loads(result)["tool"]["pylint"]["messages_control"] == {
+        "disable": ["new"]
+    }